@@ -0,0 +1,123 @@
+import os
+import time
+import atexit
+import queue
+import logging
+import threading
+from abc import ABC, abstractmethod
+
+
+class BackgroundWriter(ABC):
+    """Queue-fed writer thread shared by the session storage backends.
+
+    Producers call ``submit`` from any thread. The writer thread collects
+    everything queued so far into a batch, passes it to ``write_batch`` and
+    calls ``flush`` once ``flush_rows`` items are pending or ``flush_interval``
+    seconds have passed. ``sync`` is called every ``fsync_interval`` seconds
+    (``None`` disables it). ``stop_writer`` drains the queue before returning.
+    Subclasses implement ``write_batch`` and may override ``flush`` and ``sync``.
+    """
+
+    _STOP = object()
+
+    def __init__(self, name, flush_interval, flush_rows, fsync_interval, logger_name=None):
+        self.logger = logging.getLogger(logger_name or f'HORUS_CSS.{name}')
+        self.writer_name = name
+        self.flush_interval = flush_interval
+        self.flush_rows = flush_rows
+        self.fsync_interval = fsync_interval
+        self.queue = queue.Queue()
+        self.rows_written = 0
+        self.thread = None
+        self.exit_registered = False
+
+    def start_writer(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.thread = threading.Thread(target=self._run_writer,
+                                       name=self.writer_name, daemon=True)
+        self.thread.start()
+        if not self.exit_registered:
+            # __del__ is not guaranteed to run, make sure queued rows reach the disk
+            atexit.register(self.close_file)
+            self.exit_registered = True
+
+    def stop_writer(self):
+        if self.thread and self.thread.is_alive():
+            self.queue.put(self._STOP)
+            self.thread.join()
+        self.thread = None
+
+    def submit(self, item):
+        self.queue.put(item)
+
+    @property
+    def backlog(self):
+        return self.queue.qsize()
+
+    @abstractmethod
+    def write_batch(self, items):
+        """Write ``items`` (as passed to ``submit``) on the writer thread."""
+
+    def close_file(self):
+        self.stop_writer()
+
+    def flush(self):
+        pass
+
+    def sync(self):
+        pass
+
+    @staticmethod
+    def fsync_file(file):
+        file.flush()
+        os.fsync(file.fileno())
+
+    def _run_writer(self):
+        last_flush = last_fsync = time.monotonic()
+        pending = 0
+        unsynced = False
+        stop = False
+
+        while not stop:
+            deadlines = []
+            if pending:
+                deadlines.append(last_flush + self.flush_interval)
+            if unsynced and self.fsync_interval is not None:
+                deadlines.append(last_fsync + self.fsync_interval)
+            timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            try:
+                batch = [self.queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if self._STOP in batch:
+                stop = True
+                batch = [item for item in batch if item is not self._STOP]
+
+            try:
+                if batch:
+                    self.write_batch(batch)
+                    pending += len(batch)
+                    unsynced = True
+                    self.rows_written += len(batch)
+
+                now = time.monotonic()
+                if pending and (stop or pending >= self.flush_rows
+                                or now - last_flush >= self.flush_interval):
+                    self.flush()
+                    pending = 0
+                    last_flush = now
+
+                if unsynced and not pending and self.fsync_interval is not None and (
+                        stop or now - last_fsync >= self.fsync_interval):
+                    self.sync()
+                    unsynced = False
+                    last_fsync = now
+            except Exception as e:
+                self.logger.error(f"Error in {self.writer_name}: {e}")
@@ -0,0 +1,188 @@
+import os
+import csv
+import json
+import time
+from datetime import datetime
+
+import numpy as np
+
+from core.config import Config
+from core.background_writer import BackgroundWriter
+
+
+class ColumnStore(BackgroundWriter):
+    """Append-only columnar telemetry store.
+
+    Every column is a raw little-endian file ``<name>.bin`` of a fixed dtype,
+    described by ``schema.json`` in the same directory. The files can be
+    opened with ``numpy.memmap`` (see ``ColumnStoreReader``) without parsing.
+    """
+
+    FORMAT = 'horus-columns'
+    VERSION = 1
+    SCHEMA_FILE = 'schema.json'
+
+    def __init__(self, directory, columns=None, dtype='<f8',
+                 flush_interval=Config.CSV_FLUSH_INTERVAL,
+                 flush_rows=Config.CSV_FLUSH_ROWS,
+                 fsync_interval=Config.CSV_FSYNC_INTERVAL):
+        super().__init__('ColumnStoreWriter', flush_interval, flush_rows, fsync_interval,
+                         logger_name='HORUS_CSS.column_store')
+        self.directory = directory
+        self.columns = list(columns or Config.TELEMETRY_HEADER)
+        self.dtype = np.dtype(dtype)
+        self.files = {}
+        self.create_store()
+
+    def create_store(self):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self.write_schema()
+            for name in self.columns:
+                self.files[name] = open(os.path.join(self.directory, f"{name}.bin"), 'ab')
+            self.logger.info(f"Created column store: {self.directory}")
+            self.start_writer()
+        except Exception as e:
+            self.logger.error(f"Failed to create column store: {e}")
+
+    def write_schema(self):
+        schema = {
+            'format': self.FORMAT,
+            'version': self.VERSION,
+            'created': datetime.now().isoformat(),
+            'columns': [{'name': name, 'dtype': self.dtype.str} for name in self.columns],
+        }
+        with open(os.path.join(self.directory, self.SCHEMA_FILE), 'w', encoding='utf-8') as f:
+            json.dump(schema, f, indent=2)
+
+    def add_columns(self, names):
+        """Append ``names`` to the open store, NaN for the rows written so far.
+
+        Rows queued before the call are written with the old columns first,
+        rows submitted afterwards need a value for every column."""
+        if not self.files:
+            self.logger.error("Column store not initialized")
+            return
+        self.stop_writer()
+        self.flush()
+        length = os.path.getsize(os.path.join(self.directory, f"{self.columns[0]}.bin")) // self.dtype.itemsize
+        for name in names:
+            path = os.path.join(self.directory, f"{name}.bin")
+            np.full(length, np.nan, dtype=self.dtype).tofile(path)
+            self.files[name] = open(path, 'ab')
+        self.columns += list(names)
+        self.write_schema()
+        self.start_writer()
+
+    def write_row(self, data_dict):
+        if not self.files:
+            self.logger.error("Column store not initialized")
+            return
+        self.submit((time.time(),
+                     [data_dict.get(key) for key in self.columns[1:]]))
+
+    def write_values(self, timestamp, values):
+        """Append a row with its own timestamp, ``values`` in the order of ``columns[1:]``."""
+        if not self.files:
+            self.logger.error("Column store not initialized")
+            return
+        self.submit((timestamp, values))
+
+    @staticmethod
+    def _to_number(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def write_batch(self, items):
+        table = np.empty((len(items), len(self.columns)), dtype=self.dtype)
+        for row, (timestamp, values) in enumerate(items):
+            table[row, 0] = timestamp
+            table[row, 1:] = [self._to_number(value) for value in values]
+        for index, name in enumerate(self.columns):
+            self.files[name].write(np.ascontiguousarray(table[:, index]).tobytes())
+
+    def flush(self):
+        for file in self.files.values():
+            file.flush()
+
+    def sync(self):
+        for file in self.files.values():
+            self.fsync_file(file)
+
+    def close_file(self):
+        self.stop_writer()
+        for file in self.files.values():
+            try:
+                file.close()
+            except Exception as e:
+                self.logger.error(f"Error closing column file: {e}")
+        if self.files:
+            self.logger.info("Column store closed")
+        self.files = {}
+
+    def __del__(self):
+        self.close_file()
+
+
+class ColumnStoreReader:
+    """Read-only, memory-mapped view of a ``ColumnStore`` directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, ColumnStore.SCHEMA_FILE), encoding='utf-8') as f:
+            self.schema = json.load(f)
+        if self.schema.get('format') != ColumnStore.FORMAT:
+            raise ValueError(f"Not a column store: {directory}")
+
+        self.columns = {}
+        lengths = []
+        for column in self.schema['columns']:
+            path = os.path.join(directory, f"{column['name']}.bin")
+            dtype = np.dtype(column['dtype'])
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            lengths.append(size // dtype.itemsize)
+            self.columns[column['name']] = (path, dtype)
+
+        # A torn write after a power loss can leave columns of unequal length
+        self.length = min(lengths) if lengths else 0
+        self.arrays = {}
+        for name, (path, dtype) in self.columns.items():
+            if self.length:
+                self.arrays[name] = np.memmap(path, dtype=dtype, mode='r', shape=(self.length,))
+            else:
+                self.arrays[name] = np.empty(0, dtype=dtype)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    @property
+    def names(self):
+        return list(self.arrays.keys())
+
+    def time_range(self, start, end):
+        timestamps = self.arrays['timestamp']
+        first = int(np.searchsorted(timestamps, start, side='left'))
+        last = int(np.searchsorted(timestamps, end, side='right'))
+        return first, last
+
+    def slice_by_time(self, start, end):
+        first, last = self.time_range(start, end)
+        return {name: array[first:last] for name, array in self.arrays.items()}
+
+    def export_csv(self, filename):
+        names = self.names
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(names)
+            chunk = 100000
+            for start in range(0, self.length, chunk):
+                block = [self.arrays[name][start:start + chunk] for name in names]
+                for row in zip(*block):
+                    values = [datetime.fromtimestamp(row[0]).isoformat()]
+                    values += ['' if np.isnan(value) else repr(float(value)) for value in row[1:]]
+                    writer.writerow(values)
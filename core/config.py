@@ -3,4 +3,46 @@ class Config:
     DEFAULT_GPIO_PIN = 14
     DEFAULT_BAUD_RATE = 9600
     DEFAULT_IP_ADDRESS = "0.0.0.0"  # Old value "192.168.236.1"
-    DEFAULT_IP_PORT = 5000
\ No newline at end of file
+    DEFAULT_IP_PORT = 5000
+
+    CSV_FLUSH_INTERVAL = 0.2    # s, maximum time a written row waits in the buffer
+    CSV_FLUSH_ROWS = 200        # flush earlier once this many rows are pending
+    CSV_FSYNC_INTERVAL = 5.0    # s, None disables fsync
+    CSV_INDEX_INTERVAL = 100    # rows between entries of the telemetry_data.csv.idx time index
+
+    TELEMETRY_HEADER = ['timestamp', 'velocity', 'pitch',
+                        'roll', 'status',
+                        'altitude', 'latitude', 'longitude',
+                        'len', 'rssi', 'snr']
+
+    COLUMN_STORE_DIRECTORY = 'telemetry_columns'
+    SESSION_DATABASE_FILE = 'session.sqlite'
+
+    JOURNAL_FILE = 'telemetry.journal'
+    JOURNAL_COMMIT_INTERVAL = 0.5   # s, upper bound of telemetry lost on power failure
+
+    LOG_LEVEL = 'DEBUG'
+    LOG_ROTATE_BYTES = 20 * 1024 ** 2       # rotate app_events.log after 20 MB
+    CSV_ROTATE_BYTES = 50 * 1024 ** 2       # rotate telemetry_data.csv after 50 MB
+    ROTATE_INTERVAL = 3600                  # s, also rotate both files hourly, None disables
+    RETENTION_MAX_SESSIONS = 100            # keep at most this many sessions
+    RETENTION_MAX_BYTES = 8 * 1024 ** 3     # and at most 8 GB of session data
+    MAINTENANCE_INTERVAL = 600              # s, how often retention is re-checked
+
+    PLOT_HISTORY_LENGTH = 10000     # entries kept per level of the live plot history
+    PLOT_PYRAMID_FACTOR = 4         # samples merged into one min/max bucket per level
+    PLOT_PYRAMID_LEVELS = 7         # the coarsest level spans 10000 * 4 ** 6 samples
+    PLOT_TARGET_FPS = 30            # live plots are redrawn at most this often
+    PLOT_MIN_FPS = 5                # lower bound of the adaptive frame rate under load
+    PLOT_ARCHIVE_DIRECTORY = 'plot_history'     # full-flight plot history in the session directory
+    PLOT_ARCHIVE_BUCKET = 256       # raw samples per min/max entry of the archived summary
+
+    STATISTICS_WINDOWS = (10, 60)               # s, sliding windows of the telemetry statistics
+    STATISTICS_QUANTILES = (0.05, 0.5, 0.95)    # estimated over the whole session
+
+    TERMINAL_MAX_LINES = 5000       # lines kept by the terminal view, older ones are dropped
+    TERMINAL_REPEAT_INTERVAL = 1.0  # s, repeats of a message within it update its line instead
+
+    PERFORMANCE_HUD_INTERVAL = 0.5      # s, refresh period of the performance panel in the status bar
+    PERFORMANCE_BACKLOG_WARNING = 100   # queued records at which the panel warns that the station lags
+    LATENCY_FILE = 'latency_histograms.json'    # per-stage pipeline latencies, saved when the session ends
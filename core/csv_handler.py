@@ -1,60 +1,169 @@
 # csv_handler.py
+import io
 import os
+import re
 import csv
-import logging
+import time
+import struct
 from datetime import datetime
 from core.utils import Utils
+from core.config import Config
+from core.background_writer import BackgroundWriter
 
 
-class CsvHandler:
-    def __init__(self):
-        self.logger = logging.getLogger(
-            'HORUS_CSS.csv_handler')
+class CsvHandler(BackgroundWriter):
+    # Sparse time index written next to every CSV segment (``<segment>.idx``):
+    # one (POSIX timestamp, byte offset of the row) record every ``index_interval`` rows.
+    INDEX_RECORD = struct.Struct('<dQ')
+
+    def __init__(self, flush_interval=Config.CSV_FLUSH_INTERVAL,
+                 flush_rows=Config.CSV_FLUSH_ROWS,
+                 fsync_interval=Config.CSV_FSYNC_INTERVAL,
+                 rotate_bytes=Config.CSV_ROTATE_BYTES,
+                 rotate_interval=Config.ROTATE_INTERVAL,
+                 index_interval=Config.CSV_INDEX_INTERVAL):
+        super().__init__('CsvWriter', flush_interval, flush_rows, fsync_interval,
+                         logger_name='HORUS_CSS.csv_handler')
         self.session_dir = Utils.session_path
         self.filename = os.path.join(self.session_dir,
                                      'telemetry_data.csv')
         self.file = None
         self.writer = None
-        self.header = ['timestamp', 'velocity', 'pitch',
-                       'roll', 'status',
-                       'altitude', 'latitude', 'longitude',
-                       'len', 'rssi', 'snr']
+        self.header = list(Config.TELEMETRY_HEADER)
+
+        self.index_interval = index_interval
+        self.index_file = None
+        self.segment_rows = 0
+        # Byte offset of the next row, kept here because tell() on a buffered file flushes it
+        self.offset = 0
+        self.row_buffer = io.StringIO(newline='')
+
+        self.rotate_bytes = rotate_bytes
+        self.rotate_interval = rotate_interval
+        self.segment = 0
+        self.segment_started = time.monotonic()
+        self.on_rotation_subscribers = []
+        self.closing = False
+
         self.create_file_with_header()
 
     def create_file_with_header(self):
         try:
-            with open(self.filename, 'w', newline='',
-                      encoding='utf-8') as f:
-                writer = csv.writer(f, delimiter=';')
-                writer.writerow(self.header)
-            self.logger.info(
-                f"Created CSV file with header: {self.filename}")
-            
-            self.file = open(self.filename, 'a', newline='',
-                             encoding='utf-8')
-            self.writer = csv.writer(self.file,
-                                     delimiter=';')
+            self.open_file()
+            self.start_writer()
         except Exception as e:
             self.logger.error(
                 f"Failed to create CSV file: {e}")
 
+    def open_file(self):
+        with open(self.filename, 'w', newline='',
+                  encoding='utf-8') as f:
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(self.header)
+        self.logger.info(
+            f"Created CSV file with header: {self.filename}")
+
+        # Rows are formatted into row_buffer and written encoded, so their size is known
+        self.file = open(self.filename, 'ab')
+        self.offset = self.file.tell()
+        self.writer = csv.writer(self.row_buffer,
+                                 delimiter=';')
+        self.index_file = open(self.index_filename(self.filename), 'wb')
+        self.segment_rows = 0
+        self.segment_started = time.monotonic()
+
+    @staticmethod
+    def index_filename(segment_path):
+        if segment_path.endswith('.gz'):
+            segment_path = segment_path[:-3]
+        return segment_path + '.idx'
+
+    def segment_filename(self, segment):
+        root, ext = os.path.splitext(self.filename)
+        return f"{root}.{segment}{ext}"
+
+    @staticmethod
+    def segment_files(session_dir, basename='telemetry_data.csv'):
+        """Closed segments (possibly gzip-compressed) in order, followed by the active file."""
+        root, ext = os.path.splitext(basename)
+        pattern = re.compile(rf"^{re.escape(root)}\.(\d+){re.escape(ext)}(\.gz)?$")
+        segments = []
+        for name in os.listdir(session_dir):
+            match = pattern.match(name)
+            if match:
+                segments.append((int(match.group(1)), os.path.join(session_dir, name)))
+        files = [path for _, path in sorted(segments)]
+        active = os.path.join(session_dir, basename)
+        if os.path.exists(active):
+            files.append(active)
+        return files
+
+    def subscribe_on_rotation(self, callback):
+        self.on_rotation_subscribers.append(callback)
+        self.logger.info(f"Added {callback} as a subscriber to on_rotation_subscribers.")
+
+    def should_rotate(self):
+        if self.rotate_bytes and os.fstat(self.file.fileno()).st_size >= self.rotate_bytes:
+            return True
+        return bool(self.rotate_interval) and \
+            time.monotonic() - self.segment_started >= self.rotate_interval
+
+    def rotate(self):
+        self.fsync_file(self.file)
+        self.file.close()
+        self.fsync_file(self.index_file)
+        self.index_file.close()
+        self.segment += 1
+        segment_path = self.segment_filename(self.segment)
+        os.replace(self.filename, segment_path)
+        os.replace(self.index_filename(self.filename), self.index_filename(segment_path))
+        self.open_file()
+        self.logger.info(f"CSV segment closed: {segment_path}")
+        for callback in self.on_rotation_subscribers:
+            callback(segment_path)
+
     def write_row(self, data_dict):
         if not self.writer:
             self.logger.error("CSV writer not initialized")
             return
 
-        try:
-            timestamp = datetime.now().isoformat()
-            row = [timestamp]
-            for key in self.header[1:]:
-                row.append(data_dict.get(key, ''))
+        # Only the values are captured here, formatting and disk I/O
+        # happen on the writer thread.
+        self.submit((time.time(),
+                     [data_dict.get(key, '') for key in self.header[1:]],
+                     data_dict.get('_trace')))
 
-            self.writer.writerow(row)
-            self.file.flush()
-        except Exception as e:
-            self.logger.error(f"Error writing to CSV: {e}")
+    def write_batch(self, items):
+        for timestamp, values, trace in items:
+            if self.index_interval and self.segment_rows % self.index_interval == 0:
+                self.index_file.write(self.INDEX_RECORD.pack(timestamp, self.offset))
+            self.row_buffer.seek(0)
+            self.row_buffer.truncate()
+            self.writer.writerow(
+                [datetime.fromtimestamp(timestamp).isoformat()] + values)
+            row = self.row_buffer.getvalue().encode('utf-8')
+            self.file.write(row)
+            self.offset += len(row)
+            self.segment_rows += 1
+            if trace is not None:
+                trace.mark('write')
+
+    def flush(self):
+        # Data first, so an index entry never points past the end of the CSV
+        self.file.flush()
+        self.index_file.flush()
+        # The final flush of close_file must not start a new, empty segment
+        if not self.closing and self.should_rotate():
+            self.rotate()
+
+    def sync(self):
+        self.fsync_file(self.file)
+        self.fsync_file(self.index_file)
 
     def close_file(self):
+        self.closing = True
+        self.stop_writer()
+
         if self.file:
             try:
                 self.file.close()
@@ -66,5 +175,14 @@ class CsvHandler:
                 self.file = None
                 self.writer = None
 
+        if self.index_file:
+            try:
+                self.index_file.close()
+            except Exception as e:
+                self.logger.error(
+                    f"Error closing CSV index: {e}")
+            finally:
+                self.index_file = None
+
     def __del__(self):
-        self.close_file()
\ No newline at end of file
+        self.close_file()
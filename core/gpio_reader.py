@@ -2,7 +2,6 @@ import logging
 import gpiozero
 import warnings
 from gpiozero import Button, GPIODeviceError
-from gpiozero.pins.mock import MockFactory
 
 
 class GpioReader:
@@ -16,6 +15,7 @@ class GpioReader:
         except Exception as e:
             warnings.warn("No GPIO backend available, falling back to MockFactory")
             self.logger.warning(f"No GPIO backend available ({e}), using MockFactory instead.")
+            from gpiozero.pins.mock import MockFactory
             gpiozero.Device.pin_factory = MockFactory()
             self.button = Button(pin_number)
             self.logger.info(f"Initialized Button on pin {pin_number} with MockFactory.")
@@ -0,0 +1,108 @@
+import os
+import logging
+import threading
+from functools import partial
+
+from core.csv_handler import CsvHandler
+from core.column_store import ColumnStore
+from core.session_database import SessionDatabase
+from core.telemetry_journal import TelemetryJournal
+from core.session_catalog import SessionSummary
+from core.session_maintenance import SessionMaintenance, SegmentRotatingFileHandler
+from core.network_reader import NetworkTransmitter
+from core.gpio_reader import GpioReader
+from core.utils import Utils
+from core.config import Config
+
+
+class GroundStation:
+    """Acquisition core shared by the GUI (``main.py``) and the headless daemon
+    (``headless.py``): session directory and logging, storage backends,
+    network server and the GPIO abort button. Nothing here needs Qt widgets.
+    """
+
+    def __init__(self, log_handlers=None):
+        self.session_dir = Utils.create_session_directory()
+        self.log_file = os.path.join(self.session_dir, 'app_events.log')
+        self.maintenance = SessionMaintenance(Utils.catalog, Utils.session_id)
+
+        logging.basicConfig(
+            handlers=[SegmentRotatingFileHandler(self.log_file, on_rotated=self.maintenance.compress)]
+            + list(log_handlers or []),
+            level=Config.LOG_LEVEL,
+            format='%(asctime)s %(levelname)-8s %(name)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+
+        self.logger = logging.getLogger('HORUS_CSS_logger')
+        self.logger.info(f"Log file location: {self.log_file}")
+        self.logger.info("Uruchamianie aplikacji")
+
+        for session in Utils.catalog.unclosed_sessions(Utils.session_id):
+            journal = os.path.join(session['directory'], Config.JOURNAL_FILE)
+            TelemetryJournal.recover(journal)
+            records = TelemetryJournal.read_records(journal) if os.path.exists(journal) else None
+            Utils.catalog.rebuild_summary(session, records)
+        self.maintenance.start()
+
+        self.config = None
+        self.network_reader = None
+        self.network_thread = None
+        self.gpio_reader = None
+        self.session_database = None
+        self.csv_handler = None
+        self.storage_handlers = []
+
+    @staticmethod
+    def default_config():
+        return {
+            'port': "",
+            'baudrate': Config.DEFAULT_BAUD_RATE,
+            'lora_config': None,
+            'is_config_selected': True,
+            'network': {
+                'ip_address': Config.DEFAULT_IP_ADDRESS,
+                'port': Config.DEFAULT_IP_PORT
+            }
+        }
+
+    def create_backends(self, config):
+        """Network server, GPIO button and storage for ``config`` (see ``default_config``)."""
+        self.config = config
+        network_config = config['network']
+        self.logger.debug("Initializing NetworkTransmitter with IP %s and port %s",
+                          network_config['ip_address'], network_config['port'])
+        self.network_reader = NetworkTransmitter(host=network_config['ip_address'], port=int(network_config['port']))
+
+        self.gpio_reader = GpioReader(Config.DEFAULT_GPIO_PIN)
+        self.logger.debug("GpioReader initialized on pin %s", Config.DEFAULT_GPIO_PIN)
+        self.gpio_reader.subscribe_when_held(partial(self.network_reader.send, {"event": "mission_abort_pressed"}))
+        self.logger.debug("Subscribed GPIO event to send mission_abort_pressed event")
+
+        self.session_database = SessionDatabase(os.path.join(self.session_dir, Config.SESSION_DATABASE_FILE))
+        self.session_database.log_event('session_started', config)
+        self.network_reader.subcribe_on_connection(partial(self.session_database.log_event, 'connected'))
+        self.network_reader.subcribe_on_disconnect(partial(self.session_database.log_event, 'disconnected'))
+        self.gpio_reader.subscribe_when_held(partial(self.session_database.log_event, 'mission_abort'))
+
+        session_summary = SessionSummary(Utils.catalog, Utils.session_id, self.session_dir)
+        journal = TelemetryJournal(os.path.join(self.session_dir, Config.JOURNAL_FILE))
+        self.csv_handler = CsvHandler()
+        self.csv_handler.subscribe_on_rotation(self.maintenance.compress)
+        column_store = ColumnStore(os.path.join(self.session_dir, Config.COLUMN_STORE_DIRECTORY))
+        self.storage_handlers = [journal, column_store, self.session_database, session_summary]
+
+    def start_network(self):
+        self.network_thread = threading.Thread(target=self.network_reader.connect_to_server, daemon=False)
+        self.network_thread.start()
+        self.logger.info("Network thread started")
+
+    def stop(self):
+        if self.network_reader:
+            self.network_reader.stop()
+        if self.network_thread:
+            self.network_thread.join(timeout=1)
+        self.maintenance.stop()
+
+        active_threads = threading.enumerate()
+        self.logger.warning("Still active threads after join: %s", [t.name for t in active_threads])
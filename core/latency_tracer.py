@@ -0,0 +1,177 @@
+import json
+import math
+import time
+import logging
+import threading
+from datetime import datetime
+
+
+class LatencyHistogram:
+    """HDR-style histogram of latencies.
+
+    Values are counted in microseconds in log-linear buckets: every power of
+    two is split into ``2 ** SUB_BUCKET_BITS`` equal buckets, so a reported
+    percentile is within 1/128 (0.8 %) of the recorded value from 1 µs up to
+    hours, and memory grows with the number of magnitudes, not samples.
+    """
+
+    SUB_BUCKET_BITS = 7
+    PERCENTILES = (50, 90, 99, 99.9)
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+
+    @classmethod
+    def bucket(cls, micros):
+        """(lowest value, width) of the bucket holding ``micros``."""
+        shift = max(0, micros.bit_length() - cls.SUB_BUCKET_BITS - 1)
+        return (micros >> shift) << shift, 1 << shift
+
+    def record(self, seconds):
+        micros = max(0, int(seconds * 1e6))
+        key, _ = self.bucket(micros)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.count += 1
+        self.total += micros
+        if self.minimum is None or micros < self.minimum:
+            self.minimum = micros
+        if self.maximum is None or micros > self.maximum:
+            self.maximum = micros
+
+    def percentile(self, p):
+        """Latency in seconds that ``p`` percent of the recorded values do not exceed."""
+        if not self.count:
+            return None
+        target = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen >= target:
+                low, width = self.bucket(key)
+                return min(low + width - 1, self.maximum) / 1e6
+        return self.maximum / 1e6
+
+    def summary(self):
+        """Count, mean, extremes and percentiles, all latencies in milliseconds."""
+        def ms(micros):
+            return None if micros is None else round(micros / 1000, 3)
+
+        summary = {
+            'count': self.count,
+            'mean_ms': ms(self.total / self.count) if self.count else None,
+            'min_ms': ms(self.minimum),
+            'max_ms': ms(self.maximum),
+        }
+        for p in self.PERCENTILES:
+            value = self.percentile(p)
+            summary[f"p{p:g}_ms"] = None if value is None else round(value * 1000, 3)
+        return summary
+
+    def to_dict(self):
+        data = self.summary()
+        data['buckets_us'] = [[key, self.counts[key]] for key in sorted(self.counts)]
+        return data
+
+
+class LatencyTrace:
+    """Monotonic timestamps of one record on its way through the pipeline.
+
+    Carried in the record under ``'_trace'`` (keys starting with ``_`` are
+    not stored by the storage backends). ``mark`` records the time of a stage
+    once and reports it to the tracer.
+    """
+
+    __slots__ = ('tracer', 'source', 'times')
+
+    def __init__(self, tracer, source, started=None):
+        self.tracer = tracer
+        self.source = source
+        self.times = {'read': time.perf_counter() if started is None else started}
+
+    def __repr__(self):
+        started = self.times['read']
+        stages = ", ".join(f"{stage}=+{(t - started) * 1000:.2f} ms"
+                           for stage, t in list(self.times.items()) if stage != 'read')
+        return f"LatencyTrace({self.source}: {stages})"
+
+    def mark(self, stage):
+        if stage in self.times:
+            return
+        now = time.perf_counter()
+        self.times[stage] = now
+        self.tracer.record(self, stage, now)
+
+
+class LatencyTracer:
+    """Latency histograms of the telemetry pipeline stages.
+
+    A record is traced from the moment its line (serial) or message (TCP)
+    was read: ``decode`` (parsed into a dict), ``pair`` (assembled and
+    emitted by ``ProcessData``), ``dispatch`` (handled on the GUI thread),
+    ``displayed`` (the main window has updated its widgets from it; no plot
+    is drawn from telemetry, so no frame is waited for) and ``write`` (row
+    written to the CSV file by the writer thread). Each stage gets a
+    histogram of the time since the stage before it, ``read_to_displayed``
+    and ``read_to_write`` hold the end-to-end latencies.
+    """
+
+    _shared = None
+
+    STAGES = ('read', 'decode', 'pair', 'dispatch', 'displayed', 'write')
+    PREVIOUS = {'decode': 'read', 'pair': 'decode', 'dispatch': 'pair', 'displayed': 'dispatch', 'write': 'pair'}
+    END_TO_END = ('displayed', 'write')
+
+    def __init__(self):
+        self.logger = logging.getLogger('HORUS_CSS.latency_tracer')
+        self.lock = threading.Lock()
+        self.traces = 0
+        self.histograms = {}
+        self.reset()
+
+    @classmethod
+    def shared(cls):
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def reset(self):
+        with self.lock:
+            self.traces = 0
+            self.histograms = {stage: LatencyHistogram() for stage in self.PREVIOUS}
+            for stage in self.END_TO_END:
+                self.histograms[f"read_to_{stage}"] = LatencyHistogram()
+
+    def start(self, source, started=None):
+        """New trace of a record read from ``source`` (``'serial'`` or ``'tcp'``) at ``started``."""
+        with self.lock:
+            self.traces += 1
+        return LatencyTrace(self, source, started)
+
+    def record(self, trace, stage, now):
+        previous = trace.times.get(self.PREVIOUS.get(stage))
+        # Stages are marked from the reader, GUI and writer threads
+        with self.lock:
+            if previous is not None:
+                self.histograms[stage].record(now - previous)
+            if stage in self.END_TO_END:
+                self.histograms[f"read_to_{stage}"].record(now - trace.times['read'])
+
+    def summary(self):
+        with self.lock:
+            return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+    def save(self, path):
+        """Write the histograms with their buckets to ``path`` as JSON."""
+        with self.lock:
+            report = {
+                'created': datetime.now().isoformat(),
+                'traces': self.traces,
+                'histograms': {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        self.logger.info(f"Latency histograms saved to {path}")
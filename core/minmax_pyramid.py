@@ -0,0 +1,227 @@
+import numpy as np
+
+from core.ring_buffer import RingBuffer
+
+
+class MinMaxPyramid:
+    """Multi-resolution min/max history of one or more time series sharing a time base.
+
+    Level 0 holds the raw samples: one timestamp and one value per channel.
+    Every entry of level ``k > 0`` aggregates ``factor`` consecutive entries
+    of level ``k - 1`` into the time of the bucket start and, per channel,
+    the (time, value) of its minimum and maximum, so level ``k`` covers
+    ``factor ** k`` samples per entry. Levels are updated incrementally as
+    samples arrive and every level keeps at most ``capacity`` entries: with
+    the defaults the coarsest level spans ``capacity * 4 ** 6`` samples.
+
+    ``query`` returns the finest representation of a time window that fits a
+    point budget. Drawing the minimum and maximum of every bucket keeps every
+    peak visible at any zoom level.
+    """
+
+    CHANNEL_FIELDS = ('min_time', 'min_value', 'max_time', 'max_value')
+    # raw samples collected before they are aggregated in one vectorized step;
+    # until then ``query`` draws them from level 0
+    AGGREGATE_BATCH = 64
+
+    def __init__(self, capacity, factor=4, levels=7, channels=1):
+        if factor < 2:
+            raise ValueError("factor must be at least 2")
+        self.capacity = capacity
+        self.factor = factor
+        self.level_count = max(1, levels)
+        self.times = RingBuffer(capacity)
+        self.channels = []
+        self.levels = [None] + [{'start': RingBuffer(capacity), 'channels': []}
+                                for _ in range(self.level_count - 1)]
+        # entries of each level not yet aggregated into the next one
+        self.pending = [0] * self.level_count
+        for _ in range(channels):
+            self.add_channel()
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def values(self):
+        """Raw values of the first channel."""
+        return self.channels[0]
+
+    def add_channel(self):
+        """Add a channel, NaN for the samples recorded so far. Returns its index."""
+        raw = RingBuffer(self.capacity)
+        raw.extend(np.full(len(self.times), np.nan))
+        self.channels.append(raw)
+        for level in self.levels[1:]:
+            length = len(level['start'])
+            fields = {}
+            for field in self.CHANNEL_FIELDS:
+                fields[field] = RingBuffer(self.capacity)
+                fill = level['start'].view() if field.endswith('_time') else np.full(length, np.nan)
+                fields[field].extend(fill)
+            level['channels'].append(fields)
+        return len(self.channels) - 1
+
+    def clear(self):
+        self.times.clear()
+        for raw in self.channels:
+            raw.clear()
+        for level in self.levels[1:]:
+            level['start'].clear()
+            for fields in level['channels']:
+                for buffer in fields.values():
+                    buffer.clear()
+        self.pending = [0] * self.level_count
+
+    def append(self, timestamp, values):
+        """Add one sample; ``values`` has one value per channel (a scalar for one channel)."""
+        self.times.append(timestamp)
+        if len(self.channels) == 1 and np.ndim(values) == 0:
+            self.channels[0].append(values)
+        else:
+            for raw, value in zip(self.channels, values):
+                raw.append(value)
+        self.pending[0] += 1
+        if self.pending[0] >= self.AGGREGATE_BATCH:
+            self._aggregate(0)
+
+    def extend(self, timestamps, values):
+        """Add many samples; ``values`` has shape (samples, channels), or (samples,) for one channel."""
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if len(timestamps) == 0:
+            return
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[:, np.newaxis]
+        first = 0
+        while first < len(timestamps):
+            # Aggregate before level 0 wraps, or the coarser levels miss the overwritten samples
+            last = min(len(timestamps), first + max(self.capacity - self.pending[0], 1))
+            self.times.extend(timestamps[first:last])
+            for channel, raw in enumerate(self.channels):
+                raw.extend(values[first:last, channel])
+            self.pending[0] += last - first
+            self._aggregate(0)
+            first = last
+
+    def time_range(self):
+        """(oldest, newest) timestamp still represented at any level, or ``None``."""
+        if not len(self.times):
+            return None
+        oldest = self.times.view()[0]
+        for level in self.levels[1:]:
+            if len(level['start']):
+                oldest = min(oldest, level['start'].view()[0])
+        return oldest, self.times.last()
+
+    def nearest(self, timestamp):
+        """``(timestamp, values)`` of the raw sample closest to ``timestamp``, or ``None``."""
+        times = self.times.view()
+        if not len(times):
+            return None
+        index = int(np.searchsorted(times, timestamp))
+        if index == len(times) or (index > 0 and timestamp - times[index - 1] < times[index] - timestamp):
+            index -= 1
+        return float(times[index]), [float(raw.view()[index]) for raw in self.channels]
+
+    def _starts(self, level):
+        return self.times.view() if level == 0 else self.levels[level]['start'].view()
+
+    def _entries(self, level, channel):
+        if level == 0:
+            times, values = self.times.view(), self.channels[channel].view()
+            return {'start': times, 'min_time': times, 'min_value': values,
+                    'max_time': times, 'max_value': values}
+        entries = {field: buffer.view() for field, buffer in self.levels[level]['channels'][channel].items()}
+        entries['start'] = self.levels[level]['start'].view()
+        return entries
+
+    def _aggregate(self, level):
+        if level + 1 >= self.level_count:
+            self.pending[level] = 0
+            return
+
+        length = len(self._starts(level))
+        # After a batch larger than the capacity the oldest pending entries are gone
+        pending = min(self.pending[level], length)
+        buckets = pending // self.factor
+        self.pending[level] = pending - buckets * self.factor
+        if not buckets:
+            return
+
+        first = length - pending
+        last = first + buckets * self.factor
+        rows = np.arange(buckets)
+        target = self.levels[level + 1]
+        target['start'].extend(self._starts(level)[first:last:self.factor])
+        for channel, fields in enumerate(target['channels']):
+            block = {field: values[first:last].reshape(buckets, self.factor)
+                     for field, values in self._entries(level, channel).items()}
+            min_index = np.where(np.isnan(block['min_value']), np.inf, block['min_value']).argmin(axis=1)
+            max_index = np.where(np.isnan(block['max_value']), -np.inf, block['max_value']).argmax(axis=1)
+            fields['min_time'].extend(block['min_time'][rows, min_index])
+            fields['min_value'].extend(block['min_value'][rows, min_index])
+            fields['max_time'].extend(block['max_time'][rows, max_index])
+            fields['max_value'].extend(block['max_value'][rows, max_index])
+        self.pending[level + 1] += buckets
+        if self.pending[level + 1] >= self.factor:
+            self._aggregate(level + 1)
+
+    @staticmethod
+    def _window(starts, start, end):
+        """Index range of the entries in [start, end] plus one neighbour on each side."""
+        first = max(int(np.searchsorted(starts, start, side='left')) - 1, 0)
+        last = min(int(np.searchsorted(starts, end, side='right')) + 1, len(starts))
+        return first, last
+
+    def select_level(self, start, end, max_points):
+        """The finest level that fits the budget and reaches back to ``start``
+        (or holds the oldest data there is)."""
+        oldest = self.time_range()[0]
+        for candidate in range(self.level_count):
+            starts = self._starts(candidate)
+            if not len(starts):
+                return candidate
+            first, last = self._window(starts, start, end)
+            points = (last - first) * (1 if candidate == 0 else 2)
+            if points <= max_points and (starts[0] <= start or starts[0] <= oldest):
+                return candidate
+        return self.level_count - 1
+
+    def query(self, start, end, max_points, channel=0, level=None):
+        """``(x, y)`` arrays describing [start, end] with at most about ``max_points`` points."""
+        if not len(self.times):
+            return np.empty(0), np.empty(0)
+        if level is None:
+            level = self.select_level(start, end, max_points)
+
+        # The newest samples are not aggregated up to ``level`` yet, they are
+        # the pending entries of the finer levels, newest last
+        parts = [(level, self._entries(level, channel))]
+        for current in range(level - 1, -1, -1):
+            pending = min(self.pending[current], len(self._starts(current)))
+            if pending:
+                entries = self._entries(current, channel)
+                parts.append((current, {field: values[-pending:] for field, values in entries.items()}))
+
+        x = []
+        y = []
+        for current, entries in parts:
+            if not len(entries['start']):
+                continue
+            first, last = self._window(entries['start'], start, end)
+            if current == 0:
+                x.append(entries['start'][first:last])
+                y.append(entries['min_value'][first:last])
+                continue
+            part = {field: values[first:last] for field, values in entries.items()}
+            # min and max of each bucket, in time order
+            min_first = part['min_time'] <= part['max_time']
+            x.append(np.column_stack((np.where(min_first, part['min_time'], part['max_time']),
+                                      np.where(min_first, part['max_time'], part['min_time']))).ravel())
+            y.append(np.column_stack((np.where(min_first, part['min_value'], part['max_value']),
+                                      np.where(min_first, part['max_value'], part['min_value']))).ravel())
+
+        if not x:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(x), np.concatenate(y)
@@ -2,7 +2,9 @@ import socket
 import json
 import logging
 import threading
-from time import sleep
+from time import sleep, perf_counter
+
+from core.latency_tracer import LatencyTracer
 
 class NetworkTransmitter:
 
@@ -10,12 +12,18 @@ class NetworkTransmitter:
 		self.HOST = host
 		self.PORT = port
 		self.conn = None
+		self.send_lock = threading.Lock()
 		self.stop_requested = False
 		self.logger = logging.getLogger(
 			'HORUS_CSS.network_reader')
 		self.on_connection_subscibers = []
 		self.on_disconnection_subscibers = []
 		self.on_data_received_subscibers = []
+		# Counters read by the performance HUD
+		self.bytes_received = 0
+		self.messages_received = 0
+		self.decode_errors = 0
+		self.buffered_bytes = 0
 
 	def connect_to_server(self):
 		server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -34,8 +42,10 @@ class NetworkTransmitter:
 				for callback in self.on_connection_subscibers:
 					callback()
 
-				threading.Thread(target=self.heartbeat_check, daemon=True).start()
+				conn = self.conn
+				threading.Thread(target=self.heartbeat_check, args=(conn,), daemon=True).start()
 				self.read_data()
+				self.handle_disconnection(conn)
 
 			except socket.timeout:
 				continue
@@ -48,32 +58,62 @@ class NetworkTransmitter:
 		self.logger.info("NetworkReader stopped")
 
 	def read_data(self):
+		conn = self.conn
+		buffer = b""
 		try:
 			while True:
-				raw_data = self.conn.recv(1024)
+				raw_data = conn.recv(65536)
 				if not raw_data:
 					return
-				# dekodowanie bajtów na string
-				text_data = raw_data.decode('utf-8')
-
-				# zamiana JSON na słownik
-				try:
-					data = json.loads(text_data)
-				except json.JSONDecodeError as e:
-					self.logger.error("Błąd dekodowania JSON:", e)
-					return
+				read_time = perf_counter()
+				self.bytes_received += len(raw_data)
+				buffer += raw_data
 
-				for on_data_received in self.on_data_received_subscibers:
-					on_data_received(data)
+				# wiadomości JSON są rozdzielone znakiem nowej linii
+				*lines, buffer = buffer.split(b"\n")
+				self.buffered_bytes = len(buffer)
+				for line in lines:
+					if line.strip():
+						self.handle_message(line, read_time)
 
 		except ConnectionResetError:
 			self.logger.error("Klient rozłączył się.")
-			for on_disconnection in self.on_disconnection_subscibers:
-				on_disconnection()
+			return
+		except OSError as e:
+			if not self.stop_requested:
+				self.logger.error("Socket error in recv(): %s", e)
 			return
 
 		finally:
-			self.conn.close()
+			conn.close()
+
+	def handle_message(self, line, read_time=None):
+		# zamiana JSON na słownik
+		try:
+			data = json.loads(line.decode('utf-8'))
+		except (UnicodeDecodeError, json.JSONDecodeError) as e:
+			self.decode_errors += 1
+			self.logger.error("Błąd dekodowania JSON: %s", e)
+			return
+
+		if not isinstance(data, dict):
+			self.decode_errors += 1
+			self.logger.error("Wiadomość JSON nie jest obiektem: %s", line[:200])
+			return
+
+		if data.get('event') == 'ping':
+			self.send({'event': 'pong', 'seq': data.get('seq'), 'sent': data.get('sent')})
+			return
+
+		self.messages_received += 1
+		trace = LatencyTracer.shared().start('tcp', read_time)
+		trace.mark('decode')
+		data['_trace'] = trace
+		for on_data_received in self.on_data_received_subscibers:
+			try:
+				on_data_received(data)
+			except Exception as e:
+				self.logger.exception(f"Error in data subscriber {on_data_received}: {e}")
 
 	def send(self, data: dict):
 		if not self.conn:
@@ -81,25 +121,35 @@ class NetworkTransmitter:
 			return
 		try:
 			message = json.dumps(data).encode('utf-8') + b"\n"
-			self.conn.sendall(message)
+			# Pongs are sent from the reader thread, echoes from the GUI thread
+			with self.send_lock:
+				self.conn.sendall(message)
 			self.logger.debug(f"Sent: {data}")
 		except (BrokenPipeError, ConnectionResetError, OSError) as e:
 			self.logger.error(f"Error sending data: {e}")
 			self.conn = None
 
-	def heartbeat_check(self):
-		while self.conn and not self.stop_requested:
+	def echo(self, probe):
+		"""Answer the ``probe`` of a telemetry message once the station has handled the record."""
+		if isinstance(probe, dict):
+			self.send({'event': 'echo', 'seq': probe.get('seq'), 'sent': probe.get('sent')})
+
+	def handle_disconnection(self, conn):
+		if self.conn is conn:
+			self.conn = None
+		self.logger.info("Connection closed")
+		for on_disconnection in self.on_disconnection_subscibers:
+			on_disconnection()
+
+	def heartbeat_check(self, conn):
+		while self.conn is conn and not self.stop_requested:
 			try:
-				self.conn.send(b'')
+				conn.send(b'')
 				sleep(0.5)
 			except (BrokenPipeError, ConnectionResetError, OSError):
 				self.logger.warning("Connection lost during heartbeat check.")
-				self.conn.close()
-				self.conn = None
-				for on_disconnection in self.on_disconnection_subscibers:
-					on_disconnection()
+				conn.close()
 				break
-		self.connect_to_server()
 
 	def subcribe_on_connection(self, callback):
 		self.on_connection_subscibers.append(callback)
@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+import logging
+
+
+def resident_memory():
+    """Resident set size of this process in bytes, ``None`` where it cannot be read."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                            ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                            ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            get_process = ctypes.windll.kernel32.GetCurrentProcess
+            get_process.restype = wintypes.HANDLE
+            get_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+            get_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+            if get_memory_info(get_process(), ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+        except (OSError, AttributeError):
+            pass
+    return None
+
+
+class PerformanceMonitor:
+    """Rates and levels of the counters kept by the station components.
+
+    Components keep plain integer counters (``SerialReader.packets_received``,
+    ``NetworkTransmitter.messages_received``, ...); the monitor only reads
+    them. ``add_counter`` registers an ever-increasing count, reported with
+    its rate per second since the previous ``sample``; ``add_gauge``
+    registers a current level such as a queue length. A sample costs one
+    call per registered source, so it can be taken a few times per second.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger('HORUS_CSS.performance_monitor')
+        self.counters = {}
+        self.gauges = {}
+        self.last_counts = {}
+        self.last_time = time.monotonic()
+        self.last_cpu = time.process_time()
+
+    def add_counter(self, name, read):
+        self.counters[name] = read
+        self.last_counts[name] = self.read(name, read)
+
+    def add_gauge(self, name, read):
+        self.gauges[name] = read
+
+    def read(self, name, read):
+        try:
+            return read()
+        except Exception as e:
+            self.logger.debug(f"Cannot read {name}: {e}")
+            return None
+
+    def sample(self):
+        """``{name: value}`` of every gauge and counter, plus ``<counter>_rate`` in
+        1/s, ``cpu_percent`` (of one core) and ``rss_mb``."""
+        now = time.monotonic()
+        cpu = time.process_time()
+        elapsed = now - self.last_time
+
+        sample = {}
+        for name, read in self.counters.items():
+            count = self.read(name, read)
+            last = self.last_counts.get(name)
+            sample[name] = count
+            sample[f"{name}_rate"] = (count - last) / elapsed \
+                if elapsed > 0 and count is not None and last is not None else None
+            # A source that cannot be read yet keeps its baseline until its first value
+            if count is not None:
+                self.last_counts[name] = count
+        for name, read in self.gauges.items():
+            sample[name] = self.read(name, read)
+
+        sample['cpu_percent'] = 100.0 * (cpu - self.last_cpu) / elapsed if elapsed > 0 else None
+        rss = resident_memory()
+        sample['rss_mb'] = rss / 1024 ** 2 if rss is not None else None
+
+        self.last_time = now
+        self.last_cpu = cpu
+        return sample
@@ -0,0 +1,263 @@
+import os
+import json
+import math
+import time
+import logging
+
+import numpy as np
+
+from core.config import Config
+from core.column_store import ColumnStore, ColumnStoreReader
+
+
+class PlotArchiveReader:
+    """Read-only, memory-mapped view of a ``PlotArchive`` directory.
+
+    ``raw/`` is a ``ColumnStore`` with the timestamp and one column per
+    series. ``summary/`` holds the minimum and maximum (with their times) of
+    every ``bucket`` raw samples, so that any time range, however long, can
+    be drawn from at most a few pages of the raw or the summary files:
+    ``query`` only reads the part of a file that falls into the window.
+    """
+
+    RAW_DIRECTORY = 'raw'
+    SUMMARY_DIRECTORY = 'summary'
+    SUMMARY_FIELDS = ('min_time', 'min', 'max_time', 'max')
+    # raw samples a query may read per point of its budget before the summary is used
+    RAW_READ_FACTOR = 16
+    REFRESH_INTERVAL = 1.0      # s, how often the memory maps follow the growing files
+
+    def __init__(self, directory, refresh_interval=REFRESH_INTERVAL):
+        self.logger = logging.getLogger('HORUS_CSS.plot_archive')
+        self.directory = directory
+        self.refresh_interval = refresh_interval
+        self.series_count = self.stored_series_count()
+        self.readers = {}
+        self.refreshed = {}
+
+    def stored_series_count(self):
+        try:
+            with open(os.path.join(self.directory, self.RAW_DIRECTORY, ColumnStore.SCHEMA_FILE),
+                      encoding='utf-8') as f:
+                return len(json.load(f)['columns']) - 1
+        except (OSError, ValueError, KeyError):
+            return 0
+
+    def reader(self, name):
+        """Memory-mapped reader of ``raw`` or ``summary``, reopened as the files grow."""
+        now = time.monotonic()
+        if name not in self.readers or now - self.refreshed.get(name, 0.0) >= self.refresh_interval:
+            try:
+                self.readers[name] = ColumnStoreReader(os.path.join(self.directory, name))
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Cannot open plot archive {name}: {e}")
+                return None
+            self.refreshed[name] = now
+        return self.readers[name]
+
+    def time_range(self):
+        """(oldest, newest) archived timestamp readable from disk, or ``None``."""
+        raw = self.reader(self.RAW_DIRECTORY)
+        if raw is None or not len(raw):
+            return None
+        timestamps = raw['timestamp']
+        return float(timestamps[0]), float(timestamps[-1])
+
+    def nearest(self, timestamp):
+        """``(timestamp, values)`` of the archived sample closest to ``timestamp``, or ``None``."""
+        raw = self.reader(self.RAW_DIRECTORY)
+        if raw is None or not len(raw):
+            return None
+        times = raw['timestamp']
+        index = int(np.searchsorted(times, timestamp))
+        if index == len(times) or (index > 0 and timestamp - times[index - 1] < times[index] - timestamp):
+            index -= 1
+        return float(times[index]), [float(raw[f"series_{series}"][index]) for series in range(self.series_count)]
+
+    def query(self, start, end, max_points, series=0):
+        """``(x, y)`` of [start, end] with at most about ``max_points`` points, min/max decimated."""
+        raw = self.reader(self.RAW_DIRECTORY)
+        if raw is None or not len(raw):
+            return np.empty(0), np.empty(0)
+        first, last = self.window(raw['timestamp'], start, end)
+        values = raw[f"series_{series}"]
+        count = last - first
+        if count <= max_points:
+            return np.array(raw['timestamp'][first:last]), np.array(values[first:last])
+
+        if count <= max_points * self.RAW_READ_FACTOR:
+            times = np.array(raw['timestamp'][first:last])
+            values = np.array(values[first:last])
+            return self.decimate(times, values, times, values, max_points // 2)
+
+        summary = self.reader(self.SUMMARY_DIRECTORY)
+        if summary is None or not len(summary):
+            return np.empty(0), np.empty(0)
+        first, last = self.window(summary['timestamp'], start, end)
+        fields = [np.array(summary[f"series_{series}_{field}"][first:last]) for field in self.SUMMARY_FIELDS]
+        # buckets in which the series had no value
+        valid = ~np.isnan(fields[0])
+        fields = [field[valid] for field in fields]
+        return self.decimate(*fields, max(max_points // 2, 1))
+
+    @staticmethod
+    def window(timestamps, start, end):
+        first = max(int(np.searchsorted(timestamps, start, side='left')) - 1, 0)
+        last = min(int(np.searchsorted(timestamps, end, side='right')) + 1, len(timestamps))
+        return first, last
+
+    @staticmethod
+    def decimate(min_time, min_value, max_time, max_value, buckets):
+        """Merge entries into at most ``buckets`` min/max pairs, in time order."""
+        group = max(1, -(-len(min_time) // buckets))
+        padding = -len(min_time) % group
+        if padding:
+            min_time, max_time = (np.append(times, np.full(padding, times[-1])) for times in (min_time, max_time))
+            min_value, max_value = (np.append(values, np.full(padding, np.nan)) for values in (min_value, max_value))
+        shape = (-1, group)
+        rows = np.arange(len(min_time) // group)
+        lows = np.where(np.isnan(min_value), np.inf, min_value).reshape(shape).argmin(axis=1)
+        highs = np.where(np.isnan(max_value), -np.inf, max_value).reshape(shape).argmax(axis=1)
+        low_time = min_time.reshape(shape)[rows, lows]
+        low_value = min_value.reshape(shape)[rows, lows]
+        high_time = max_time.reshape(shape)[rows, highs]
+        high_value = max_value.reshape(shape)[rows, highs]
+
+        min_first = low_time <= high_time
+        x = np.column_stack((np.where(min_first, low_time, high_time),
+                             np.where(min_first, high_time, low_time))).ravel()
+        y = np.column_stack((np.where(min_first, low_value, high_value),
+                             np.where(min_first, high_value, low_value))).ravel()
+        return x, y
+
+
+class PlotArchive(PlotArchiveReader):
+    """Append-only, memory-mapped history of the series of one plot.
+
+    Opening an existing directory continues it. ``previous`` is the archive
+    of an earlier session (e.g. the flight before a restart): it is only
+    read, as the history before the first sample of this archive, and new
+    samples are written to ``directory`` alone.
+    """
+
+    def __init__(self, directory, series_count=1, bucket=Config.PLOT_ARCHIVE_BUCKET, previous=None):
+        super().__init__(directory)
+        self.bucket = bucket
+        self.series_count = max(series_count, self.series_count)
+        # A finished session does not grow, its files are mapped once
+        self.previous = PlotArchiveReader(previous, refresh_interval=math.inf) \
+            if previous and os.path.isdir(os.path.join(previous, self.RAW_DIRECTORY)) else None
+        self.raw = None
+        self.summary = None
+        self.pending = []
+        self.open()
+
+    def raw_columns(self):
+        return ['timestamp'] + [f"series_{index}" for index in range(self.series_count)]
+
+    def summary_columns(self):
+        return ['timestamp'] + [f"series_{index}_{field}" for index in range(self.series_count)
+                                for field in self.SUMMARY_FIELDS]
+
+    def open(self):
+        self.raw = self.open_store(self.RAW_DIRECTORY, self.raw_columns())
+        self.summary = self.open_store(self.SUMMARY_DIRECTORY, self.summary_columns())
+        self.readers = {}
+        self.refreshed = {}
+
+    def open_store(self, name, columns):
+        directory = os.path.join(self.directory, name)
+        self.align_columns(directory, columns)
+        return ColumnStore(directory, columns)
+
+    @staticmethod
+    def align_columns(directory, columns):
+        """Give every column file the same number of rows before appending to them:
+        drop a torn last row and fill columns added since with NaN."""
+        paths = [os.path.join(directory, f"{name}.bin") for name in columns]
+        lengths = [os.path.getsize(path) // 8 for path in paths if os.path.exists(path)]
+        if not lengths:
+            return
+        length = min(lengths)
+        for path in paths:
+            if not os.path.exists(path):
+                np.full(length, np.nan).tofile(path)
+            elif os.path.getsize(path) != length * 8:
+                os.truncate(path, length * 8)
+
+    def close(self):
+        for store in (self.raw, self.summary):
+            if store is not None:
+                store.close_file()
+        self.readers = {}
+
+    def add_series(self):
+        """Add a column for a new series, NaN for the samples archived so far."""
+        index = self.series_count
+        # The open stores are extended in place, their writers keep running
+        self.raw.add_columns([f"series_{index}"])
+        self.summary.add_columns([f"series_{index}_{field}" for field in self.SUMMARY_FIELDS])
+        self.series_count += 1
+        self.pending = [(timestamp, row + [np.nan]) for timestamp, row in self.pending]
+        self.readers = {}
+        return index
+
+    def append(self, timestamp, row):
+        """Archive one sample, ``row`` has one value per series."""
+        row = [float(value) for value in row]
+        row += [np.nan] * (self.series_count - len(row))
+        self.raw.write_values(timestamp, row)
+        self.pending.append((timestamp, row))
+        if len(self.pending) >= self.bucket:
+            self.summarize()
+
+    def extend(self, timestamps, values):
+        """Archive many samples, ``values`` has shape (samples, series)."""
+        values = np.asarray(values, dtype=np.float64).reshape(len(timestamps), -1)
+        for timestamp, row in zip(np.asarray(timestamps, dtype=np.float64).tolist(), values.tolist()):
+            self.append(timestamp, row)
+
+    def summarize(self):
+        times = np.array([timestamp for timestamp, _ in self.pending])
+        values = np.array([row for _, row in self.pending]).reshape(len(times), -1)
+        self.pending = []
+        summary = []
+        for index in range(self.series_count):
+            column = values[:, index]
+            if np.isnan(column).all():
+                summary += [np.nan] * len(self.SUMMARY_FIELDS)
+                continue
+            low, high = np.nanargmin(column), np.nanargmax(column)
+            summary += [times[low], column[low], times[high], column[high]]
+        self.summary.write_values(times[0], summary)
+
+    def time_range(self):
+        ranges = [archive_range for archive_range in (super().time_range(), self.previous_range())
+                  if archive_range is not None]
+        if not ranges:
+            return None
+        return min(start for start, _ in ranges), max(end for _, end in ranges)
+
+    def previous_range(self):
+        return self.previous.time_range() if self.previous is not None else None
+
+    def nearest(self, timestamp):
+        candidates = [sample for sample in (super().nearest(timestamp), self.previous_nearest(timestamp))
+                      if sample is not None]
+        if not candidates:
+            return None
+        sample_time, values = min(candidates, key=lambda sample: abs(sample[0] - timestamp))
+        return sample_time, values + [np.nan] * (self.series_count - len(values))
+
+    def previous_nearest(self, timestamp):
+        return self.previous.nearest(timestamp) if self.previous is not None else None
+
+    def query(self, start, end, max_points, series=0):
+        x, y = super().query(start, end, max_points, series)
+        previous_range = self.previous_range()
+        if previous_range is None or series >= self.previous.series_count or start > previous_range[1]:
+            return x, y
+        # The previous session ends before this one starts
+        previous_x, previous_y = self.previous.query(start, min(end, previous_range[1]), max_points, series)
+        keep = x > previous_range[1]
+        return np.concatenate((previous_x, x[keep])), np.concatenate((previous_y, y[keep]))
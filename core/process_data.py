@@ -4,18 +4,27 @@ from datetime import datetime
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from core.telemetry_statistics import TelemetryStatistics
+
 
 class ProcessData(QObject):
     processed_data_ready = pyqtSignal(dict)
 
-    def __init__(self,  csv_handler):
+    # FAS packet key -> stored column (Config.TELEMETRY_HEADER) where they differ
+    STORED_KEYS = {'ver_velocity': 'velocity'}
+
+    def __init__(self,  csv_handler, storage_handlers=None):
         super().__init__()
         self.logger = logging.getLogger(
             'HORUS_CSS.data_processor')
         self.csv_handler = csv_handler
+        self.storage_handlers = ([csv_handler] if csv_handler else []) + list(storage_handlers or [])
         self.current_telemetry = None
         self.current_transmission = None
         self.past = None
+        self.statistics = TelemetryStatistics()
+        self.records_emitted = 0
+        self.errors = 0
 
         self.current_data = {
             'ver_velocity': 0.0,
@@ -31,9 +40,30 @@ class ProcessData(QObject):
             # 'snr': 0
         }
 
+    def add_storage_handler(self, handler):
+        self.storage_handlers.append(handler)
+        self.logger.info(f"Added storage handler {handler}")
+
+    def store_row(self, data):
+        for handler in self.storage_handlers:
+            handler.write_row(data)
+
+    def stored_row(self, data):
+        """``data`` with FAS keys renamed to the stored telemetry columns."""
+        row = dict(data)
+        for key, column in self.STORED_KEYS.items():
+            if key in row:
+                row[column] = row.pop(key)
+        return row
+
+    def close_storage(self):
+        for handler in self.storage_handlers:
+            handler.close_file()
+
     def handle_telemetry(self, telemetry):
         self.current_telemetry = telemetry
-        self.process_and_emit()
+        self.statistics.update(telemetry)
+        self.process_and_emit(telemetry.get('_trace'))
 
     def handle_auxiliary(self, auxiliary):
         self.current_auxiliary = auxiliary  # This signal is not present in this GNS
@@ -41,9 +71,10 @@ class ProcessData(QObject):
 
     def handle_transmission_info(self, transmission):
         self.current_transmission = transmission
-        self.process_and_emit()
+        self.statistics.update(transmission)
+        self.process_and_emit(transmission.get('_trace'))
 
-    def on_ethernet_data_received(self, data):
+    def on_ethernet_data_received(self, data, persist=True):
         self.current_data['timestamp'] = data['timestamp']
         for key in data['telemetry'].keys():
             if key in self.current_data:
@@ -59,8 +90,29 @@ class ProcessData(QObject):
         try:
             self.logger.debug(
                 f"Połączone dane do wysłania: {self.current_data}")
-            self.processed_data_ready.emit(self.current_data)
+            # Only the fields of this packet, current_data also holds defaults never received
+            received = {key: value for part in (data['telemetry'], data['transmission'])
+                        for key, value in part.items() if key in self.current_data}
+            received['timestamp'] = data['timestamp']
+            self.statistics.update(received)
+            record = self.current_data
+            trace = data.get('_trace')
+            probe = data.get('probe')
+            if trace is not None or probe is not None:
+                # A copy, the GUI thread gets the record after current_data has moved on
+                record = dict(self.current_data)
+            if trace is not None:
+                record['_trace'] = trace
+                trace.mark('pair')
+            if probe is not None:
+                # Echoed to the FAS once the record is handled (see NetworkTransmitter.echo)
+                record['_probe'] = probe
+            self.records_emitted += 1
+            self.processed_data_ready.emit(record)
+            if persist:
+                self.store_row(self.stored_row(record))
         except Exception as e:
+            self.errors += 1
             self.logger.exception(
                 f"Błąd podczas łączenia danych telemetrycznych i transmisyjnych: {e}")
 
@@ -86,16 +138,23 @@ class ProcessData(QObject):
         else:
             self.current_data['progress'] = -1
 
-    def process_and_emit(self):
+    def process_and_emit(self, trace=None):
         if self.current_telemetry and self.current_transmission:
             try:
                 combined_data = {**self.current_telemetry,
                                  **self.current_transmission}
+                # The trace of the input that completed the pair
+                combined_data.pop('_trace', None)
+                if trace is not None:
+                    combined_data['_trace'] = trace
+                    trace.mark('pair')
                 self.logger.debug(
                     f"Połączone dane do wysłania: {combined_data}")
+                self.records_emitted += 1
                 self.processed_data_ready.emit(
                     combined_data)
-                self.csv_handler.write_row(combined_data)
+                self.store_row(combined_data)
             except Exception as e:
+                self.errors += 1
                 self.logger.exception(
                     f"Błąd podczas łączenia danych telemetrycznych i transmisyjnych: {e}")
\ No newline at end of file
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO of numbers with O(1) append and zero-copy reads.
+
+    Every value is stored twice, at ``i`` and ``i + capacity`` of a
+    ``2 * capacity`` array. The newest ``len(self)`` values are therefore
+    always one contiguous slice, and ``view()`` can hand it to NumPy or
+    pyqtgraph without copying or reordering.
+    """
+
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = int(capacity)
+        self.data = np.zeros(2 * self.capacity, dtype=dtype)
+        self.head = 0       # position the next value is written to, in [0, capacity)
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def append(self, value):
+        self.data[self.head] = value
+        self.data[self.head + self.capacity] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.length < self.capacity:
+            self.length += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self.data.dtype).ravel()
+        if len(values) >= self.capacity:
+            # Only the newest ``capacity`` values survive
+            self.data[:self.capacity] = values[-self.capacity:]
+            self.data[self.capacity:] = values[-self.capacity:]
+            self.head = 0
+            self.length = self.capacity
+            return
+
+        count = len(values)
+        first = min(count, self.capacity - self.head)
+        for offset in (0, self.capacity):
+            self.data[offset + self.head:offset + self.head + first] = values[:first]
+            self.data[offset:offset + count - first] = values[first:]
+        self.head = (self.head + count) % self.capacity
+        self.length = min(self.length + count, self.capacity)
+
+    def view(self):
+        """Read-only contiguous view of the stored values, oldest first."""
+        start = self.head - self.length
+        if start < 0:
+            start += self.capacity
+        view = self.data[start:start + self.length]
+        view.flags.writeable = False
+        return view
+
+    def last(self):
+        if not self.length:
+            raise IndexError("last() on an empty RingBuffer")
+        return self.data[self.head - 1 + self.capacity]
+
+    def clear(self):
+        self.head = 0
+        self.length = 0
+
+    def resize(self, capacity):
+        """Change the capacity, keeping the newest values that still fit."""
+        values = self.view()[-capacity:].copy()
+        self.__init__(capacity, self.data.dtype)
+        self.extend(values)
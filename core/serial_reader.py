@@ -5,21 +5,51 @@ import logging
 import threading
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from core.latency_tracer import LatencyTracer
+
 class SerialReader(QObject):
     telemetry_received = pyqtSignal(dict)
     transmission_info_received = pyqtSignal(dict)
     connection_status_changed = pyqtSignal(bool)
+    startup_finished = pyqtSignal()
 
-    def __init__(self, port="COM7", baudrate=9600):
+    def __init__(self, port="COM7", baudrate=9600, connect=True):
         super().__init__()
         self.logger = logging.getLogger('HORUS_CSS.serial_reader')
         self.port = port
         self.baudrate = baudrate
         self.running = False
         self.thread = None
+        self.startup_thread = None
+        self.ser = None
         self.connected = False
+        # Counters read by the performance HUD
+        self.lines_read = 0
+        self.packets_received = 0
+        self.decode_errors = 0
+
+        if connect:
+            self.connect_serial()
+
+    def start_in_background(self, lora_config=None, is_config_selected=True):
+        """Open the port, configure the LoRa module (about 2 s of AT commands) and start
+        reading on a separate thread, so that the caller does not wait for it."""
+        def startup():
+            try:
+                if not self.connected:
+                    self.connect_serial()
+                if lora_config:
+                    self.LoraSet(lora_config, is_config_selected)
+                    self.logger.info(f"Konfiguracja LoRa ustawiona: {lora_config}")
+                self.start_reading()
+            finally:
+                self.startup_finished.emit()
+
+        self.startup_thread = threading.Thread(target=startup, name='SerialStartup', daemon=True)
+        self.startup_thread.start()
 
-        self.connect_serial()
+    def is_starting(self):
+        return self.startup_thread is not None and self.startup_thread.is_alive()
 
     def connect_serial(self):
         try:
@@ -52,6 +82,8 @@ class SerialReader(QObject):
         self.logger.info("Wątek odczytu szeregowego uruchomiony")
 
     def stop_reading(self):
+        if self.startup_thread and self.startup_thread.is_alive():
+            self.startup_thread.join(timeout=3.0)
         self.running = False
         if self.thread and self.thread.is_alive():
             self.logger.debug("Zatrzymywanie wątku odczytu szeregowego...")
@@ -63,9 +95,11 @@ class SerialReader(QObject):
         while self.running and self.ser and self.ser.is_open:
             try:
                 line = self.ser.readline().decode(errors='ignore').strip()
+                read_time = time.perf_counter()
                 if line:
+                    self.lines_read += 1
                     self.logger.debug(f"Odczytano linię z portu szeregowego: {line}")
-                    self.DecodeLine(line)
+                    self.DecodeLine(line, read_time)
                 else:
                     self.logger.debug("Odczytano pustą linię")
                 time.sleep(0.25)
@@ -73,8 +107,9 @@ class SerialReader(QObject):
                 self.logger.error(f"Błąd odczytu: {e}")
                 time.sleep(0.25)
 
-    def DecodeLine(self, line):
+    def DecodeLine(self, line, read_time=None):
         self.logger.debug(f"Odebrano linię: {line}")
+        trace = LatencyTracer.shared().start('serial', read_time)
         if line.startswith("+TEST: RX"):
             match = re.search(r'"([0-9A-Fa-f]+)"', line)
             if match:
@@ -87,6 +122,7 @@ class SerialReader(QObject):
                     data = decoded_string.split(";")
 
                     if len(data) < 7:
+                        self.decode_errors += 1
                         self.logger.warning(f"Niewystarczająca liczba danych: {data}")
                         return
 
@@ -110,8 +146,12 @@ class SerialReader(QObject):
                         f"LAT={telemetry['latitude']}, "
                         f"LON={telemetry['longitude']}")
 
+                    self.packets_received += 1
+                    trace.mark('decode')
+                    telemetry['_trace'] = trace
                     self.telemetry_received.emit(telemetry)
                 except Exception as e:
+                    self.decode_errors += 1
                     self.logger.error(f"Błąd dekodowania danych telemetrycznych: {e}")
             else:
                 self.logger.debug("Nie znaleziono danych hex w linii RX")
@@ -132,8 +172,11 @@ class SerialReader(QObject):
                         f"RSSI={transmission['rssi']}, "
                         f"SNR={transmission['snr']}")
 
+                    trace.mark('decode')
+                    transmission['_trace'] = trace
                     self.transmission_info_received.emit(transmission)
                 except Exception as e:
+                    self.decode_errors += 1
                     self.logger.warning(f"Błąd odczytu parametrów transmisji: {e}")
             else:
                 self.logger.debug("Nie rozpoznano formatu linii transmisyjnej")
@@ -0,0 +1,210 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+
+
+class SessionCatalog:
+    """Index of all sessions kept in ``sessions.sqlite`` in the HORUS_CSS directory.
+
+    Session ids come from an AUTOINCREMENT key, so creating a session does not
+    depend on how many ``session_N`` directories already exist. Each entry
+    also keeps a summary of the session (times, packet count, altitude range,
+    file sizes) so sessions can be browsed without opening their files.
+    """
+
+    BASE_NAME = "session"
+    FIELDS = ('id', 'directory', 'start_time', 'end_time', 'packets',
+              'min_altitude', 'max_altitude', 'size_bytes', 'files', 'closed')
+
+    def __init__(self, base_dir, filename='sessions.sqlite'):
+        self.logger = logging.getLogger('HORUS_CSS.session_catalog')
+        self.base_dir = base_dir
+        self.filename = os.path.join(base_dir, filename)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.filename, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        is_new = not self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='sessions'").fetchone()
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                directory TEXT NOT NULL,
+                start_time REAL,
+                end_time REAL,
+                packets INTEGER,
+                min_altitude REAL,
+                max_altitude REAL,
+                size_bytes INTEGER,
+                files TEXT,
+                closed INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS sessions_start_time ON sessions (start_time);
+        """)
+        if is_new:
+            self.import_existing_sessions()
+
+    def import_existing_sessions(self):
+        """One-time migration of ``session_N`` directories created before the catalog existed."""
+        pattern = re.compile(rf"^{self.BASE_NAME}_(\d+)$")
+        found = []
+        for name in os.listdir(self.base_dir):
+            match = pattern.match(name)
+            path = os.path.join(self.base_dir, name)
+            if match and os.path.isdir(path):
+                found.append((int(match.group(1)), path))
+
+        with self.lock, self.connection:
+            for session_id, path in sorted(found):
+                sizes = self.file_sizes(path)
+                stat = os.stat(path)
+                self.connection.execute(
+                    "INSERT INTO sessions (id, directory, start_time, end_time, size_bytes, files, closed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, 1)",
+                    (session_id, path, stat.st_ctime, stat.st_mtime,
+                     sum(sizes.values()), json.dumps(sizes)))
+        if found:
+            self.logger.info(f"Imported {len(found)} existing sessions into the catalog")
+
+    @staticmethod
+    def file_sizes(directory):
+        sizes = {}
+        for root, _, files in os.walk(directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    sizes[os.path.relpath(path, directory)] = os.path.getsize(path)
+                except OSError:
+                    pass
+        return sizes
+
+    def create_session(self):
+        while True:
+            with self.lock, self.connection:
+                cursor = self.connection.execute(
+                    "INSERT INTO sessions (directory, start_time) VALUES ('', ?)", (time.time(),))
+                session_id = cursor.lastrowid
+                directory = os.path.join(self.base_dir, f"{self.BASE_NAME}_{session_id}")
+                self.connection.execute("UPDATE sessions SET directory = ? WHERE id = ?",
+                                        (directory, session_id))
+            try:
+                os.makedirs(directory)
+                self.logger.info(f"Created session {session_id}: {directory}")
+                return session_id, directory
+            except FileExistsError:
+                # A directory left behind by a catalog that was deleted, skip its id
+                self.logger.warning(f"Session directory already exists, skipping: {directory}")
+                with self.lock, self.connection:
+                    self.connection.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def update_session(self, session_id, **fields):
+        if 'files' in fields and not isinstance(fields['files'], str):
+            fields['files'] = json.dumps(fields['files'])
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self.lock, self.connection:
+            self.connection.execute(f"UPDATE sessions SET {assignments} WHERE id = ?",
+                                    (*fields.values(), session_id))
+
+    def remove_session(self, session_id):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def _to_dict(self, row):
+        session = dict(zip(self.FIELDS, row))
+        session['files'] = json.loads(session['files']) if session['files'] else {}
+        return session
+
+    def get_session(self, session_id):
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT {', '.join(self.FIELDS)} FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list_sessions(self, limit=None):
+        query = f"SELECT {', '.join(self.FIELDS)} FROM sessions ORDER BY id DESC"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        with self.lock:
+            rows = self.connection.execute(query).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def previous_session(self, session_id):
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT {', '.join(self.FIELDS)} FROM sessions WHERE id < ? ORDER BY id DESC LIMIT 1",
+                (session_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def unclosed_sessions(self, current_id):
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT {', '.join(self.FIELDS)} FROM sessions WHERE closed = 0 AND id != ?",
+                (current_id,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def rebuild_summary(self, session, records=None):
+        """Fill in the summary of a session that ended without closing (crash, power loss)
+        from its recovered journal ``records`` (see ``TelemetryJournal.read_records``)."""
+        directory = session['directory']
+        if not os.path.isdir(directory):
+            self.remove_session(session['id'])
+            return
+
+        end_time = os.stat(directory).st_mtime
+        packets = min_altitude = max_altitude = None
+        if records is not None:
+            packets = 0
+            for record in records:
+                packets += 1
+                end_time = record.get('t', end_time)
+                altitude = record.get('data', {}).get('altitude')
+                if isinstance(altitude, (int, float)) and not isinstance(altitude, bool):
+                    if min_altitude is None or altitude < min_altitude:
+                        min_altitude = altitude
+                    if max_altitude is None or altitude > max_altitude:
+                        max_altitude = altitude
+
+        sizes = self.file_sizes(directory)
+        self.update_session(session['id'], end_time=end_time, packets=packets,
+                            min_altitude=min_altitude, max_altitude=max_altitude,
+                            size_bytes=sum(sizes.values()), files=sizes, closed=1)
+        self.logger.warning(f"Session {session['id']} was not closed cleanly, summary rebuilt")
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class SessionSummary:
+    """Storage handler keeping the catalog entry of the running session up to date."""
+
+    def __init__(self, catalog, session_id, directory):
+        self.catalog = catalog
+        self.session_id = session_id
+        self.directory = directory
+        self.packets = 0
+        self.min_altitude = None
+        self.max_altitude = None
+        self.closed = False
+
+    def write_row(self, data_dict):
+        self.packets += 1
+        altitude = data_dict.get('altitude')
+        if isinstance(altitude, (int, float)):
+            if self.min_altitude is None or altitude < self.min_altitude:
+                self.min_altitude = altitude
+            if self.max_altitude is None or altitude > self.max_altitude:
+                self.max_altitude = altitude
+
+    def close_file(self):
+        if self.closed:
+            return
+        self.closed = True
+        sizes = SessionCatalog.file_sizes(self.directory)
+        self.catalog.update_session(
+            self.session_id, end_time=time.time(), packets=self.packets,
+            min_altitude=self.min_altitude, max_altitude=self.max_altitude,
+            size_bytes=sum(sizes.values()), files=sizes, closed=1)
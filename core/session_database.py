@@ -0,0 +1,127 @@
+import time
+import sqlite3
+
+from core.config import Config
+from core.utils import Utils
+from core.background_writer import BackgroundWriter
+
+
+class SessionDatabase(BackgroundWriter):
+    """Per-session SQLite database with telemetry, transmission, events and terminal messages.
+
+    Rows are queued from any thread and inserted by the writer thread in one
+    transaction per batch. The database runs in WAL mode, so it can be queried
+    while the station is recording, e.g.::
+
+        SELECT time, rssi FROM telemetry WHERE status = 2 ORDER BY time;
+    """
+
+    def __init__(self, filename,
+                 flush_interval=Config.CSV_FLUSH_INTERVAL,
+                 flush_rows=Config.CSV_FLUSH_ROWS,
+                 fsync_interval=Config.CSV_FSYNC_INTERVAL):
+        super().__init__('SessionDatabaseWriter', flush_interval, flush_rows, fsync_interval,
+                         logger_name='HORUS_CSS.session_database')
+        self.filename = filename
+        self.telemetry_columns = list(Config.TELEMETRY_HEADER[1:])
+        self.connection = None
+        self.statements = {}
+        self.create_database()
+
+    def create_database(self):
+        try:
+            self.connection = sqlite3.connect(self.filename, check_same_thread=False,
+                                              isolation_level=None)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+
+            columns = ", ".join(f"{name} REAL" for name in self.telemetry_columns)
+            self.connection.executescript(f"""
+                CREATE TABLE IF NOT EXISTS telemetry (time REAL NOT NULL, {columns});
+                CREATE TABLE IF NOT EXISTS transmission (time REAL NOT NULL, len INTEGER,
+                                                         rssi INTEGER, snr INTEGER);
+                CREATE TABLE IF NOT EXISTS events (time REAL NOT NULL, kind TEXT NOT NULL, details TEXT);
+                CREATE TABLE IF NOT EXISTS terminal_messages (time REAL NOT NULL, message TEXT);
+                CREATE INDEX IF NOT EXISTS telemetry_time ON telemetry (time);
+                CREATE INDEX IF NOT EXISTS transmission_time ON transmission (time);
+                CREATE INDEX IF NOT EXISTS events_time ON events (time);
+                CREATE INDEX IF NOT EXISTS events_kind ON events (kind, time);
+                CREATE INDEX IF NOT EXISTS terminal_messages_time ON terminal_messages (time);
+            """)
+
+            placeholders = ", ".join("?" for _ in range(len(self.telemetry_columns) + 1))
+            self.statements = {
+                'telemetry': f"INSERT INTO telemetry (time, {', '.join(self.telemetry_columns)}) "
+                             f"VALUES ({placeholders})",
+                'transmission': "INSERT INTO transmission (time, len, rssi, snr) VALUES (?, ?, ?, ?)",
+                'events': "INSERT INTO events (time, kind, details) VALUES (?, ?, ?)",
+                'terminal_messages': "INSERT INTO terminal_messages (time, message) VALUES (?, ?)",
+            }
+            self.logger.info(f"Created session database: {self.filename}")
+            self.start_writer()
+        except Exception as e:
+            self.logger.error(f"Failed to create session database: {e}")
+            self.connection = None
+
+    @staticmethod
+    def _to_number(value):
+        if value is None or value == '':
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def write_row(self, data_dict):
+        if not self.connection:
+            return
+        self.submit(('telemetry', (time.time(), *[data_dict.get(key) for key in self.telemetry_columns])))
+
+    def write_transmission(self, transmission):
+        if not self.connection:
+            return
+        self.submit(('transmission', (time.time(), transmission.get('len'),
+                                      transmission.get('rssi'), transmission.get('snr'))))
+
+    def log_event(self, kind, details=None):
+        if not self.connection:
+            return
+        self.submit(('events', (time.time(), kind, None if details is None else str(details))))
+
+    def log_message(self, message):
+        if not self.connection:
+            return
+        self.submit(('terminal_messages', (time.time(), Utils.plain_text(message))))
+
+    def write_batch(self, items):
+        tables = {}
+        for table, values in items:
+            if table == 'telemetry':
+                values = (values[0], *[self._to_number(value) for value in values[1:]])
+            tables.setdefault(table, []).append(values)
+
+        self.connection.execute("BEGIN")
+        try:
+            for table, rows in tables.items():
+                self.connection.executemany(self.statements[table], rows)
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+    def sync(self):
+        self.connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close_file(self):
+        self.stop_writer()
+        if self.connection:
+            try:
+                self.connection.close()
+                self.logger.info("Session database closed")
+            except Exception as e:
+                self.logger.error(f"Error closing session database: {e}")
+            finally:
+                self.connection = None
+
+    def __del__(self):
+        self.close_file()
@@ -0,0 +1,278 @@
+import io
+import os
+import csv
+import gzip
+import json
+import time
+import logging
+import itertools
+
+import numpy as np
+
+from core.csv_handler import CsvHandler
+
+
+class SessionLoader:
+    """Bulk loader of a session's ``telemetry_data.csv`` into NumPy column arrays.
+
+    Rows are parsed in chunks by ``numpy.loadtxt`` and ISO timestamps are
+    converted with a single ``datetime64`` cast per chunk, so no Python code
+    runs per value. ``timestamp`` is returned as POSIX seconds (float64, the
+    same as ``ColumnStoreReader``), every other column as float64 with NaN
+    for empty fields.
+
+    The parsed session is cached as ``telemetry_data.npz`` beside the CSV and
+    reused as long as the CSV segments have not changed. ``load_time_range``
+    uses the ``.idx`` sidecars to read only a time window.
+    """
+
+    CACHE_FILE = 'telemetry_data.npz'
+    CHUNK_ROWS = 200000
+    INDEX_DTYPE = np.dtype([('timestamp', '<f8'), ('offset', '<u8')])
+
+    def __init__(self, session_dir, basename='telemetry_data.csv'):
+        self.logger = logging.getLogger('HORUS_CSS.session_loader')
+        self.session_dir = session_dir
+        self.basename = basename
+        self.cache_path = os.path.join(session_dir, self.CACHE_FILE)
+
+    @property
+    def files(self):
+        return CsvHandler.segment_files(self.session_dir, self.basename)
+
+    def signature(self):
+        """Identifies the exact set of CSV segments the cache was built from."""
+        signature = []
+        for path in self.files:
+            stat = os.stat(path)
+            signature.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+        return json.dumps(signature)
+
+    def load(self, use_cache=True):
+        start = time.perf_counter()
+        signature = self.signature()
+        if use_cache:
+            columns = self.read_cache(signature)
+            if columns is not None:
+                self.logger.info(f"Loaded {len(columns['timestamp'])} rows from cache "
+                                 f"{self.cache_path} in {time.perf_counter() - start:.2f} s")
+                return columns
+
+        parts = {}
+        for chunk in self.iter_chunks():
+            for name, values in chunk.items():
+                parts.setdefault(name, []).append(values)
+        columns = {name: np.concatenate(values) for name, values in parts.items()}
+        columns.setdefault('timestamp', np.empty(0))
+        self.logger.info(f"Parsed {len(columns['timestamp'])} rows from {self.session_dir} "
+                         f"in {time.perf_counter() - start:.2f} s")
+
+        if use_cache:
+            self.write_cache(columns, signature)
+        return columns
+
+    def iter_chunks(self, chunk_rows=CHUNK_ROWS):
+        """Yield ``{column: array}`` for at most ``chunk_rows`` rows at a time.
+
+        Only one chunk is held in memory, so sessions larger than RAM can be
+        processed in a streaming fashion.
+        """
+        for path in self.files:
+            yield from self.iter_file_chunks(path, chunk_rows)
+
+    def iter_file_chunks(self, path, chunk_rows=CHUNK_ROWS, offset=None):
+        """Like ``iter_chunks`` for one segment, optionally starting at byte ``offset`` of a row."""
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rb') as raw:
+            header_line = raw.readline().decode('utf-8')
+            if not header_line:
+                return
+            header = header_line.rstrip('\r\n').split(';')
+            if offset:
+                # gzip files seek forward by decompressing, which is still much
+                # cheaper than parsing the skipped rows
+                raw.seek(offset)
+            f = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+            while True:
+                lines = list(itertools.islice(f, chunk_rows))
+                if not lines:
+                    break
+                if not lines[-1].endswith('\n'):
+                    # A row torn by a crash, nothing can be recovered from it
+                    self.logger.warning(f"Skipping incomplete last row in {path}")
+                    lines.pop()
+                    if not lines:
+                        break
+                yield self.parse_lines(lines, header)
+
+    @staticmethod
+    def read_index(path):
+        """Sparse time index of a CSV segment written by ``CsvHandler`` (empty if missing)."""
+        index_path = CsvHandler.index_filename(path)
+        if not os.path.exists(index_path):
+            return np.empty(0, dtype=SessionLoader.INDEX_DTYPE)
+        index = np.fromfile(index_path, dtype=SessionLoader.INDEX_DTYPE)
+        if not path.endswith('.gz'):
+            # After a power loss the index may have reached the disk before the data
+            index = index[index['offset'] < os.path.getsize(path)]
+        return index
+
+    def load_time_range(self, start, end, chunk_rows=2000):
+        """Load only the rows with ``start <= timestamp <= end`` (POSIX seconds).
+
+        Each segment's index is binary-searched for the last entry before
+        ``start`` and reading starts at its byte offset, so the cost depends
+        on the size of the window, not on the position in the session.
+        """
+        parts = {}
+        done = False
+        for path in self.files:
+            index = self.read_index(path)
+            offset = None
+            if len(index):
+                if index['timestamp'][0] > end:
+                    break
+                position = int(np.searchsorted(index['timestamp'], start, side='right')) - 1
+                if position > 0:
+                    offset = int(index['offset'][position])
+
+            for chunk in self.iter_file_chunks(path, chunk_rows, offset):
+                timestamps = chunk['timestamp']
+                mask = (timestamps >= start) & (timestamps <= end)
+                for name, values in chunk.items():
+                    parts.setdefault(name, []).append(values[mask])
+                if len(timestamps) and timestamps[-1] > end:
+                    done = True
+                    break
+            if done:
+                break
+
+        if not parts and self.files:
+            parts = {name: [np.empty(0)] for name in self.read_header(self.files[0])}
+        columns = {name: np.concatenate(values) for name, values in parts.items()}
+        columns.setdefault('timestamp', np.empty(0))
+        return columns
+
+    def time_bounds(self):
+        """(first, last) timestamp of the session from the ``.idx`` sidecars,
+        reading only the rows after the last index entry, or ``None`` without an index."""
+        files = self.files
+        if not files:
+            return None
+        first_index = self.read_index(files[0])
+        if not len(first_index):
+            return None
+        for path in reversed(files):
+            index = self.read_index(path)
+            if not len(index):
+                continue
+            last = float(index['timestamp'][-1])
+            for chunk in self.iter_file_chunks(path, offset=int(index['offset'][-1])):
+                if len(chunk['timestamp']):
+                    last = float(chunk['timestamp'][-1])
+            return float(first_index['timestamp'][0]), last
+        return None
+
+    @staticmethod
+    def read_header(path):
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', newline='', encoding='utf-8') as f:
+            return f.readline().rstrip('\r\n').split(';')
+
+    @classmethod
+    def parse_lines(cls, lines, header):
+        try:
+            return cls._parse_vectorized(lines, header)
+        except ValueError:
+            # Something loadtxt does not accept (text in a numeric column,
+            # wrong field count): parse this chunk field by field instead.
+            return cls._parse_rows(lines, header)
+
+    @classmethod
+    def _parse_vectorized(cls, lines, header):
+        text = ''.join(lines).replace('\r\n', '\n')
+        # loadtxt cannot convert empty fields, mark them as missing
+        text = text.replace(';;', ';nan;').replace(';;', ';nan;').replace(';\n', ';nan\n')
+
+        columns = {}
+        if len(header) > 1:
+            values = np.loadtxt(io.StringIO(text), delimiter=';', dtype=np.float64,
+                                usecols=range(1, len(header)), ndmin=2, comments=None)
+            for index, name in enumerate(header[1:]):
+                columns[name] = values[:, index]
+
+        stamps = np.loadtxt(io.StringIO(text), delimiter=';', dtype=str,
+                            usecols=0, ndmin=1, comments=None)
+        columns[header[0]] = cls.to_posix(stamps.astype('datetime64[us]'))
+        return columns
+
+    @classmethod
+    def _parse_rows(cls, lines, header):
+        rows = list(csv.reader(lines, delimiter=';'))
+        columns = {}
+        for index, name in enumerate(header[1:], start=1):
+            values = np.full(len(rows), np.nan)
+            for row_index, row in enumerate(rows):
+                try:
+                    values[row_index] = float(row[index])
+                except (ValueError, IndexError):
+                    pass
+            columns[name] = values
+
+        stamps = np.empty(len(rows), dtype='datetime64[us]')
+        for row_index, row in enumerate(rows):
+            try:
+                stamps[row_index] = np.datetime64(row[0], 'us')
+            except (ValueError, IndexError):
+                stamps[row_index] = np.datetime64('NaT')
+        columns[header[0]] = cls.to_posix(stamps)
+        return columns
+
+    @staticmethod
+    def to_posix(stamps):
+        """Convert naive local ``datetime64`` values (as written by ``CsvHandler``) to POSIX seconds."""
+        naive = stamps.astype('datetime64[us]').astype(np.int64) / 1e6
+        naive[np.isnat(stamps)] = np.nan
+        valid = naive[~np.isnan(naive)]
+        if not len(valid):
+            return naive
+
+        def utc_offset(seconds):
+            whole = int(seconds)
+            # tm_isdst=-1 lets mktime decide whether DST applies at that wall-clock time
+            return whole - time.mktime(time.gmtime(whole)[:8] + (-1,))
+
+        first, last = utc_offset(valid.min()), utc_offset(valid.max())
+        if first == last:
+            return naive - first
+
+        # The chunk crosses a DST change: resolve the offset once per hour
+        hours = np.floor(naive / 3600)
+        unique_hours, inverse = np.unique(hours[~np.isnan(hours)], return_inverse=True)
+        offsets = np.array([utc_offset(hour * 3600) for hour in unique_hours])
+        result = np.full(len(naive), np.nan)
+        result[~np.isnan(naive)] = valid - offsets[inverse]
+        return result
+
+    def read_cache(self, signature):
+        if not os.path.exists(self.cache_path):
+            return None
+        try:
+            with np.load(self.cache_path, allow_pickle=False) as cache:
+                if str(cache['__signature__']) != signature:
+                    return None
+                return {name: cache[name] for name in cache.files if name != '__signature__'}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {self.cache_path}: {e}")
+            return None
+
+    def write_cache(self, columns, signature):
+        temporary = self.cache_path + '.tmp'
+        try:
+            with open(temporary, 'wb') as f:
+                np.savez(f, __signature__=np.array(signature), **columns)
+            os.replace(temporary, self.cache_path)
+        except Exception as e:
+            self.logger.warning(f"Could not write cache {self.cache_path}: {e}")
+            if os.path.exists(temporary):
+                os.remove(temporary)
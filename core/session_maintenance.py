@@ -0,0 +1,150 @@
+import os
+import time
+import gzip
+import queue
+import shutil
+import logging
+import threading
+import logging.handlers
+
+from core.config import Config
+
+
+class SegmentRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Log handler that closes ``name.log`` as ``name.<n>.log`` by size or age.
+
+    Closed segments are handed to ``on_rotated`` (e.g. for compression)
+    instead of being shifted through numbered backups like the standard
+    ``RotatingFileHandler`` does.
+    """
+
+    def __init__(self, filename, max_bytes=Config.LOG_ROTATE_BYTES,
+                 rotate_interval=Config.ROTATE_INTERVAL, on_rotated=None, encoding='utf-8'):
+        super().__init__(filename, mode='a', maxBytes=max_bytes, encoding=encoding)
+        self.rotate_interval = rotate_interval
+        self.on_rotated = on_rotated
+        self.segment = 0
+        self.segment_started = time.monotonic()
+
+    def shouldRollover(self, record):
+        if self.rotate_interval and time.monotonic() - self.segment_started >= self.rotate_interval:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        self.segment += 1
+        root, ext = os.path.splitext(self.baseFilename)
+        segment_path = f"{root}.{self.segment}{ext}"
+        if os.path.exists(self.baseFilename):
+            os.replace(self.baseFilename, segment_path)
+            if self.on_rotated:
+                self.on_rotated(segment_path)
+
+        self.segment_started = time.monotonic()
+        self.stream = self._open()
+
+
+class SessionMaintenance:
+    """Low-priority worker compressing closed segments and enforcing the retention policy.
+
+    Retention keeps at most ``max_sessions`` sessions and ``max_bytes`` of
+    session data, deleting the oldest sessions first. The running session is
+    never deleted.
+    """
+
+    _STOP = object()
+
+    def __init__(self, catalog, current_session_id,
+                 max_sessions=Config.RETENTION_MAX_SESSIONS,
+                 max_bytes=Config.RETENTION_MAX_BYTES,
+                 interval=Config.MAINTENANCE_INTERVAL):
+        self.logger = logging.getLogger('HORUS_CSS.session_maintenance')
+        self.catalog = catalog
+        self.current_session_id = current_session_id
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.queue = queue.Queue()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name='SessionMaintenance', daemon=True)
+        self.thread.start()
+        self.enforce_retention()
+
+    def stop(self):
+        if self.thread and self.thread.is_alive():
+            self.queue.put(self._STOP)
+            self.thread.join(timeout=5.0)
+        self.thread = None
+
+    def compress(self, path):
+        self.queue.put(('compress', path))
+
+    def enforce_retention(self):
+        self.queue.put(('retention', None))
+
+    def _lower_priority(self):
+        try:
+            # On Linux the nice value is per thread
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except (AttributeError, OSError):
+            pass
+
+    def _run(self):
+        self._lower_priority()
+        while True:
+            try:
+                task = self.queue.get(timeout=self.interval)
+            except queue.Empty:
+                task = ('retention', None)
+            if task is self._STOP:
+                return
+
+            action, argument = task
+            try:
+                if action == 'compress':
+                    self._compress_file(argument)
+                elif action == 'retention':
+                    self._apply_retention()
+            except Exception as e:
+                self.logger.error(f"Session maintenance task {action} failed: {e}")
+
+    def _compress_file(self, path):
+        if not os.path.exists(path):
+            return
+        target = path + '.gz'
+        temporary = target + '.tmp'
+        with open(path, 'rb') as source, gzip.open(temporary, 'wb', compresslevel=6) as destination:
+            shutil.copyfileobj(source, destination, 1024 * 1024)
+        os.replace(temporary, target)
+        os.remove(path)
+        self.logger.info(f"Compressed {path} ({os.path.getsize(target)} bytes)")
+
+    def _apply_retention(self):
+        sessions = self.catalog.list_sessions()
+        total = 0
+        kept = 0
+        over_limit = False
+        for session in sessions:
+            if session['id'] == self.current_session_id:
+                continue
+            size = session['size_bytes']
+            if size is None:
+                size = sum(self.catalog.file_sizes(session['directory']).values())
+
+            # sessions are listed newest first, everything past the limit goes
+            over_limit = over_limit or kept >= self.max_sessions - 1 or total + size > self.max_bytes
+            if not over_limit:
+                kept += 1
+                total += size
+                continue
+
+            shutil.rmtree(session['directory'], ignore_errors=True)
+            self.catalog.remove_session(session['id'])
+            self.logger.info(f"Retention policy removed session {session['id']} "
+                             f"({size} bytes): {session['directory']}")
@@ -0,0 +1,244 @@
+import os
+import time
+import logging
+from datetime import datetime
+
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from core.config import Config
+from core.column_store import ColumnStoreReader
+from core.session_loader import SessionLoader
+
+
+class SessionReplay(QObject):
+    """Re-drives ``ProcessData`` with telemetry recorded in a past session.
+
+    Records are fed from a timer on the GUI thread through the same processing
+    path as live data. Pass a ``ProcessData`` of its own (without storage), so
+    the replay shares neither ``current_data`` nor statistics with the live
+    processor. ``speed=None`` replays as fast as the GUI keeps up, which
+    doubles as a throughput benchmark of the pipeline. Only a window of the
+    session is held in memory and ``seek`` goes through the time index.
+    """
+
+    position_changed = pyqtSignal(float, float)
+    finished = pyqtSignal(dict)
+
+    TICK_INTERVAL = 10          # ms
+    WINDOW_SECONDS = 30.0       # s of a CSV session read at a time
+    MAX_SPEED_BUDGET = 0.015    # s spent feeding records per tick at max speed
+
+    # CSV column -> ProcessData key
+    TELEMETRY_KEYS = {
+        'velocity': 'ver_velocity',
+        'pitch': 'pitch',
+        'roll': 'roll',
+        'status': 'status',
+        'altitude': 'altitude',
+        'latitude': 'latitude',
+        'longitude': 'longitude',
+    }
+    TRANSMISSION_KEYS = ('len', 'rssi', 'snr')
+
+    def __init__(self, processor, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger('HORUS_CSS.session_replay')
+        self.processor = processor
+        self.session_dir = None
+        self.loader = None
+        self.columns = {}
+        self.timestamps = np.empty(0)
+        self.first = None
+        self.last = None
+        self.window_end = None
+        self.index = 0
+        self.speed = 1.0
+        self.paused = False
+        self.anchor_wall = 0.0
+        self.anchor_session = 0.0
+        self.started = 0.0
+        self.records_sent = 0
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+
+    def load(self, session_dir):
+        """Open ``session_dir`` for replay. The column store is memory-mapped; CSV
+        segments with a time index are read ``WINDOW_SECONDS`` at a time."""
+        self.loader = None
+        column_dir = os.path.join(session_dir, Config.COLUMN_STORE_DIRECTORY)
+        if os.path.exists(os.path.join(column_dir, 'schema.json')):
+            reader = ColumnStoreReader(column_dir)
+            self.set_window({name: reader[name] for name in reader.names})
+            source = column_dir
+        else:
+            loader = SessionLoader(session_dir)
+            bounds = loader.time_bounds()
+            if bounds is None:
+                # A session written before the time index existed
+                self.set_window(loader.load())
+            else:
+                self.loader = loader
+                self.first, self.last = bounds
+                self.load_window(self.first)
+            source = session_dir
+
+        if self.loader is None:
+            self.first = float(self.timestamps[0]) if len(self.timestamps) else None
+            self.last = float(self.timestamps[-1]) if len(self.timestamps) else None
+        self.session_dir = session_dir
+        self.logger.info(f"Opened {source} for replay ({self.duration:.1f} s)")
+        return self.loaded
+
+    def set_window(self, columns, end=None):
+        self.columns = columns
+        self.timestamps = columns.get('timestamp', np.empty(0))
+        self.window_end = end
+        self.index = 0
+
+    def load_window(self, start):
+        """Read the records from ``start`` on through the ``.idx`` time index."""
+        end = start + self.WINDOW_SECONDS
+        self.set_window(self.loader.load_time_range(start, end), end)
+
+    def next_window(self):
+        """Move on to the next window of a windowed session, ``False`` at its end."""
+        while self.loader is not None and self.window_end < self.last:
+            self.load_window(np.nextafter(self.window_end, np.inf))
+            if len(self.timestamps):
+                return True
+        return False
+
+    @property
+    def loaded(self):
+        return self.first is not None
+
+    @property
+    def duration(self):
+        if not self.loaded:
+            return 0.0
+        return self.last - self.first
+
+    def current_time(self):
+        if self.index < len(self.timestamps):
+            return float(self.timestamps[self.index])
+        return self.last if self.window_end is None else min(self.window_end, self.last)
+
+    @property
+    def position(self):
+        if not self.loaded:
+            return 0.0
+        return self.current_time() - self.first
+
+    def is_running(self):
+        return self.timer.isActive()
+
+    def start(self, speed=1.0):
+        if not self.loaded:
+            self.logger.warning("Nothing to replay")
+            return
+        self.speed = speed
+        self.paused = False
+        self.records_sent = 0
+        self.started = time.perf_counter()
+        self._set_anchor()
+        self.timer.start(0 if speed is None else self.TICK_INTERVAL)
+        self.logger.info(f"Replay started at speed {speed or 'max'}")
+
+    def set_speed(self, speed):
+        self.speed = speed
+        self._set_anchor()
+        if self.timer.isActive():
+            self.timer.setInterval(0 if speed is None else self.TICK_INTERVAL)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+        self._set_anchor()
+
+    def seek(self, seconds):
+        """Jump to ``seconds`` after the first record using the time index."""
+        if not self.loaded:
+            return
+        target = self.first + max(0.0, seconds)
+        if self.loader is not None:
+            # Binary search of the .idx sidecars, then a read from that byte offset
+            self.load_window(target)
+            if not len(self.timestamps):
+                self.next_window()
+        else:
+            # Binary search of the memory-mapped timestamp column
+            self.index = int(np.searchsorted(self.timestamps, target, side='left'))
+        self._set_anchor()
+        self.position_changed.emit(self.position, self.duration)
+
+    def stop(self):
+        if self.timer.isActive():
+            self.timer.stop()
+            self._finish()
+
+    def _set_anchor(self):
+        self.anchor_wall = time.perf_counter()
+        if self.loaded:
+            self.anchor_session = self.current_time()
+
+    def at_end(self):
+        return self.index >= len(self.timestamps) and not self.next_window()
+
+    def tick(self):
+        if self.paused:
+            return
+
+        if self.speed is None:
+            deadline = time.perf_counter() + self.MAX_SPEED_BUDGET
+            while time.perf_counter() < deadline and not self.at_end():
+                self.send_record(self.index)
+                self.index += 1
+        else:
+            session_time = self.anchor_session + (time.perf_counter() - self.anchor_wall) * self.speed
+            while True:
+                end = int(np.searchsorted(self.timestamps, session_time, side='right'))
+                while self.index < end:
+                    self.send_record(self.index)
+                    self.index += 1
+                if self.index < len(self.timestamps) or self.at_end():
+                    break
+
+        self.position_changed.emit(self.position, self.duration)
+        if self.at_end():
+            self.timer.stop()
+            self._finish()
+
+    def send_record(self, index):
+        telemetry = {}
+        for column, key in self.TELEMETRY_KEYS.items():
+            if column in self.columns:
+                value = self.columns[column][index]
+                if not np.isnan(value):
+                    telemetry[key] = int(value) if key == 'status' else float(value)
+        transmission = {}
+        for column in self.TRANSMISSION_KEYS:
+            if column in self.columns and not np.isnan(self.columns[column][index]):
+                transmission[column] = float(self.columns[column][index])
+
+        data = {
+            'timestamp': datetime.fromtimestamp(self.timestamps[index]).isoformat(),
+            'telemetry': telemetry,
+            'transmission': transmission,
+        }
+        self.processor.on_ethernet_data_received(data, persist=False)
+        self.records_sent += 1
+
+    def _finish(self):
+        elapsed = time.perf_counter() - self.started
+        stats = {
+            'records': self.records_sent,
+            'elapsed': elapsed,
+            'rate': self.records_sent / elapsed if elapsed > 0 else 0.0,
+            'speed': self.speed,
+        }
+        self.logger.info(f"Replay finished: {stats}")
+        self.finished.emit(stats)
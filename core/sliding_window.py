@@ -0,0 +1,63 @@
+import math
+from collections import deque
+
+
+class SlidingWindowExtrema:
+    """Minimum and maximum of the samples of the last ``window`` seconds.
+
+    Two monotonic deques keep only the samples that can still become the
+    minimum (increasing values) or the maximum (decreasing values) of the
+    window. Every sample is pushed and expired at most once, so ``push`` and
+    ``expire`` are amortized O(1) and ``min``/``max`` are O(1). Timestamps
+    must not decrease; NaN values are ignored.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.minima = deque()
+        self.maxima = deque()
+        self.newest = None
+
+    def __len__(self):
+        return len(self.minima)
+
+    def clear(self):
+        self.minima.clear()
+        self.maxima.clear()
+        self.newest = None
+
+    def push(self, timestamp, value):
+        if value is None or math.isnan(value):
+            return
+        while self.minima and self.minima[-1][1] >= value:
+            self.minima.pop()
+        self.minima.append((timestamp, value))
+        while self.maxima and self.maxima[-1][1] <= value:
+            self.maxima.pop()
+        self.maxima.append((timestamp, value))
+        self.newest = timestamp
+        self.expire(timestamp - self.window)
+
+    def push_many(self, timestamps, values):
+        for timestamp, value in zip(timestamps, values):
+            self.push(float(timestamp), float(value))
+
+    def expire(self, oldest):
+        """Drop samples older than ``oldest``."""
+        while self.minima and self.minima[0][0] < oldest:
+            self.minima.popleft()
+        while self.maxima and self.maxima[0][0] < oldest:
+            self.maxima.popleft()
+
+    def rebuild(self, timestamps, values, window=None):
+        """Restart from the given samples, e.g. after the window was enlarged."""
+        if window is not None:
+            self.window = window
+        self.clear()
+        self.push_many(timestamps, values)
+
+    def min(self):
+        return self.minima[0][1] if self.minima else None
+
+    def max(self):
+        return self.maxima[0][1] if self.maxima else None
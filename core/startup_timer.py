@@ -0,0 +1,36 @@
+import time
+import logging
+
+
+class StartupTimer:
+    """Durations of the startup phases, measured from ``started``.
+
+    Phases are recorded by ``mark`` (each name once) and logged later by
+    ``report``, so they can be marked before logging is configured.
+    """
+
+    def __init__(self, started=None):
+        self.logger = logging.getLogger('HORUS_CSS.startup')
+        self.started = started if started is not None else time.perf_counter()
+        self.last = self.started
+        self.phases = {}
+        self.reported = 0
+
+    def mark(self, phase):
+        if phase in self.phases:
+            return
+        now = time.perf_counter()
+        self.phases[phase] = (now - self.last, now - self.started)
+        self.last = now
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def report(self):
+        """Log the phases marked since the previous report."""
+        for phase, (duration, total) in list(self.phases.items())[self.reported:]:
+            self.logger.info(f"Startup phase '{phase}': {duration * 1000:.0f} ms (at {total * 1000:.0f} ms)")
+        self.reported = len(self.phases)
+
+    def summary(self):
+        return {phase: round(duration * 1000, 1) for phase, (duration, _) in self.phases.items()}
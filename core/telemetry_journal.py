@@ -0,0 +1,140 @@
+import os
+import json
+import time
+import zlib
+import struct
+import logging
+
+from core.config import Config
+from core.background_writer import BackgroundWriter
+
+
+class TelemetryJournal(BackgroundWriter):
+    """Append-only, checksummed telemetry journal with group-commit fsync.
+
+    File layout: an 8 byte magic followed by records of
+    ``<uint32 length><uint32 crc32><length bytes of JSON>``.
+
+    Records are written and fsynced together every ``commit_interval``
+    seconds, so after a power loss at most the last ``commit_interval``
+    seconds (plus the duration of one write) of telemetry are lost. A record
+    that was only partially written is detected by its length or checksum
+    and cut off by ``recover`` on the next start.
+    """
+
+    MAGIC = b'HORUSJ1\n'
+    RECORD_HEADER = struct.Struct('<II')
+
+    def __init__(self, filename, commit_interval=Config.JOURNAL_COMMIT_INTERVAL):
+        super().__init__('TelemetryJournalWriter', commit_interval,
+                         float('inf'), commit_interval, logger_name='HORUS_CSS.telemetry_journal')
+        self.filename = filename
+        self.file = None
+        self.create_journal()
+
+    def create_journal(self):
+        try:
+            self.file = open(self.filename, 'ab')
+            if self.file.tell() == 0:
+                self.file.write(self.MAGIC)
+                self.fsync_file(self.file)
+            self.logger.info(f"Created telemetry journal: {self.filename}")
+            self.start_writer()
+        except Exception as e:
+            self.logger.error(f"Failed to create telemetry journal: {e}")
+            self.file = None
+
+    def write_row(self, data_dict):
+        if not self.file:
+            return
+        self.submit((time.time(), {key: value for key, value in data_dict.items()
+                                   if not key.startswith('_')}))
+
+    def write_batch(self, items):
+        chunks = []
+        for timestamp, data in items:
+            payload = json.dumps({'t': timestamp, 'data': data}, default=str).encode('utf-8')
+            chunks.append(self.RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+            chunks.append(payload)
+        self.file.write(b''.join(chunks))
+
+    def flush(self):
+        self.file.flush()
+
+    def sync(self):
+        self.fsync_file(self.file)
+
+    def close_file(self):
+        self.stop_writer()
+        if self.file:
+            try:
+                self.file.close()
+                self.logger.info("Telemetry journal closed")
+            except Exception as e:
+                self.logger.error(f"Error closing telemetry journal: {e}")
+            finally:
+                self.file = None
+
+    def __del__(self):
+        self.close_file()
+
+    @classmethod
+    def _scan(cls, file):
+        """Yield ``(record, end_offset)`` for every intact record."""
+        if file.read(len(cls.MAGIC)) != cls.MAGIC:
+            return
+        offset = len(cls.MAGIC)
+        while True:
+            header = file.read(cls.RECORD_HEADER.size)
+            if len(header) < cls.RECORD_HEADER.size:
+                return
+            length, checksum = cls.RECORD_HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                return
+            try:
+                record = json.loads(payload)
+            except ValueError:
+                return
+            offset += cls.RECORD_HEADER.size + length
+            yield record, offset
+
+    @classmethod
+    def read_records(cls, filename):
+        with open(filename, 'rb') as f:
+            for record, _ in cls._scan(f):
+                yield record
+
+    @classmethod
+    def recover(cls, filename):
+        """Truncate a torn tail left by a crash. Returns ``(records, truncated_bytes)``."""
+        logger = logging.getLogger('HORUS_CSS.telemetry_journal')
+        if not os.path.exists(filename):
+            return 0, 0
+
+        size = os.path.getsize(filename)
+        count = 0
+        valid_end = 0
+        with open(filename, 'rb') as f:
+            magic = f.read(len(cls.MAGIC))
+            if len(magic) == len(cls.MAGIC):
+                if magic != cls.MAGIC:
+                    logger.error(f"Not a telemetry journal, skipping recovery: {filename}")
+                    return 0, 0
+                valid_end = len(cls.MAGIC)
+            f.seek(0)
+            for _, offset in cls._scan(f):
+                count += 1
+                valid_end = offset
+
+        truncated = size - valid_end
+        if truncated:
+            with open(filename, 'r+b') as f:
+                f.truncate(valid_end)
+                f.flush()
+                os.fsync(f.fileno())
+            logger.warning(f"Recovered journal {filename}: {count} records kept, "
+                           f"{truncated} torn bytes truncated")
+        else:
+            logger.info(f"Journal {filename} is intact ({count} records)")
+        return count, truncated
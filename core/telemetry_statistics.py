@@ -0,0 +1,251 @@
+import math
+import time
+import bisect
+import threading
+from collections import deque
+from datetime import datetime
+
+from core.config import Config
+from core.sliding_window import SlidingWindowExtrema
+
+
+class P2Quantile:
+    """Streaming estimate of the ``p`` quantile with the P² algorithm
+    (Jain & Chlamtac, 1985): five markers, O(1) time and memory per sample."""
+
+    def __init__(self, p):
+        self.p = p
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value):
+        heights = self.heights
+        if len(heights) < 5:
+            bisect.insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect.bisect_right(heights, value) - 1
+        for i in range(cell + 1, 5):
+            self.positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        positions = self.positions
+        for i in (1, 2, 3):
+            delta = self.desired[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (delta <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if delta > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        h, n = self.heights, self.positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self):
+        if not self.heights:
+            return None
+        if len(self.heights) < 5:
+            return self.heights[round(self.p * (len(self.heights) - 1))]
+        return self.heights[2]
+
+
+class RunningStatistics:
+    """Count, extremes, Welford mean/variance and P² quantiles of a whole channel."""
+
+    def __init__(self, quantiles=Config.STATISTICS_QUANTILES):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.first_time = None
+        self.last_time = None
+        self.last_value = None
+        self.quantiles = {p: P2Quantile(p) for p in quantiles}
+
+    def add(self, timestamp, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if self.first_time is None:
+            self.first_time = timestamp
+        self.last_time = timestamp
+        self.last_value = value
+        for quantile in self.quantiles.values():
+            quantile.add(value)
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / self.count) if self.count else None
+
+    @property
+    def sample_rate(self):
+        """Samples per second over the whole session."""
+        if self.count < 2 or self.last_time <= self.first_time:
+            return None
+        return (self.count - 1) / (self.last_time - self.first_time)
+
+    def summary(self):
+        summary = {
+            'count': self.count,
+            'min': self.minimum,
+            'max': self.maximum,
+            'mean': self.mean if self.count else None,
+            'std': self.std,
+            'last': self.last_value,
+            'sample_rate': self.sample_rate,
+        }
+        for p, quantile in self.quantiles.items():
+            summary[f"p{round(p * 100):02d}"] = quantile.value()
+        return summary
+
+
+class WindowStatistics:
+    """Mean, standard deviation, extremes and rates of the last ``window`` seconds.
+
+    Samples enter and leave the Welford moments once each and the extremes
+    come from ``SlidingWindowExtrema``, so every update is amortized O(1).
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.samples = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.extrema = SlidingWindowExtrema(window)
+
+    def __len__(self):
+        return len(self.samples)
+
+    def add(self, timestamp, value):
+        self.samples.append((timestamp, value))
+        delta = value - self.mean
+        self.mean += delta / len(self.samples)
+        self.m2 += delta * (value - self.mean)
+        self.extrema.push(timestamp, value)
+        self.expire(timestamp - self.window)
+
+    def expire(self, oldest):
+        while self.samples and self.samples[0][0] < oldest:
+            _, value = self.samples.popleft()
+            if not self.samples:
+                self.mean = self.m2 = 0.0
+                continue
+            delta = value - self.mean
+            self.mean -= delta / len(self.samples)
+            self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+        self.extrema.expire(oldest)
+
+    def summary(self):
+        count = len(self.samples)
+        summary = {
+            'count': count,
+            'min': self.extrema.min(),
+            'max': self.extrema.max(),
+            'mean': self.mean if count else None,
+            'std': math.sqrt(self.m2 / count) if count else None,
+            'sample_rate': None,
+            'rate': None,
+        }
+        if count > 1:
+            (first_time, first_value), (last_time, last_value) = self.samples[0], self.samples[-1]
+            if last_time > first_time:
+                summary['sample_rate'] = (count - 1) / (last_time - first_time)
+                # change per second, e.g. the climb rate of the altitude
+                summary['rate'] = (last_value - first_value) / (last_time - first_time)
+        return summary
+
+
+class ChannelStatistics:
+    def __init__(self, name, windows=Config.STATISTICS_WINDOWS):
+        self.name = name
+        self.session = RunningStatistics()
+        self.windows = {window: WindowStatistics(window) for window in windows}
+
+    def add(self, timestamp, value):
+        self.session.add(timestamp, value)
+        for window in self.windows.values():
+            window.add(timestamp, value)
+
+    def summary(self):
+        summary = {'session': self.session.summary()}
+        for window, statistics in self.windows.items():
+            summary[f"last_{window:g}s"] = statistics.summary()
+        return summary
+
+
+class TelemetryStatistics:
+    """Whole-session and sliding-window statistics of every numeric telemetry field.
+
+    ``update`` is fed the fields of every received packet (``ProcessData``
+    does it, from the network thread for TCP) and costs O(1) per field, so
+    ``summary`` is always ready without looking at the stored history.
+    """
+
+    EXCLUDED = ('timestamp', 'status')
+
+    def __init__(self, windows=Config.STATISTICS_WINDOWS):
+        self.windows = tuple(windows)
+        self.lock = threading.Lock()
+        self.channels = {}
+        self.records = 0
+
+    @staticmethod
+    def record_time(data):
+        timestamp = data.get('timestamp')
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
+        if isinstance(timestamp, str):
+            try:
+                return datetime.fromisoformat(timestamp).timestamp()
+            except ValueError:
+                pass
+        return time.time()
+
+    def update(self, data):
+        timestamp = self.record_time(data)
+        with self.lock:
+            self.records += 1
+            for name, value in data.items():
+                if name in self.EXCLUDED or isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                if math.isnan(value):
+                    continue
+                channel = self.channels.get(name)
+                if channel is None:
+                    channel = self.channels[name] = ChannelStatistics(name, self.windows)
+                channel.add(timestamp, float(value))
+
+    def channel(self, name):
+        """``ChannelStatistics`` of a field, or ``None`` before its first value."""
+        return self.channels.get(name)
+
+    def summary(self):
+        with self.lock:
+            return {name: channel.summary() for name, channel in self.channels.items()}
+
+    def reset(self):
+        with self.lock:
+            self.channels = {}
+            self.records = 0
@@ -1,9 +1,14 @@
 import os
+import re
+import html
 import logging
+from core.session_catalog import SessionCatalog
 
 class Utils:
 
     session_path = None
+    session_id = None
+    catalog = None
 
     def __init__(self):
         pass
@@ -22,16 +27,18 @@ class Utils:
     @staticmethod
     def create_session_directory():
         base_dir = Utils.get_appdata_path()
-        base_name = "session"
-        counter = 1
-        session_dir = os.path.join(base_dir,
-                                   f"{base_name}_{counter}")
+        if Utils.catalog is None:
+            Utils.catalog = SessionCatalog(base_dir)
 
-        while os.path.exists(session_dir):
-            counter += 1
-            session_dir = os.path.join(base_dir,
-                                       f"{base_name}_{counter}")
-
-        os.makedirs(session_dir)
+        session_id, session_dir = Utils.catalog.create_session()
+        Utils.session_id = session_id
         Utils.session_path = session_dir
-        return session_dir
\ No newline at end of file
+        return session_dir
+
+    @staticmethod
+    def plain_text(message):
+        """Terminal ``message`` without its HTML markup: ``<br>`` becomes a line
+        break, other tags are dropped and entities such as ``&nbsp;`` decoded."""
+        text = re.sub(r'<br\s*/?>', '\n', str(message), flags=re.IGNORECASE)
+        text = re.sub(r'<[^>]+>', '', text)
+        return html.unescape(text).replace('\xa0', ' ')
@@ -1,16 +1,36 @@
+import time
+
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QVBoxLayout, QWidget
 from PyQt6.QtGui import QColor, QPen
 from datetime import datetime
 
-from pyqtgraph.exporters import ImageExporter, SVGExporter
+from core.config import Config
+from core.minmax_pyramid import MinMaxPyramid
+from core.plot_archive import PlotArchive
+from core.sliding_window import SlidingWindowExtrema
+from gui.render_scheduler import RenderScheduler
+
+
+class PlotSeries:
+	"""One curve of a ``LivePlot``, drawn from channel ``channel`` of its history."""
+
+	def __init__(self, name, color, channel, curve, extrema):
+		self.name = name
+		self.color = color
+		self.channel = channel
+		self.curve = curve
+		self.extrema = extrema
 
 
 class LivePlot(QWidget):
-	def __init__(self, timespan, parent=None, line_color='#1f77b4'):
+	def __init__(self, timespan, parent=None, line_color='#1f77b4',
+				 history_length=Config.PLOT_HISTORY_LENGTH, scheduler=None, time_base=None):
 		super().__init__(parent)
 
+		self.scheduler = scheduler or RenderScheduler.shared()
+
 		self.plot_widget = pg.PlotWidget()
 		self.plot_widget.setBackground(QColor(32, 36, 44))
 		self.plot_widget.setLabel('left', 'Value')
@@ -20,7 +40,6 @@ class LivePlot(QWidget):
 		self.plot_widget.setMenuEnabled(False)
 		self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
 
-		self.line_color = line_color
 		self.line_style = 'Solid'
 		self.line_width = 2
 		self.data_markers_visible = True
@@ -28,25 +47,42 @@ class LivePlot(QWidget):
 		self.legend_visible = True
 		self.auto_zoom_enabled = True
 
-		self.curve = self.plot_widget.plot(
-			pen=self.create_pen(),
-			symbol='o' if self.data_markers_visible else None,
-			symbolSize=4,
-			symbolBrush=self.line_color,
-			name='Data Stream',
-		)
-
 		if self.legend_visible:
 			self.plot_widget.addLegend()
 
-		self.timestamps = np.array([], dtype=np.float64)
-		self.values = np.array([], dtype=np.float64)
+		if time_base is None:
+			self.history_length = history_length
+			self.history = self.create_history(history_length)
+			# Plots drawing from the same ``history``, each from channels of its own
+			self.time_base = [self]
+			channel = 0
+		else:
+			# One timestamp buffer for this plot and ``time_base`` (see ``add_time_base_sample``)
+			self.history_length = time_base.history_length
+			self.history = time_base.history
+			self.time_base = time_base.time_base
+			self.time_base.append(self)
+			channel = self.history.add_channel()
+		self.rendering = False
+		self.updating_view = False
+		# Counters read by the performance HUD
+		self.samples_added = 0
+		self.renders = 0
+		self.render_seconds = 0.0
+		self.zoom_requested = False
+		self.view_requested = False
 
 		self.min_time = None
-		self.min_value = float('inf')
-		self.max_value = float('-inf')
 		self.timespan = timespan
 
+		# Full history on disk, for the time before the oldest sample in ``history``
+		self.archive = None
+		self.archive_start = None
+
+		# Curves drawn from the channels of ``history``, all on its time base
+		self.series = [PlotSeries('Data Stream', line_color, channel, self.create_curve('Data Stream', line_color),
+								  SlidingWindowExtrema(timespan))]
+
 		layout = QVBoxLayout()
 		layout.addWidget(self.plot_widget)
 		self.setLayout(layout)
@@ -57,25 +93,134 @@ class LivePlot(QWidget):
 		self.crosshair_h = pg.InfiniteLine(angle=0, movable=False,
 										   pen=pg.mkPen('w', width=1))
 		self.coord_label = pg.TextItem(anchor=(0, 1), color='w', fill=pg.mkColor(0, 0, 0, 150))
+		# Last mouse position, handled once per frame
+		self.cursor_pos = None
+		self.linked_plots = []
 
 		self.toggle_crosshair(False)
 
 		self.plot_widget.scene().sigMouseMoved.connect(self.mouse_moved)
+		self.plot_widget.plotItem.vb.sigXRangeChanged.connect(self.on_x_range_changed)
+
+	@property
+	def curve(self):
+		return self.series[0].curve
 
-	def create_pen(self):
+	@property
+	def window_extrema(self):
+		return self.series[0].extrema
+
+	def create_pen(self, color=None):
 		return pg.mkPen(
-			color=self.line_color,
+			color=color or self.line_color,
 			width=self.line_width,
 		)
 
+	def create_curve(self, name, color):
+		return self.plot_widget.plot(
+			pen=self.create_pen(color),
+			symbol='o' if self.data_markers_visible else None,
+			symbolSize=4,
+			symbolBrush=color,
+			name=name,
+		)
+
+	def add_series(self, name, line_color='#1f77b4'):
+		"""Add a curve sharing the time base of the plot. Returns its index.
+
+		Samples recorded before the series existed are NaN and not drawn.
+		"""
+		if self.find_series(name) is not None:
+			raise ValueError(f"Series {name!r} already exists")
+		channel = self.history.add_channel()
+		series = PlotSeries(name, line_color, channel, self.create_curve(name, line_color),
+							SlidingWindowExtrema(self.timespan))
+		self.series.append(series)
+		if self.archive is not None and len(self.series) > self.archive.series_count:
+			self.archive.add_series()
+		self.request_render()
+		return len(self.series) - 1
+
+	def find_series(self, name):
+		for index, series in enumerate(self.series):
+			if series.name == name:
+				return index
+		return None
+
+	def series_index(self, series):
+		"""Index of a series given by index or name."""
+		if isinstance(series, str):
+			index = self.find_series(series)
+			if index is None:
+				raise KeyError(series)
+			return index
+		return series
+
+	def attach_archive(self, directory, previous=None):
+		"""Record every new sample to a ``PlotArchive`` in ``directory`` and draw
+		the time before the in-memory history from it. An existing archive is
+		continued; the archive in ``previous`` (of an earlier session) is only
+		read and drawn before the first sample of ``directory``."""
+		self.detach_archive()
+		self.archive = PlotArchive(directory, len(self.series), previous=previous)
+		self.archive_start = None
+		self.request_render()
+		return self.archive
+
+	def detach_archive(self):
+		if self.archive is not None:
+			self.archive.close()
+			self.archive = None
+
+	def archive_window(self, start, end):
+		"""Part of [start, end] drawn from the archive, or ``None``."""
+		if self.archive is None:
+			return None
+		if len(self.history):
+			# At full resolution up to the oldest raw sample kept in memory
+			end = min(end, self.history.times.view()[0])
+		if self.archive_start is not None:
+			start = max(start, self.archive_start)
+		return (start, end) if start < end else None
+
+	def time_range(self):
+		"""(oldest, newest) timestamp of the samples that can be shown, or ``None``."""
+		ranges = []
+		if len(self.history):
+			ranges.append(self.history.time_range())
+		if self.archive is not None:
+			archived = self.archive.time_range()
+			if archived is not None and self.archive_start is not None:
+				archived = (max(archived[0], self.archive_start), archived[1])
+			if archived is not None and archived[0] <= archived[1]:
+				ranges.append(archived)
+		if not ranges:
+			return None
+		return min(low for low, _ in ranges), max(high for _, high in ranges)
+
+	def link_x(self, other):
+		"""Share the X axis (time range) and the crosshair with another ``LivePlot``."""
+		self.plot_widget.setXLink(other.plot_widget)
+		if other not in self.linked_plots:
+			self.linked_plots.append(other)
+			other.linked_plots.append(self)
+
+	def linked_group(self):
+		"""This plot and every plot linked to it, directly or through others."""
+		group = [self]
+		for plot in group:
+			group.extend(linked for linked in plot.linked_plots if linked not in group)
+		return group
+
 	def update_pen(self):
-		self.curve.setPen(self.create_pen())
-		if self.data_markers_visible:
-			self.curve.setSymbol('o')
-			self.curve.setSymbolSize(4)
-			self.curve.setSymbolBrush(self.line_color)
-		else:
-			self.curve.setSymbol(None)
+		for series in self.series:
+			series.curve.setPen(self.create_pen(series.color))
+			if self.data_markers_visible:
+				series.curve.setSymbol('o')
+				series.curve.setSymbolSize(4)
+				series.curve.setSymbolBrush(series.color)
+			else:
+				series.curve.setSymbol(None)
 
 		self.plot_widget.showGrid(x=self.grid_visible, y=self.grid_visible, alpha=0.3)
 
@@ -87,37 +232,245 @@ class LivePlot(QWidget):
 
 	def update_timespan(self, timespan):
 		self.timespan = timespan
+		self.rebuild_window_extrema()
 		self.zoom_to_data()
 
+	def rebuild_window_extrema(self):
+		timestamps = self.timestamps
+		if len(timestamps):
+			first = np.searchsorted(timestamps, timestamps[-1] - self.timespan, side='left')
+		else:
+			first = 0
+		for series in self.series:
+			values = self.history.channels[series.channel].view()
+			series.extrema.rebuild(timestamps[first:], values[first:], self.timespan)
+
+	def window_range(self):
+		"""(minimum, maximum) of all series over the auto-zoom window, or ``None``."""
+		minima = [series.extrema.min() for series in self.series if len(series.extrema)]
+		if not minima:
+			return None
+		maxima = [series.extrema.max() for series in self.series if len(series.extrema)]
+		return min(minima), max(maxima)
+
+	@property
+	def min_value(self):
+		"""Minimum over the auto-zoom window (the last ``timespan`` seconds)."""
+		value_range = self.window_range()
+		return float('inf') if value_range is None else value_range[0]
+
+	@property
+	def max_value(self):
+		value_range = self.window_range()
+		return float('-inf') if value_range is None else value_range[1]
+
 	def set_x_label(self, label):
 		self.plot_widget.setLabel('bottom', label)
 
 	def set_y_label(self, label):
 		self.plot_widget.setLabel('left', label)
 
-	def add_point(self, timestamp, value):
+	@staticmethod
+	def create_history(history_length):
+		return MinMaxPyramid(history_length, Config.PLOT_PYRAMID_FACTOR, Config.PLOT_PYRAMID_LEVELS)
+
+	@property
+	def timestamps(self):
+		"""Raw samples of the finest history level, older ones are only kept as min/max buckets."""
+		return self.history.times.view()
+
+	@property
+	def values(self):
+		return self.series_values(0)
+
+	def series_values(self, series=0):
+		"""Raw values of a series (index or name), aligned with ``timestamps``."""
+		return self.history.channels[self.series[self.series_index(series)].channel].view()
+
+	def set_history_length(self, history_length):
+		"""Resize the history, of every plot on the shared time base."""
+		timestamps = self.timestamps.copy()
+		values = np.column_stack([raw.view() for raw in self.history.channels])
+		history = self.create_history(history_length)
+		for _ in self.history.channels[1:]:
+			history.add_channel()
+		history.extend(timestamps, values)
+		for plot in self.time_base:
+			plot.history_length = history_length
+			plot.history = history
+			plot.update_plot()
+
+	def sample_row(self, values):
+		"""One value per series from a sequence or a ``{name: value}`` dict, NaN where missing."""
+		row = [np.nan] * len(self.series)
+		if isinstance(values, dict):
+			for name, value in values.items():
+				index = self.find_series(name)
+				if index is not None and value is not None:
+					row[index] = float(value)
+		else:
+			for index, value in enumerate(values):
+				row[index] = np.nan if value is None else float(value)
+		return row
+
+	def sample_columns(self, values):
+		"""(samples, series) array from values of the first series or of the first few series."""
+		values = np.asarray(values, dtype=np.float64)
+		if values.ndim == 1:
+			values = values[:, np.newaxis]
+		if values.shape[1] < len(self.series):
+			padding = np.full((len(values), len(self.series) - values.shape[1]), np.nan)
+			values = np.hstack((values, padding))
+		return values
+
+	def channel_columns(self, values):
+		"""(samples, history channels) array with ``values`` (samples, series) in the
+		channels of this plot's series and NaN in those of the other plots on the time base."""
+		if len(self.time_base) == 1:
+			return values
+		columns = np.full((len(values), len(self.history.channels)), np.nan)
+		columns[:, [series.channel for series in self.series]] = values
+		return columns
+
+	def add_sample(self, timestamp, values):
+		"""Append one sample of every series, see ``sample_row``."""
+		self.add_time_base_sample(timestamp, {self: values})
+
+	def add_time_base_sample(self, timestamp, samples):
+		"""Append one sample to the shared time base, its timestamp stored once.
+
+		``samples`` maps plots of ``time_base`` to their values (see ``sample_row``),
+		the plots not in it get NaN.
+		"""
 		if isinstance(timestamp, datetime):
 			ts = timestamp.timestamp()
-		elif isinstance(timestamp, float):
+		else:
 			ts = timestamp
+
+		rows = {plot: plot.sample_row(samples.get(plot, ())) for plot in self.time_base}
+		if len(self.time_base) == 1:
+			self.history.append(ts, rows[self])
+		else:
+			row = [np.nan] * len(self.history.channels)
+			for plot, plot_row in rows.items():
+				for series, value in zip(plot.series, plot_row):
+					row[series.channel] = value
+			self.history.append(ts, row)
+
+		for plot in samples:
+			plot.samples_added += 1
+			if plot.archive is not None:
+				plot.archive.append(ts, rows[plot])
+			for series, value in zip(plot.series, rows[plot]):
+				series.extrema.push(ts, value)
+			plot.request_render()
+
+	def add_point(self, timestamp, value):
+		"""Append a sample of the first series; the other series get NaN."""
+		if len(self.series) > 1 or len(self.time_base) > 1:
+			self.add_sample(timestamp, [value])
+			return
+
+		if isinstance(timestamp, datetime):
+			ts = timestamp.timestamp()
 		else:
 			ts = timestamp
 
-		self.timestamps = np.append(self.timestamps, ts)
-		self.values = np.append(self.values, value)
+		self.history.append(ts, value)
+		self.samples_added += 1
+		self.window_extrema.push(ts, value)
+		if self.archive is not None:
+			self.archive.append(ts, [value])
 
-		if value < self.min_value:
-			self.min_value = value
-		if value > self.max_value:
-			self.max_value = value
+		self.request_render()
 
-		if len(self.timestamps) > 1000:
-			self.timestamps = self.timestamps[-1000:]
-			self.values = self.values[-1000:]
+	def add_points(self, timestamps, values):
+		"""Append many samples at once. ``timestamps`` are POSIX seconds, ``values`` has
+		shape (samples,) for the first series or (samples, series)."""
+		values = self.sample_columns(values)
+		if len(values) == 0:
+			return
+
+		self.history.extend(timestamps, self.channel_columns(values))
+		self.samples_added += len(values)
+		for index, series in enumerate(self.series):
+			series.extrema.push_many(timestamps, values[:, index])
+		if self.archive is not None:
+			self.archive.extend(timestamps, values)
+
+		self.request_render()
 
-		self.curve.setData(self.timestamps, self.values)
-		if self.auto_zoom_enabled:
-			self.zoom_to_data()
+	def render(self):
+		"""Draw the visible time range from the history level that gives about two points per pixel."""
+		if self.rendering:
+			return
+		self.rendering = True
+		started = time.perf_counter()
+		try:
+			view_box = self.plot_widget.plotItem.vb
+			start, end = view_box.viewRange()[0]
+			max_points = 2 * max(int(view_box.width()), 100)
+			archived = self.archive_window(start, end)
+			if not len(self.history) and archived is None:
+				return
+			if archived is not None:
+				start = archived[1]
+			level = self.history.select_level(start, end, max_points) if len(self.history) else None
+			for series in self.series:
+				x, y = self.query_series(series, start, end, max_points, level, archived)
+				series.curve.setData(x, y, connect='finite')
+		finally:
+			self.rendering = False
+			self.renders += 1
+			self.render_seconds += time.perf_counter() - started
+
+	def query_series(self, series, start, end, max_points, level=None, archived=None):
+		"""Points of one series in [start, end], the part in ``archived`` read from the archive."""
+		parts = []
+		if archived is not None:
+			# The archive has a column per series of this plot, the history per channel of the time base
+			x, y = self.archive.query(*archived, max_points, self.series.index(series))
+			keep = (x >= archived[0]) & (x < archived[1])
+			parts.append((x[keep], y[keep]))
+			start = archived[1]
+		if len(self.history):
+			x, y = self.history.query(start, end, max_points, series.channel, level)
+			if archived is not None:
+				keep = x >= start
+				x, y = x[keep], y[keep]
+			parts.append((x, y))
+		if not parts:
+			return np.empty(0), np.empty(0)
+		return np.concatenate([x for x, _ in parts]), np.concatenate([y for _, y in parts])
+
+	def update_view(self, force_zoom=False):
+		self.updating_view = True
+		try:
+			if self.auto_zoom_enabled or force_zoom:
+				self.zoom_to_data()
+		finally:
+			self.updating_view = False
+		self.render()
+
+	def request_render(self, zoom=False):
+		"""Redraw on the next frame of the shared scheduler, however many samples arrive until then."""
+		self.zoom_requested = self.zoom_requested or zoom
+		self.view_requested = True
+		self.scheduler.mark_dirty(self)
+
+	def render_frame(self):
+		if self.view_requested:
+			zoom, self.zoom_requested = self.zoom_requested, False
+			self.view_requested = False
+			self.update_view(force_zoom=zoom)
+		if self.cursor_pos is not None:
+			pos, self.cursor_pos = self.cursor_pos, None
+			self.update_crosshair(pos)
+
+	def on_x_range_changed(self, *args):
+		# Panning or zooming needs another level of detail
+		if not self.updating_view:
+			self.request_render()
 
 	def zoom_to_data(self):
 		if len(self.timestamps) == 0:
@@ -127,14 +480,13 @@ class LivePlot(QWidget):
 		min_time = current_time - self.timespan
 		max_time = current_time
 
-		visible_indices = (self.timestamps >= min_time) & (self.timestamps <= max_time)
-		visible_values = self.values[visible_indices]
-
-		if len(visible_values) == 0:
+		for series in self.series:
+			series.extrema.expire(min_time)
+		value_range = self.window_range()
+		if value_range is None:
 			return
+		min_value, max_value = value_range
 
-		min_value = np.min(visible_values)
-		max_value = np.max(visible_values)
 		value_range = max_value - min_value
 		padding = value_range * 0.1 if value_range > 0 else 1.0
 
@@ -148,66 +500,99 @@ class LivePlot(QWidget):
 			self.auto_zoom_enabled = enable
 
 	def set_data(self, timestamps, values):
-		if isinstance(timestamps[0], datetime):
-			self.timestamps = np.array([t.timestamp() for t in timestamps])
-		else:
-			self.timestamps = np.array(timestamps)
-
-		self.values = np.array(values)
-
-		if len(self.timestamps) > 0:
-			self.min_time = np.min(self.timestamps)
-			self.max_value = np.max(self.values)
-			self.min_value = np.min(self.values)
+		"""Replace the history; the other plots on the shared time base are left empty."""
+		self.history.clear()
+		values = self.channel_columns(self.sample_columns(values)) if len(timestamps) > 0 else values
+		if len(timestamps) > 0 and isinstance(timestamps[0], datetime):
+			self.history.extend([t.timestamp() for t in timestamps], values)
 		else:
-			self.min_time = None
-			self.min_value = float('inf')
-			self.max_value = float('-inf')
+			self.history.extend(timestamps, values)
 
-		self.curve.setData(self.timestamps, self.values)
-		self.zoom_to_data()
+		for plot in self.time_base:
+			plot.rebuild_window_extrema()
+			if len(plot.timestamps) > 0:
+				plot.min_time = np.min(plot.timestamps)
+			else:
+				plot.min_time = None
+			plot.update_view(force_zoom=True)
 
 	def update_plot(self):
-		self.curve.setData(self.timestamps, self.values)
-		self.zoom_to_data()
+		self.update_view(force_zoom=True)
 
 	def reset_view(self):
-		if len(self.timestamps) == 0:
+		time_range = self.time_range()
+		if time_range is None:
 			return
 
-		min_time = np.min(self.timestamps)
-		max_time = np.max(self.timestamps)
+		min_time, max_time = time_range
 		time_span = max_time - min_time
 		padding = time_span * 0.05
 
-		value_span = self.max_value - self.min_value
-		value_padding = value_span * 0.1 if value_span > 0 else abs(self.min_value) * 0.1
+		# Extremes of the whole history, taken from its min/max summaries
+		archived = self.archive_window(min_time, max_time + 1)
+		summary = np.concatenate([self.query_series(series, min_time, max_time, 2000, archived=archived)[1]
+								  for series in self.series])
+		if np.isnan(summary).all():
+			return
+		min_value, max_value = np.nanmin(summary), np.nanmax(summary)
+		value_span = max_value - min_value
+		value_padding = value_span * 0.1 if value_span > 0 else abs(min_value) * 0.1
 
 		self.plot_widget.setXRange(min_time - padding, max_time + padding)
-		self.plot_widget.setYRange(self.min_value - value_padding, self.max_value + value_padding)
+		self.plot_widget.setYRange(min_value - value_padding, max_value + value_padding)
 
 	def mouse_moved(self, pos):
+		# Mouse events come far more often than frames, only the last one is drawn
 		if not self.crosshair_visible:
 			return
-
-		if self.plot_widget.sceneBoundingRect().contains(pos):
-			mouse_point = self.plot_widget.plotItem.vb.mapSceneToView(pos)
-			x_val = mouse_point.x()
-			y_val = mouse_point.y()
-
-			self.crosshair_v.setPos(x_val)
-			self.crosshair_h.setPos(y_val)
-
-			if len(self.timestamps) > 0:
-				dt = datetime.fromtimestamp(x_val)
-				ms = int(dt.microsecond / 1000)
-				self.coord_label.setText(
-					f"Time: {dt.strftime('%H:%M:%S')}.{ms:03d}\nValue: {y_val:.4f}"
-				)
-				view_range = self.plot_widget.viewRange()
-				x_pos = view_range[0][0] + (view_range[0][1] - view_range[0][0]) * 0.01
-				y_pos = view_range[1][0] - (view_range[1][0] - view_range[1][1]) * 0.7
-				self.coord_label.setPos(x_pos, y_pos)
+		self.cursor_pos = pos
+		self.scheduler.mark_dirty(self)
+
+	def sample_at(self, timestamp):
+		"""``(timestamp, values)`` of the shown sample closest to ``timestamp``, or ``None``."""
+		nearest = self.history.nearest(timestamp)
+		candidates = [None if nearest is None else
+					  (nearest[0], [nearest[1][series.channel] for series in self.series])]
+		if self.archive is not None and (not len(self.history) or timestamp < self.history.times.view()[0]):
+			archived = self.archive.nearest(timestamp)
+			if archived is not None and (self.archive_start is None or archived[0] >= self.archive_start):
+				candidates.append((archived[0], archived[1][:len(self.series)]))
+		candidates = [candidate for candidate in candidates if candidate is not None]
+		if not candidates:
+			return None
+		return min(candidates, key=lambda candidate: abs(candidate[0] - timestamp))
+
+	def update_crosshair(self, pos):
+		if not self.plot_widget.sceneBoundingRect().contains(pos):
+			return
+		mouse_point = self.plot_widget.plotItem.vb.mapSceneToView(pos)
+		sample = self.sample_at(mouse_point.x())
+		if sample is None:
+			return
+		for plot in self.linked_group():
+			if plot.crosshair_visible:
+				plot.show_crosshair_at(sample[0], show_value=plot is self)
+
+	def show_crosshair_at(self, timestamp, show_value=False):
+		"""Put the crosshair on the sample closest to ``timestamp`` and list the values of all series."""
+		sample = self.sample_at(timestamp)
+		if sample is None:
+			return
+		timestamp, values = sample
+		self.crosshair_v.setPos(timestamp)
+		if show_value and not np.isnan(values[0]):
+			self.crosshair_h.setPos(values[0])
+
+		dt = datetime.fromtimestamp(timestamp)
+		lines = [f"Time: {dt.strftime('%H:%M:%S')}.{dt.microsecond // 1000:03d}"]
+		for series, value in zip(self.series, values):
+			label = "Value" if len(self.series) == 1 else series.name
+			lines.append(f"{label}: {value:.4f}" if not np.isnan(value) else f"{label}: -")
+		self.coord_label.setText("\n".join(lines))
+		view_range = self.plot_widget.viewRange()
+		x_pos = view_range[0][0] + (view_range[0][1] - view_range[0][0]) * 0.01
+		y_pos = view_range[1][0] - (view_range[1][0] - view_range[1][1]) * 0.7
+		self.coord_label.setPos(x_pos, y_pos)
 
 	def toggle_crosshair(self, visible=None):
 		if visible is None:
@@ -225,23 +610,32 @@ class LivePlot(QWidget):
 			self.plot_widget.removeItem(self.coord_label)
 
 	def clear_data(self):
-		self.timestamps = np.array([], dtype=np.float64)
-		self.values = np.array([], dtype=np.float64)
-		self.min_value = float('inf')
-		self.max_value = float('-inf')
-		self.curve.setData([], [])
+		"""Clear the history, of every plot on the shared time base."""
+		for plot in self.time_base:
+			time_range = plot.time_range()
+			if plot.archive is not None and time_range is not None:
+				# The archive keeps the samples, they are just no longer shown
+				plot.archive_start = np.nextafter(time_range[1], np.inf)
+		self.history.clear()
+		for plot in self.time_base:
+			for series in plot.series:
+				series.extrema.clear()
+				series.curve.setData([], [])
 
 	def toggle_data_markers(self, visible):
 		self.data_markers_visible = visible
 		self.update_pen()
 
-	def set_line_color(self, color):
+	@property
+	def line_color(self):
+		return self.series[0].color
+
+	def set_line_color(self, color, series=0):
 		if isinstance(color, QColor):
-			self.line_color = color.name()
-		elif isinstance(color, str):
-			self.line_color = color
-		else:
-			self.line_color = '#1f77b4'
+			color = color.name()
+		elif not isinstance(color, str):
+			color = '#1f77b4'
+		self.series[self.series_index(series)].color = color
 
 		self.update_pen()
 
@@ -261,12 +655,49 @@ class LivePlot(QWidget):
 			self.plot_widget.plotItem.legend.setParent(None)
 			self.plot_widget.plotItem.legend = None
 
+	def export_snapshot(self, full_history=False, max_points=4000):
+		"""Copy of what the plot draws, for rendering or saving off the GUI thread.
+
+		``full_history`` covers everything kept in memory and in the archive instead
+		of the visible range; either way every series is min/max decimated to about
+		``max_points`` points.
+		"""
+		x_range, y_range = self.plot_widget.viewRange()
+		if full_history:
+			x_range = self.time_range() or x_range
+		start, end = x_range
+		archived = self.archive_window(start, end)
+		series = []
+		for current in self.series:
+			x, y = self.query_series(current, start, end, max_points, archived=archived)
+			series.append({'name': current.name, 'color': current.color, 'x': x, 'y': y})
+
+		if full_history:
+			values = np.concatenate([current['y'] for current in series])
+			if len(values) and not np.isnan(values).all():
+				low, high = np.nanmin(values), np.nanmax(values)
+				padding = (high - low) * 0.1 if high > low else 1.0
+				y_range = [low - padding, high + padding]
+
+		plot_item = self.plot_widget.plotItem
+		return {
+			'x_label': plot_item.getAxis('bottom').labelText,
+			'y_label': plot_item.getAxis('left').labelText,
+			'x_range': tuple(x_range),
+			'y_range': tuple(y_range),
+			'line_width': self.line_width,
+			'grid': self.grid_visible,
+			'series': series,
+		}
+
 	def export_to_png(self, filename):
+		from pyqtgraph.exporters import ImageExporter
 		exporter = ImageExporter(self.plot_widget.plotItem)
 		exporter.parameters()['width'] = 1920
 		exporter.export(filename)
 
 	def export_to_svg(self, filename):
+		from pyqtgraph.exporters import SVGExporter
 		exporter = SVGExporter(self.plot_widget.plotItem)
 		exporter.export(filename)
 
@@ -6,7 +6,7 @@ import threading
 
 import numpy as np
 #from PyQt5.QtWidgets import QSlider
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (QMainWindow, QTextEdit,
                              QWidget, QVBoxLayout,
@@ -15,28 +15,46 @@ from PyQt6.QtWidgets import (QMainWindow, QTextEdit,
                              QGridLayout, QVBoxLayout,
                              QFrame, QTextBrowser, QDialogButtonBox,
                              QSizePolicy, QGroupBox, QMessageBox,
-                             QInputDialog, QDialog)
-from gpiozero.pins.mock import MockFactory
+                             QInputDialog, QDialog, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QFileDialog,
+                             QProgressBar)
 
 from gui.live_plot import LivePlot
+from gui.render_scheduler import RenderScheduler
+from gui.terminal_view import TerminalView
+from gui.status_image_cache import StatusImageCache
+from gui.performance_hud import PerformanceHud
 from datetime import datetime, timedelta
-from serial.tools import list_ports
 from PyQt6.QtGui import QIcon, QPixmap, QColor, QFont
 from core.serial_reader import SerialReader
 from core.process_data import ProcessData
 from core.csv_handler import CsvHandler
+from core.session_replay import SessionReplay
+from core.latency_tracer import LatencyTracer
+from core.config import Config
+from core.utils import Utils
 
 class MainWindow(QMainWindow):
-    def __init__(self, config, network_reader, gpio_reader, csv_handler):
+    # Network callbacks run on the network thread, the signals bring them to the GUI thread
+    partner_connected = pyqtSignal()
+    partner_disconnected = pyqtSignal()
+
+    def __init__(self, config, network_reader, gpio_reader, csv_handler, storage_handlers=None,
+                 session_database=None, on_backend_connected=None):
         super().__init__()
-        self.connect_gui_to_backend(config, network_reader, gpio_reader, csv_handler)
+        self.session_database = session_database
+        self.connect_gui_to_backend(config, network_reader, gpio_reader, csv_handler, storage_handlers)
+        # Serial port, LoRa configuration and the network server come up while the widgets are built
+        self.serial.startup_finished.connect(self.on_serial_started)
+        self.serial.start_in_background(config['lora_config'], config['is_config_selected'])
+        if on_backend_connected:
+            on_backend_connected()
         self.declare_variables()
         self.initalizeUI()
         self.define_separators()
         self.setup_status_bar()
-        self.serial.start_reading()
 
-    def connect_gui_to_backend(self, config, network_reader, gpio_reader, csv_handler):
+    def connect_gui_to_backend(self, config, network_reader, gpio_reader, csv_handler, storage_handlers=None):
         self.logger = logging.getLogger('HORUS_CSS.main_window')
         self.logger.info("Inicjalizacja głównego okna")
 
@@ -44,16 +62,19 @@ class MainWindow(QMainWindow):
         self.logger.info(
             f"CSV handler zainicjalizowany w sesji: {self.csv_handler.session_dir}")
 
-        self.serial = SerialReader(config['port'], config['baudrate'])
+        self.serial = SerialReader(config['port'], config['baudrate'], connect=False)
         self.logger.info(f"SerialReader zainicjalizowany na porcie {config['port']} z baudrate {config['baudrate']}")
-        self.processor = ProcessData(self.csv_handler)
+        self.processor = ProcessData(self.csv_handler, storage_handlers)
+        self.records_displayed = 0
         self.logger.info(
             f"Singleton ProcessData zainicjalizowany")
 
         self.network_reader = network_reader
 
-        self.network_reader.subcribe_on_connection(self.on_partner_connected)
-        self.network_reader.subcribe_on_disconnect(self.on_partner_disconnected)
+        self.partner_connected.connect(self.on_partner_connected)
+        self.partner_disconnected.connect(self.on_partner_disconnected)
+        self.network_reader.subcribe_on_connection(self.partner_connected.emit)
+        self.network_reader.subcribe_on_disconnect(self.partner_disconnected.emit)
         self.network_reader.subcribe_on_data_received(self.processor.on_ethernet_data_received)
 
         self.gpio_reader = gpio_reader
@@ -61,14 +82,20 @@ class MainWindow(QMainWindow):
 
         self.default_timespan = 30
 
-        if config['lora_config']:
-            self.serial.LoraSet(config['lora_config'], config['is_config_selected'])
-            self.logger.info(f"Konfiguracja LoRa ustawiona: {config['lora_config']}")
-
         self.serial.telemetry_received.connect(self.processor.handle_telemetry)
         self.serial.transmission_info_received.connect(self.processor.handle_transmission_info)
+        if self.session_database:
+            self.serial.transmission_info_received.connect(self.session_database.write_transmission)
         self.processor.processed_data_ready.connect(self.handle_processed_data)
 
+        # Replay has its own processor: no storage, no shared current_data or statistics
+        self.replay_processor = ProcessData(None)
+        self.replay_processor.processed_data_ready.connect(self.handle_replayed_data)
+        self.replay = SessionReplay(self.replay_processor, self)
+        self.replay.finished.connect(self.on_replay_finished)
+
+        self.plot_exporter = None
+
     def declare_variables(self):
         self.start_detection = False
         self.calib_detection = False
@@ -79,6 +106,7 @@ class MainWindow(QMainWindow):
         self.mission_aborted = False
 
         self.current_status_image = "0.png"
+        self.last_status = None
 
         # Debug variables - to be removed
         self.current_status_index = 1
@@ -153,16 +181,22 @@ class MainWindow(QMainWindow):
         self.theme_menu = self.view_menu.addMenu("Themes")
         self.timespan_menu = self.view_menu.addMenu("Timespan")
         self.tools_menu = self.menu.addMenu("Tools")
+        self.replay_menu = self.menu.addMenu("Replay")
         self.test_menu = self.menu.addMenu("Test")
         self.help_menu = self.menu.addMenu("Help")
 
         self.file_menu.addAction("Exit", self.close)
         self.file_menu.addAction("Open Session Directory", self.open_session_directory)
         self.file_menu.addAction("Show Session Path", self.show_session_directory_path)
+        self.file_menu.addAction("Browse Sessions", self.show_session_catalog)
         self.file_menu.addSeparator()
         self.file_menu.addAction("Save Terminal Log", self.save_terminal_log)
         self.file_menu.addAction("Export Plots as PNG", lambda: self.export_plots("png"))
         self.file_menu.addAction("Export Plots as SVG", lambda: self.export_plots("svg"))
+        self.file_menu.addAction("Export Plot Data as CSV", lambda: self.export_plots("csv"))
+        self.file_menu.addAction("Export Plot Data as NPZ", lambda: self.export_plots("npz"))
+        self.file_menu.addAction("Export Full History as PNG",
+                                 lambda: self.export_plots("png", full_history=True))
 
         self.view_menu.addAction("Toggle Fullscreen", self.toggle_fullscreen)
 
@@ -176,6 +210,11 @@ class MainWindow(QMainWindow):
         self.heartbeat_action.setChecked(True)
         self.heartbeat_action.triggered.connect(self.toggle_heartbeat)
 
+        self.performance_action = self.view_menu.addAction("Performance Panel")
+        self.performance_action.setCheckable(True)
+        self.performance_action.setChecked(True)
+        self.performance_action.triggered.connect(self.toggle_performance_hud)
+
         self.view_menu.addSeparator()
 
         self.crosshair_action = self.view_menu.addAction("Crosshair")
@@ -206,6 +245,16 @@ class MainWindow(QMainWindow):
         self.view_menu.addAction("Clear Plots", self.clear_plots)
         self.view_menu.addAction("Clear All", self.clear_all)
 
+        self.replay_menu.addAction("Open Session...", self.open_replay_session)
+        self.replay_speed_menu = self.replay_menu.addMenu("Speed")
+        self.replay_speed_menu.addAction("1x", lambda: self.start_replay(1.0))
+        self.replay_speed_menu.addAction("10x", lambda: self.start_replay(10.0))
+        self.replay_speed_menu.addAction("Max", lambda: self.start_replay(None))
+        self.replay_menu.addSeparator()
+        self.replay_menu.addAction("Pause/Resume", self.toggle_replay_pause)
+        self.replay_menu.addAction("Seek...", self.seek_replay)
+        self.replay_menu.addAction("Stop", self.replay.stop)
+
         self.help_menu.addAction("About application", self.show_about_app_dialog)
         self.help_menu.addAction("About KNS LiK", self.show_about_kns_dialog)
 
@@ -247,11 +296,18 @@ class MainWindow(QMainWindow):
 
         serial_menu = self.tools_menu.addMenu("Serial Configuration")
         serial_menu.addAction("Scan Ports", self.scan_serial_ports)
-        serial_menu.addAction("Change Baud Rate", self.change_baud_rate)
-        serial_menu.addAction("Reconnect Serial", self.reconnect_serial)
+        # Both reopen the port, not while the startup thread may still be opening it
+        self.serial_port_actions = [
+            serial_menu.addAction("Change Baud Rate", self.change_baud_rate),
+            serial_menu.addAction("Reconnect Serial", self.reconnect_serial),
+        ]
+        for action in self.serial_port_actions:
+            action.setEnabled(not self.serial.is_starting())
         self.tools_menu.addAction("Configure Filters", self.configure_filters)
         self.tools_menu.addSeparator()
         self.tools_menu.addAction("Calculate Statistics", self.calculate_statistics)
+        self.tools_menu.addAction("Render Statistics", self.show_render_statistics)
+        self.tools_menu.addAction("Pipeline Latency", self.show_latency_statistics)
 
 
         self.plot_speed_actions = {}
@@ -296,16 +352,14 @@ class MainWindow(QMainWindow):
         self.rocket_trajectory_label.setScaledContents(False)
         self.left_layout.addWidget(self.rocket_trajectory_label)
 
-        pixmap = QPixmap(r"gui/resources/status_images/" + self.current_status_image)
-        width = 800
-        scaled_pixmap = pixmap.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
-        self.rocket_trajectory_label.setPixmap(scaled_pixmap)
+        self.status_image_cache = StatusImageCache("gui/resources/status_images", width=800)
+        self.status_image_cache.prescale(device_pixel_ratio=self.devicePixelRatioF())
+        self.shown_status_image = None
+        self.show_status_image(os.path.splitext(self.current_status_image)[0])
 
-        self.terminal_output = QTextBrowser()
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.terminal_output.append(
-            f">{current_time}: System ready...")
-        self.terminal_output.setStyleSheet(
+        self.terminal_output = TerminalView()
+        self.append_terminal("System ready...")
+        self.terminal_output.list_view.setStyleSheet(
             "font-size: 14px; background-color: #09131c;")
         self.left_layout.addWidget(self.terminal_output)
 
@@ -330,7 +384,8 @@ class MainWindow(QMainWindow):
         self.press_group = QGroupBox("Recovery Bay Pressure (0 hPa)")
         press_layout = QVBoxLayout()
 
-        self.press_plot = LivePlot(self.default_timespan, line_color='#27ae60')
+        # Sampled together with the temperature, so the three plots share its timestamps
+        self.press_plot = LivePlot(self.default_timespan, line_color='#27ae60', time_base=self.temp_plot)
         self.press_plot.set_x_label("Time [s]")
         self.press_plot.set_y_label("Pressure [hPa]")
         press_layout.addWidget(self.press_plot, stretch=1)
@@ -342,7 +397,7 @@ class MainWindow(QMainWindow):
         self.lora_group = QGroupBox("LoRa SNR Status (0 dB)")
         lora_layout = QVBoxLayout()
 
-        self.lora_snr_plot = LivePlot(self.default_timespan, line_color='#2980b9')
+        self.lora_snr_plot = LivePlot(self.default_timespan, line_color='#2980b9', time_base=self.temp_plot)
         self.lora_snr_plot.set_x_label("Time [s]")
         self.lora_snr_plot.set_y_label("SNR [dB]")
         lora_layout.addWidget(self.lora_snr_plot, stretch=1)
@@ -350,6 +405,23 @@ class MainWindow(QMainWindow):
         self.lora_group.setLayout(lora_layout)
         self.right_layout.addWidget(self.lora_group)
 
+        # All three plots show the same time window
+        self.press_plot.link_x(self.temp_plot)
+        self.lora_snr_plot.link_x(self.temp_plot)
+
+        # The whole flight stays scrollable from memory-mapped files in the session directory,
+        # the history of the previous session is read from its own directory
+        archive_dir = os.path.join(self.csv_handler.session_dir, Config.PLOT_ARCHIVE_DIRECTORY)
+        previous_dir = self.previous_plot_archive_directory()
+        plots = {
+            "temperature": self.temp_plot,
+            "pressure": self.press_plot,
+            "lora": self.lora_snr_plot
+        }
+        for name, plot in plots.items():
+            plot.attach_archive(os.path.join(archive_dir, name),
+                                previous=os.path.join(previous_dir, name) if previous_dir else None)
+
         # ------------------ Styling ------------------
         groupbox_style = """
             QGroupBox {
@@ -386,6 +458,17 @@ class MainWindow(QMainWindow):
             "color: white;")
         self.main_layout.addWidget(vert_separator, 0, 1, 3, 1)
 
+    def previous_plot_archive_directory(self):
+        """Plot history of the previous session, or ``None``, so that it is back right after a restart."""
+        previous = Utils.catalog.previous_session(Utils.session_id) if Utils.catalog else None
+        if previous is None:
+            return None
+        previous_dir = os.path.join(previous['directory'], Config.PLOT_ARCHIVE_DIRECTORY)
+        if not os.path.isdir(previous_dir):
+            return None
+        self.logger.info(f"Plot history of the previous session: {previous_dir}")
+        return previous_dir
+
     def apply_theme(self, theme_file):
         try:
             theme_path = os.path.join("gui", "resources", "themes", theme_file)
@@ -474,6 +557,107 @@ class MainWindow(QMainWindow):
             f"Current session files are stored at:\n{session_path}"
         )
 
+    def show_session_catalog(self):
+        if Utils.catalog is None:
+            QMessageBox.information(self, "Sessions", "Session catalog is not available.")
+            return
+
+        sessions = Utils.catalog.list_sessions()
+        headers = ["Session", "Start", "End", "Packets", "Min altitude [m]",
+                   "Max altitude [m]", "Size [MB]", "Directory"]
+
+        def format_time(value):
+            return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S") if value else "-"
+
+        def format_number(value, fmt="{:.1f}"):
+            return fmt.format(value) if value is not None else "-"
+
+        table = QTableWidget(len(sessions), len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        for row, session in enumerate(sessions):
+            values = [
+                str(session['id']),
+                format_time(session['start_time']),
+                format_time(session['end_time']) if session['closed'] else "running",
+                format_number(session['packets'], "{}"),
+                format_number(session['min_altitude']),
+                format_number(session['max_altitude']),
+                format_number(session['size_bytes'] / 1e6 if session['size_bytes'] else None, "{:.2f}"),
+                session['directory'],
+            ]
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(value))
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Sessions")
+        dialog.resize(1000, 500)
+        layout = QVBoxLayout()
+        layout.addWidget(table)
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
+        button_box.accepted.connect(dialog.accept)
+        layout.addWidget(button_box)
+        dialog.setLayout(layout)
+        dialog.exec()
+
+    def open_replay_session(self):
+        start_dir = os.path.dirname(self.csv_handler.session_dir)
+        session_dir = QFileDialog.getExistingDirectory(self, "Select Session to Replay", start_dir)
+        if not session_dir:
+            return
+
+        self.replay.stop()
+        try:
+            loaded = self.replay.load(session_dir)
+        except Exception as e:
+            self.logger.error(f"Error loading session for replay: {e}")
+            QMessageBox.critical(self, "Replay", f"Could not load session:\n{e}")
+            return
+
+        if not loaded:
+            QMessageBox.information(self, "Replay", "The session has no telemetry to replay.")
+            return
+        self.append_terminal(f"Opened {session_dir} for replay ({self.replay.duration:.1f} s)", "yellow")
+        self.start_replay(1.0)
+
+    def start_replay(self, speed):
+        if not self.replay.loaded:
+            QMessageBox.information(self, "Replay", "Open a session to replay first.")
+            return
+        if self.replay.is_running():
+            self.replay.set_speed(speed)
+        else:
+            self.replay_processor.statistics.reset()
+            self.replay.seek(0)
+            self.replay.start(speed)
+        self.append_terminal(f"Replay speed: {f'{speed:g}x' if speed else 'max'}", "yellow")
+
+    def toggle_replay_pause(self):
+        if not self.replay.is_running():
+            return
+        if self.replay.paused:
+            self.replay.resume()
+            self.append_terminal("Replay resumed", "yellow")
+        else:
+            self.replay.pause()
+            self.append_terminal("Replay paused", "yellow")
+
+    def seek_replay(self):
+        if not self.replay.loaded:
+            return
+        seconds, ok = QInputDialog.getDouble(
+            self, "Seek", f"Position [s] (0 - {self.replay.duration:.1f}):",
+            self.replay.position, 0.0, self.replay.duration, 1)
+        if ok:
+            self.replay.seek(seconds)
+
+    def on_replay_finished(self, stats):
+        self.append_terminal(
+            f"Replay finished: {stats['records']} records in {stats['elapsed']:.2f} s "
+            f"({stats['rate']:.0f} records/s)", "yellow")
+
     def toggle_heartbeat(self):
         state = self.heartbeat_action.isChecked()
         if state:
@@ -484,21 +668,56 @@ class MainWindow(QMainWindow):
             self.heartbeat_placeholder.setStyleSheet("color: transparent; font-size: 14px;")
             self.heartbeat_active = False
 
-        current_time = datetime.now().strftime("%H:%M:%S")
         status = "ON" if state else "OFF"
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: lightblue;'>Heartbeat turned {status}</span>")
+        self.append_terminal(f"Heartbeat turned {status}", "lightblue")
         self.logger.info(f"Heartbeat toggled to {status}")
 
+    def setup_performance_monitor(self, monitor):
+        plots = [self.temp_plot, self.press_plot, self.lora_snr_plot]
+        scheduler = RenderScheduler.shared()
+
+        def recent_frame_ms():
+            recent = list(scheduler.frame_times)[-10:]
+            return 1000 * sum(recent) / len(recent) if recent else None
+
+        monitor.add_counter('serial_packets', lambda: self.serial.packets_received)
+        monitor.add_counter('serial_errors', lambda: self.serial.decode_errors)
+        monitor.add_counter('tcp_messages', lambda: self.network_reader.messages_received)
+        monitor.add_counter('tcp_errors', lambda: self.network_reader.decode_errors)
+        monitor.add_counter('processed_records', lambda: self.processor.records_emitted)
+        monitor.add_counter('processing_errors', lambda: self.processor.errors)
+        monitor.add_counter('plot_samples', lambda: sum(plot.samples_added for plot in plots))
+        monitor.add_counter('frames', lambda: scheduler.frames)
+
+        # Records emitted by the processor but not yet handled by the GUI thread
+        monitor.add_gauge('gui_queue', lambda: self.processor.records_emitted - self.records_displayed)
+        monitor.add_gauge('tcp_buffered_bytes', lambda: self.network_reader.buffered_bytes)
+        monitor.add_gauge('csv_backlog', lambda: self.csv_handler.backlog)
+        monitor.add_gauge('storage_backlog', lambda: max(
+            [handler.backlog for handler in self.processor.storage_handlers if hasattr(handler, 'backlog')],
+            default=0))
+        monitor.add_gauge('frame_ms', recent_frame_ms)
+        monitor.add_gauge('render_load', lambda: scheduler.load)
+
+    def toggle_performance_hud(self):
+        state = self.performance_action.isChecked()
+        self.performance_hud.setVisible(state)
+        if state:
+            self.performance_hud.start()
+        else:
+            self.performance_hud.stop()
+
+        status = "ON" if state else "OFF"
+        self.append_terminal(f"Performance panel turned {status}", "lightblue")
+        self.logger.info(f"Performance panel toggled to {status}")
+
     def toggle_crosshairs(self):
         state = self.crosshair_action.isChecked()
         for plot in [self.temp_plot, self.press_plot, self.lora_snr_plot]:
             plot.toggle_crosshair(state)
 
-        current_time = datetime.now().strftime("%H:%M:%S")
         status = "ON" if state else "OFF"
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: lightblue;'>Crosshair turned {status}</span>")
+        self.append_terminal(f"Crosshair turned {status}", "lightblue")
         self.logger.info(f"Crosshair toggled to {status}")
 
     def setup_heartbeat(self):
@@ -554,6 +773,17 @@ class MainWindow(QMainWindow):
         self.connection_label.setStyleSheet("font-size: 14px; font-weight: bold; color: red;")
         right_layout.addWidget(self.connection_label)
 
+        self.export_progress = QProgressBar()
+        self.export_progress.setFixedWidth(120)
+        self.export_progress.setFormat("Export %v/%m")
+        self.export_progress.hide()
+        right_layout.addWidget(self.export_progress)
+
+        self.performance_hud = PerformanceHud()
+        self.setup_performance_monitor(self.performance_hud.monitor)
+        self.performance_hud.start()
+        right_layout.addWidget(self.performance_hud)
+
         self.heartbeat_placeholder = QLabel("●")
         self.heartbeat_placeholder.setStyleSheet("background: transparent; color: transparent; font-size: 14px;")
         right_layout.addWidget(self.heartbeat_placeholder)
@@ -572,10 +802,8 @@ class MainWindow(QMainWindow):
             self.statusBar().hide()
         self.status_bar_visible = state
 
-        current_time = datetime.now().strftime("%H:%M:%S")
         status = "ON" if state else "OFF"
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: lightblue;'>Status bar turned {status}</span>")
+        self.append_terminal(f"Status bar turned {status}", "lightblue")
         self.logger.info(f"Status bar toggled to {status}")
 
     def update_status_packet_time(self):
@@ -598,21 +826,16 @@ class MainWindow(QMainWindow):
         self.simulation_timer.start(self.simulation_interval)
         self.logger.info("Started terminal simulation")
 
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: yellow;'>Started terminal simulation (interval: "
-            f"{self.simulation_interval}ms)</span>")
+        self.append_terminal(f"Started terminal simulation (interval: "
+                             f"{self.simulation_interval}ms)", "yellow")
 
     def stop_terminal_simulation(self):
         if hasattr(self, 'simulation_timer') and self.simulation_timer.isActive():
             self.simulation_timer.stop()
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: yellow;'>Stopped terminal simulation</span>")
+            self.append_terminal("Stopped terminal simulation", "yellow")
             self.logger.info("Stopped terminal simulation")
 
     def generate_terminal_output(self):
-        current_time = datetime.now().strftime("%H:%M:%S")
         messages = [
             f"<span style='color: yellow;'>SIM</span>: Telemetry packet received - velocity: "
             f"{np.random.normal(50, 10):.2f} m/s",
@@ -626,15 +849,20 @@ class MainWindow(QMainWindow):
         ]
 
         message = np.random.choice(messages)
-        self.terminal_output.append(f">{current_time}: {message}")
+        self.append_terminal(message)
 
         self.simulation_interval = max(500, int(np.random.normal(1000, 200)))
         self.simulation_timer.setInterval(self.simulation_interval)
+
+    def append_terminal(self, message, color=None, persist=True, merge_repeats=False):
+        self.terminal_output.append(message, color, merge_repeats)
+
+        if persist and self.session_database:
+            self.session_database.log_message(message)
+
     def clear_terminal(self):
         self.terminal_output.clear()
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.terminal_output.append(
-            f">{current_time}: Terminal cleared")
+        self.append_terminal("Terminal cleared")
         self.logger.info("Terminal cleared")
 
     def start_plot_simulation(self):
@@ -645,16 +873,12 @@ class MainWindow(QMainWindow):
         self.plot_sim_timer.start(self.plot_sim_interval)
         self.logger.info("Started plot simulation")
 
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: yellow;'>Started plot simulation (interval: {self.plot_sim_interval}ms)</span>")
+        self.append_terminal(f"Started plot simulation (interval: {self.plot_sim_interval}ms)", "yellow")
 
     def stop_plot_simulation(self):
         if hasattr(self, 'plot_sim_timer') and self.plot_sim_timer.isActive():
             self.plot_sim_timer.stop()
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: yellow;'>Stopped plot simulation</span>")
+            self.append_terminal("Stopped plot simulation", "yellow")
             self.logger.info("Stopped plot simulation")
 
     def set_plot_sim_speed(self, interval):
@@ -663,15 +887,10 @@ class MainWindow(QMainWindow):
             self.plot_sim_timer.start(self.plot_sim_interval)
         for label, action in self.plot_speed_actions.items():
             action.setChecked(action.text().startswith(f"{interval // 1000 if interval >= 1000 else interval}"))
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: yellow;'>Plot simulation speed set to {self.plot_sim_interval}ms</span>")
+        self.append_terminal(f"Plot simulation speed set to {self.plot_sim_interval}ms", "yellow")
 
     def abort_mission_pressed(self):
-        current_time = datetime.now().strftime("%H:%M:%S")
-
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: red;'>Abort mission button pressed!</span>")
+        self.append_terminal("Abort mission button pressed!", "red")
         self.global_status_label.setText(f"<span style='color: red;'>Mission aborted</span>")
 
         # self.mission_status.set_progress(100)
@@ -693,6 +912,7 @@ class MainWindow(QMainWindow):
 
     def simulate_button_held(self):
         try:
+            from gpiozero.pins.mock import MockFactory
             pin_factory = type(self.gpio_reader.button.pin.factory)
             if pin_factory is not MockFactory:
                 self.logger.warning("Cannot simulate button press: real GPIO backend in use.")
@@ -714,30 +934,30 @@ class MainWindow(QMainWindow):
         current_time = datetime.now()
 
         temp_value = np.random.normal(50, 5)
-        self.temp_plot.add_point(current_time, temp_value)
         self.temp_group.setTitle(f"Recovery Bay Temperature ({temp_value:.1f} °C)")
 
         snr_value = np.random.normal(5, 1.5)
-        self.press_plot.add_point(current_time, snr_value)
         self.press_group.setTitle(f"Recovery Bay Pressure ({snr_value:.1f} hPa)")
 
         lora_snr_value = np.random.normal(25, 3)
-        self.lora_snr_plot.add_point(current_time, lora_snr_value)
         self.lora_group.setTitle(f"LoRa SNR Status ({lora_snr_value:.1f} dB)")
 
+        self.temp_plot.add_time_base_sample(current_time, {
+            self.temp_plot: [temp_value],
+            self.press_plot: [snr_value],
+            self.lora_snr_plot: [lora_snr_value],
+        })
+
 
     def clear_plots(self):
+        # Clears the time base shared by the three plots
         self.temp_plot.clear_data()
-        self.press_plot.clear_data()
-        self.lora_snr_plot.clear_data()
 
         self.temp_group.setTitle(f"Recovery Bay Temperature ({0} °C)")
         self.press_group.setTitle(f"Recovery Bay Pressure ({0} hPa)")
         self.lora_group.setTitle(f"LoRa SNR Status ({0} dB)")
 
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.terminal_output.append(
-            f">{current_time}: All plots cleared")
+        self.append_terminal("All plots cleared")
         self.logger.info("Plots cleared")
 
     def clear_all(self):
@@ -752,49 +972,62 @@ class MainWindow(QMainWindow):
     def save_terminal_log(self):
         path = os.path.join(self.csv_handler.session_dir, "terminal_log.txt")
         try:
-            with open(path, 'w') as f:
-                f.write(self.terminal_output.toPlainText())
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(f">{current_time}: Log saved to {path}")
+            self.terminal_output.save(path)
+            self.append_terminal(f"Log saved to {path}")
             self.logger.info(f"Terminal log saved to {path}")
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Failed to save log: {str(e)}")
 
-    def export_plots(self, format):
+    def get_plot_exporter(self):
+        # Created on first use, QtSvg and the exporter are not needed before that
+        if self.plot_exporter is None:
+            from gui.plot_exporter import PlotExporter
+            self.plot_exporter = PlotExporter(self)
+            self.plot_exporter.progress.connect(self.on_export_progress)
+            self.plot_exporter.finished.connect(self.on_export_finished)
+            self.plot_exporter.failed.connect(self.on_export_failed)
+        return self.plot_exporter
+
+    def export_plots(self, format, full_history=False):
+        if self.get_plot_exporter().busy:
+            self.append_terminal("Plot export already in progress", "orange")
+            return
         try:
-            session_dir = self.csv_handler.session_dir
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
             plots = {
                 "temperature": self.temp_plot,
                 "pressure": self.press_plot,
                 "lora": self.lora_snr_plot
             }
-
-            for name, plot in plots.items():
-                filename = os.path.join(session_dir, f"{name}_plot_{timestamp}.{format}")
-                if format == "png":
-                    plot.export_to_png(filename)
-                elif format == "svg":
-                    plot.export_to_svg(filename)
-
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: lightgreen;'>Exported plots as {format.upper()} files</span>")
-            self.logger.info(f"Exported plots as {format.upper()} files")
+            max_points = 2 * self.plot_exporter.width
+            snapshots = {name: plot.export_snapshot(full_history, max_points) for name, plot in plots.items()}
+            self.plot_exporter.export(snapshots, self.csv_handler.session_dir, format)
+            self.export_format = format.upper()
+            self.append_terminal(f"Exporting plots as {self.export_format} files...", "lightblue")
         except Exception as e:
             self.logger.error(f"Error exporting plots: {str(e)}")
             QMessageBox.critical(self, "Export Error", f"Failed to export plots: {str(e)}")
 
+    def on_export_progress(self, done, total):
+        self.export_progress.setRange(0, total)
+        self.export_progress.setValue(done)
+        self.export_progress.setVisible(done < total)
+
+    def on_export_finished(self, filenames):
+        self.export_progress.hide()
+        self.append_terminal(f"Exported plots as {self.export_format} files", "lightgreen")
+        self.logger.info(f"Exported plots as {self.export_format} files: {', '.join(filenames)}")
+
+    def on_export_failed(self, message):
+        self.export_progress.hide()
+        QMessageBox.critical(self, "Export Error", f"Failed to export plots: {message}")
+
     def update_data_markers(self):
         state = self.data_markers_action.isChecked()
         for plot in [self.temp_plot, self.press_plot, self.lora_snr_plot]:
             plot.toggle_data_markers(state)
 
-        current_time = datetime.now().strftime("%H:%M:%S")
         status = "ON" if state else "OFF"
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: lightblue;'>Data markers turned {status}</span>")
+        self.append_terminal(f"Data markers turned {status}", "lightblue")
         self.logger.info(f"Data markers toggled to {status}")
 
     def change_line_colors(self):
@@ -819,10 +1052,7 @@ class MainWindow(QMainWindow):
         if color.isValid():
             plots[plot_name].set_line_color(color)
 
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: {color.name()};'>Plot '{plot_name}' line color changed</span>"
-            )
+            self.append_terminal(f"Plot '{plot_name}' line color changed", color.name())
             self.logger.info(f"Plot '{plot_name}' line color changed to {color.name()}")
 
     def toggle_plot_grid(self):
@@ -830,10 +1060,8 @@ class MainWindow(QMainWindow):
         for plot in [self.temp_plot, self.press_plot, self.lora_snr_plot]:
             plot.toggle_grid(state)
 
-        current_time = datetime.now().strftime("%H:%M:%S")
         status = "ON" if state else "OFF"
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: lightblue;'>Plot grid turned {status}</span>")
+        self.append_terminal(f"Plot grid turned {status}", "lightblue")
         self.logger.info(f"Plot grid toggled to {status}")
 
     # def toggle_plot_legends(self):
@@ -841,32 +1069,31 @@ class MainWindow(QMainWindow):
     #     for plot in [self.temp_plot, self.press_plot, self.lora_snr_plot]:
     #         plot.toggle_legend(state)
 
-        current_time = datetime.now().strftime("%H:%M:%S")
         status = "ON" if state else "OFF"
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: lightblue;'>Plot legends turned {status}</span>")
+        self.append_terminal(f"Plot legends turned {status}", "lightblue")
         self.logger.info(f"Plot legends toggled to {status}")
 
     def scan_serial_ports(self):
         try:
+            from serial.tools import list_ports
             ports = [port.device for port in list_ports.comports()]
-            current_time = datetime.now().strftime("%H:%M:%S")
 
             if not ports:
-                self.terminal_output.append(
-                    f">{current_time}: <span style='color: orange;'>No serial ports found</span>")
+                self.append_terminal("No serial ports found", "orange")
                 return
 
             message = "<span style='color: lightgreen;'>Available ports:</span><br>"
             message += "<br>".join([f"&nbsp;&nbsp;• {port}" for port in ports])
 
-            self.terminal_output.append(f">{current_time}: {message}")
+            self.append_terminal(message)
             self.logger.info(f"Scanned serial ports: {ports}")
         except Exception as e:
             self.logger.error(f"Error scanning serial ports: {str(e)}")
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: red;'>Error scanning ports: {str(e)}</span>")
+            self.append_terminal(f"Error scanning ports: {str(e)}", "red")
+
+    def on_serial_started(self):
+        for action in getattr(self, 'serial_port_actions', []):
+            action.setEnabled(True)
 
     def change_baud_rate(self):
 
@@ -883,39 +1110,28 @@ class MainWindow(QMainWindow):
                 new_baud = int(choice)
                 self.serial.set_baudrate(new_baud)
 
-                current_time = datetime.now().strftime("%H:%M:%S")
-                self.terminal_output.append(
-                    f">{current_time}: <span style='color: lightgreen;'>Baud rate changed to {new_baud}</span>")
+                self.append_terminal(f"Baud rate changed to {new_baud}", "lightgreen")
                 self.logger.info(f"Baud rate changed to {new_baud}")
             except Exception as e:
                 self.logger.error(f"Error changing baud rate: {str(e)}")
-                current_time = datetime.now().strftime("%H:%M:%S")
-                self.terminal_output.append(
-                    f">{current_time}: <span style='color: red;'>Error changing baud rate: {str(e)}</span>")
+                self.append_terminal(f"Error changing baud rate: {str(e)}", "red")
 
     def reconnect_serial(self):
         try:
             self.serial.reconnect()
-            current_time = datetime.now().strftime("%H:%M:%S")
 
             if self.serial.is_connected():
-                self.terminal_output.append(
-                    f">{current_time}: <span style='color: lightgreen;'>Serial reconnected successfully</span>")
+                self.append_terminal("Serial reconnected successfully", "lightgreen")
                 self.logger.info("Serial reconnected successfully")
             else:
-                self.terminal_output.append(
-                    f">{current_time}: <span style='color: orange;'>Serial reconnection failed</span>")
+                self.append_terminal("Serial reconnection failed", "orange")
                 self.logger.warning("Serial reconnection failed")
         except Exception as e:
             self.logger.error(f"Error reconnecting serial: {str(e)}")
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: red;'>Error reconnecting serial: {str(e)}</span>")
+            self.append_terminal(f"Error reconnecting serial: {str(e)}", "red")
 
     def configure_filters(self):
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: yellow;'>Filter configuration opened</span>")
+        self.append_terminal("Filter configuration opened", "yellow")
 
         # Placeholder for actual implementation
         QMessageBox.information(
@@ -930,33 +1146,30 @@ class MainWindow(QMainWindow):
         for plot in [self.temp_plot, self.press_plot, self.lora_snr_plot]:
             plot.toggle_auto_zoom(state)
 
-        current_time = datetime.now().strftime("%H:%M:%S")
         status = "ON" if state else "OFF"
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: lightblue;'>Auto-zoom turned {status}</span>")
+        self.append_terminal(f"Auto-zoom turned {status}", "lightblue")
         self.logger.info(f"Auto-zoom toggled to {status}")
 
     def calculate_statistics(self):
-        """Calculate and display statistics for plot data"""
+        """Display the whole-session and sliding-window telemetry statistics"""
         try:
-            stats = []
-
-            # Calculate for each plot
-            plots = {
-                "Temperature": self.temp_plot,
-                "Pressure": self.press_plot,
-                "LoRa SNR": self.lora_snr_plot
-            }
+            def fmt(value):
+                return "-" if value is None else f"{value:.2f}"
 
-            for name, plot in plots.items():
-                if plot.values.any():
-                    values = np.array(plot.values)
-                    stats.append(f"<b>{name}:</b>")
-                    stats.append(f"  Min: {np.min(values):.2f}")
-                    stats.append(f"  Max: {np.max(values):.2f}")
-                    stats.append(f"  Mean: {np.mean(values):.2f}")
-                    stats.append(f"  Std Dev: {np.std(values):.2f}")
-                    stats.append("")
+            stats = []
+            for name, summary in self.processor.statistics.summary().items():
+                session = summary['session']
+                stats.append(f"<b>{name}:</b> ({session['count']} samples, {fmt(session['sample_rate'])} Hz)")
+                stats.append(f"  Min: {fmt(session['min'])}  Max: {fmt(session['max'])}")
+                stats.append(f"  Mean: {fmt(session['mean'])}  Std Dev: {fmt(session['std'])}")
+                stats.append(f"  P5 / Median / P95: {fmt(session['p05'])} / {fmt(session['p50'])} / {fmt(session['p95'])}")
+                for window, window_stats in summary.items():
+                    if window == 'session':
+                        continue
+                    stats.append(f"  {window.replace('_', ' ').capitalize()}: mean {fmt(window_stats['mean'])}, "
+                                 f"min {fmt(window_stats['min'])}, max {fmt(window_stats['max'])}, "
+                                 f"rate {fmt(window_stats['rate'])}/s")
+                stats.append("")
 
             if not stats:
                 raise ValueError("No data available for statistics")
@@ -966,7 +1179,7 @@ class MainWindow(QMainWindow):
             # Show in dialog
             dialog = QDialog(self)
             dialog.setWindowTitle("Data Statistics")
-            dialog.resize(200, 400)
+            dialog.resize(520, 600)
             layout = QVBoxLayout()
 
             text_browser = QTextBrowser()
@@ -980,25 +1193,65 @@ class MainWindow(QMainWindow):
             dialog.setLayout(layout)
             dialog.exec()
 
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: lightgreen;'>Calculated data statistics</span>")
+            self.append_terminal("Calculated data statistics", "lightgreen")
             self.logger.info("Calculated data statistics")
 
         except Exception as e:
             self.logger.error(f"Error calculating statistics: {str(e)}")
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: red;'>Error calculating statistics: {str(e)}</span>")
+            self.append_terminal(f"Error calculating statistics: {str(e)}", "red")
+
+    def show_render_statistics(self):
+        stats = RenderScheduler.shared().stats()
+        lines = [f"{name}: {value}" for name, value in stats.items()]
+        self.logger.info(f"Render statistics: {stats}")
+        QMessageBox.information(self, "Render Statistics", "\n".join(lines))
+
+    def show_latency_statistics(self):
+        """Per-stage latency percentiles of the traced records"""
+        tracer = LatencyTracer.shared()
+        summary = tracer.summary()
+        columns = ['count', 'mean_ms', 'p50_ms', 'p90_ms', 'p99_ms', 'p99.9_ms', 'max_ms']
+
+        table = QTableWidget(len(summary), len(columns) + 1)
+        table.setHorizontalHeaderLabels(["stage"] + columns)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        for row, (stage, stats) in enumerate(summary.items()):
+            table.setItem(row, 0, QTableWidgetItem(stage))
+            for column, name in enumerate(columns, start=1):
+                value = stats[name]
+                table.setItem(row, column, QTableWidgetItem("-" if value is None else f"{value:g}"))
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Pipeline Latency ({tracer.traces} traced records)")
+        dialog.resize(760, 360)
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Time since the previous stage; read_to_* rows are end to end.\n"
+                                "displayed: the window's labels and status updated from the record."))
+        layout.addWidget(table)
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Ok)
+        button_box.accepted.connect(dialog.accept)
+        button_box.button(QDialogButtonBox.StandardButton.Save).clicked.connect(self.save_latency_histograms)
+        layout.addWidget(button_box)
+        dialog.setLayout(layout)
+        dialog.exec()
+
+    def save_latency_histograms(self):
+        path = os.path.join(self.csv_handler.session_dir, Config.LATENCY_FILE)
+        try:
+            LatencyTracer.shared().save(path)
+            self.append_terminal(f"Latency histograms saved to {path}", "lightgreen")
+        except OSError as e:
+            self.logger.error(f"Error saving latency histograms: {e}")
+            self.append_terminal(f"Error saving latency histograms: {e}", "red")
 
     def start_status_cycling(self):
         self.status_cycle_timer.timeout.connect(self.cycle_status_image)
         self.status_cycling_active = True
         self.status_cycle_timer.start(2000)
 
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: yellow;'>Started status image cycling (2s interval)</span>")
+        self.append_terminal("Started status image cycling (2s interval)", "yellow")
         self.logger.info("Started status image cycling")
 
     def stop_status_cycling(self):
@@ -1009,46 +1262,54 @@ class MainWindow(QMainWindow):
             self.status_cycling_active = False
             self.current_status_index = 0
 
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.terminal_output.append(
-                f">{current_time}: <span style='color: yellow;'>Stopped status image cycling</span>")
+            self.append_terminal("Stopped status image cycling", "yellow")
             self.logger.info("Stopped status image cycling")
 
     def cycle_status_image(self):
         """Cycle to the next status image dynamically"""
-        image_folder = "gui/resources/status_images"
         if not hasattr(self, 'status_images'):
-            self.status_images = sorted([
-                f for f in os.listdir(image_folder)
-                if f.lower().endswith('.png')
-            ])
+            self.status_images = [f"{name}.png" for name in self.status_image_cache.names]
             self.current_status_index = 0
 
         self.current_status_index = (self.current_status_index + 1) % len(self.status_images)
         self.current_status_image = self.status_images[self.current_status_index]
 
-        try:
-            pixmap = QPixmap(os.path.join(image_folder, self.current_status_image))
-            if not pixmap.isNull():
-                width = 800
-                scaled_pixmap = pixmap.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
-                self.rocket_trajectory_label.setPixmap(scaled_pixmap)
-
-                current_time = datetime.now().strftime("%H:%M:%S")
-                self.terminal_output.append(
-                    f">{current_time}: <span style='color: cyan;'>Status image changed to {self.current_status_image}</span>"
-                )
-            else:
-                self.logger.warning(f"Could not load {self.current_status_image}")
-        except Exception as e:
-            self.logger.error(f"Error loading status image: {str(e)}")
-
-    def handle_processed_data(self, data):
+        if self.show_status_image(os.path.splitext(self.current_status_image)[0]):
+            self.append_terminal(f"Status image changed to {self.current_status_image}", "cyan")
+
+    def show_status_image(self, status):
+        """Show the cached image of ``status``. Returns ``True`` if the shown image changed."""
+        key = (str(status), self.devicePixelRatioF())
+        if key == self.shown_status_image:
+            return False
+        pixmap = self.status_image_cache.pixmap(status, device_pixel_ratio=key[1])
+        if pixmap is None:
+            self.logger.warning(f"Status image not found: {status}.png")
+            return False
+        self.rocket_trajectory_label.setPixmap(pixmap)
+        self.shown_status_image = key
+        return True
+
+    def handle_replayed_data(self, data):
+        self.handle_processed_data(data, replayed=True)
+
+    def handle_processed_data(self, data, replayed=False):
+        """Show a processed record. Replayed records are only displayed, nothing
+        about them is logged to the current session."""
+        if not replayed:
+            self.records_displayed += 1
+        trace = data.get('_trace')
+        if trace is not None:
+            trace.mark('dispatch')
         self.logger.debug(
             f"Odebrano dane przetworzone: {data}")
         self.current_data = data
         try:
-            self.update_data()
+            self.update_data(replayed)
+            if trace is not None:
+                trace.mark('displayed')
+            if '_probe' in data:
+                self.network_reader.echo(data['_probe'])
             # self.csv_handler.write_row(data)
         except Exception as e:
             print("bład", e)
@@ -1056,7 +1317,7 @@ class MainWindow(QMainWindow):
                 f"Błąd w update_data(): {e}")
 
 
-    def update_data(self):
+    def update_data(self, replayed=False):
         """Aktualizacja danych na interfejsie"""
         current_time = datetime.now()
 
@@ -1077,29 +1338,21 @@ class MainWindow(QMainWindow):
         packet_timestamp_str = self.current_data['timestamp']
         packet_dt = datetime.fromisoformat(packet_timestamp_str)
         formatted_packet_time = packet_dt.strftime("%H:%M:%S.%f")[:-4]
-        self.terminal_output.append(
-            f">{message_timestamp}: Packet received from HORUS FAS. Packet timestamp: {formatted_packet_time}")
+        source = "replay" if replayed else "HORUS FAS"
+        self.append_terminal(f"Packet received from {source}. Packet timestamp: {formatted_packet_time}",
+                             persist=not replayed, merge_repeats=True)
 
-        image = f"gui/resources/status_images/{self.current_data['status']}.png"
-        if not os.path.exists(image):
-            self.logger.warning(f"Status image not found: {image}")
-        try:
-            pixmap = QPixmap(image)
-            if not pixmap.isNull():
-                width = 800
-                scaled_pixmap = pixmap.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
-                self.rocket_trajectory_label.setPixmap(scaled_pixmap)
-
-                current_time = datetime.now().strftime("%H:%M:%S")
-                self.terminal_output.append(
-                    f">{current_time}: <span style='color: cyan;'>Status image changed to {self.current_data['status']}.png</span>"
-                )
-            else:
-                self.logger.warning(f"Could not load {image}")
-        except Exception as e:
-            self.logger.error(f"Error loading status image: {str(e)}")
+        if not replayed and self.current_data['status'] != self.last_status:
+            if self.session_database:
+                self.session_database.log_event('status_change', self.current_data['status'])
+            self.last_status = self.current_data['status']
 
-        self.status_packet_label.setText(f"Last received packet: {message_timestamp} s")
+        if self.show_status_image(self.current_data['status']):
+            self.append_terminal(f"Status image changed to {self.current_data['status']}.png", "cyan",
+                                 persist=not replayed)
+
+        if not replayed:
+            self.status_packet_label.setText(f"Last received packet: {message_timestamp} s")
 
         # if not self.mission_aborted:
             # if self.current_data['progress'] != -1:
@@ -1110,23 +1363,19 @@ class MainWindow(QMainWindow):
             #     f">{current_time}: <span style='color: red;'>Received invalid status from LOTUS ONE. Received packet: {self.current_data['status']}</span>")
 
     def on_partner_connected(self):
-        current_time = datetime.now().strftime("%H:%M:%S")
         self.logger.info("HORUS FAS connected to HORUS CSS")
         self.connection_label.setText("   HORUS FAS connected")
         self.connection_label.setStyleSheet("color: #66FF00; font-weight: bold;")
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: #66FF00;'>Connected to HORUS FAS</span>")
+        self.append_terminal("Connected to HORUS FAS", "#66FF00")
 
         self.global_status_label.setText("Status: <span style='color: #66FF00;'>Connected</span>")
         self.is_partner_connected = True
 
     def on_partner_disconnected(self):
-        current_time = datetime.now().strftime("%H:%M:%S")
         self.logger.info("HORUS FAS disconnected from HORUS CSS")
         self.connection_label.setText("HORUS FAS disconnected")
         self.connection_label.setStyleSheet("color: red; font-weight: bold;")
-        self.terminal_output.append(
-            f">{current_time}: <span style='color: red;'>Disconnected from HORUS FAS</span>")
+        self.append_terminal("Disconnected from HORUS FAS", "red")
         self.global_status_label.setText("Status: <span style='color: red;'>Not connected</span>")
         self.is_partner_connected = False
 
@@ -1135,6 +1384,12 @@ class MainWindow(QMainWindow):
             self.heartbeat_timer.stop()
         if hasattr(self, "serial") and self.serial:
             self.serial.stop_reading()
-        if hasattr(self, "csv_handler") and self.csv_handler:
-            self.csv_handler.close_file()
+        if hasattr(self, "replay") and self.replay:
+            self.replay.stop()
+        if hasattr(self, "processor") and self.processor:
+            self.processor.close_storage()
+            self.save_latency_histograms()
+        if hasattr(self, "temp_plot"):
+            for plot in (self.temp_plot, self.press_plot, self.lora_snr_plot):
+                plot.detach_archive()
         super().closeEvent(event)
\ No newline at end of file
@@ -0,0 +1,78 @@
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QLabel
+
+from core.config import Config
+from core.performance_monitor import PerformanceMonitor
+from gui.render_scheduler import RenderScheduler
+
+
+class PerformanceHud(QLabel):
+    """One-line performance panel for the status bar.
+
+    Once ``start`` is called (after the sources are added to ``monitor``),
+    samples the ``PerformanceMonitor`` every ``interval`` seconds and shows the
+    packet rates, errors, queue depths, render timing and process usage. The
+    text turns orange once a queue holds ``backlog_warning`` records or the
+    plots render over their frame budget, and red at ten times that
+    backlog, i.e. when the station no longer keeps up with the data.
+    """
+
+    COLORS = ("lightgreen", "orange", "red")
+
+    def __init__(self, monitor=None, interval=Config.PERFORMANCE_HUD_INTERVAL,
+                 backlog_warning=Config.PERFORMANCE_BACKLOG_WARNING, parent=None):
+        super().__init__(parent)
+        self.monitor = monitor or PerformanceMonitor()
+        self.backlog_warning = backlog_warning
+        self.last_sample = {}
+        self.level = 0
+        self.interval = interval
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def start(self):
+        self.timer.start(int(self.interval * 1000))
+        self.refresh()
+
+    def stop(self):
+        self.timer.stop()
+
+    @staticmethod
+    def fmt(value, format_spec=".0f", unit=""):
+        return "-" if value is None else f"{value:{format_spec}}{unit}"
+
+    def lag_level(self, sample):
+        backlog = max(sample.get('gui_queue') or 0, sample.get('storage_backlog') or 0)
+        if backlog >= 10 * self.backlog_warning:
+            return 2
+        if backlog >= self.backlog_warning:
+            return 1
+        # The load only changes when frames are drawn, ignore it while the plots are idle
+        if sample.get('frames_rate') and (sample.get('render_load') or 0) > RenderScheduler.FRAME_BUDGET:
+            return 1
+        return 0
+
+    def refresh(self):
+        sample = self.monitor.sample()
+        self.last_sample = sample
+        fmt = self.fmt
+        errors = sum(sample.get(name) or 0 for name in ('serial_errors', 'tcp_errors', 'processing_errors'))
+
+        self.setText(
+            f"Serial {fmt(sample.get('serial_packets_rate'), '.1f', '/s')} | "
+            f"TCP {fmt(sample.get('tcp_messages_rate'), '.1f', '/s')} | "
+            f"Err {errors} | "
+            f"Queue {fmt(sample.get('gui_queue'))} | "
+            f"Frame {fmt(sample.get('frame_ms'), '.1f', ' ms')} | "
+            f"{fmt(sample.get('frames_rate'))} FPS | "
+            f"CSV {fmt(sample.get('csv_backlog'))} | "
+            f"{fmt(sample.get('rss_mb'), '.0f', ' MB')} | "
+            f"CPU {fmt(sample.get('cpu_percent'), '.0f', '%')}")
+        self.setToolTip("\n".join(f"{name}: {fmt(value, '.2f') if isinstance(value, float) else value}"
+                                  for name, value in sample.items()))
+
+        level = self.lag_level(sample)
+        if level != self.level or not self.styleSheet():
+            self.level = level
+            self.setStyleSheet(f"font-size: 12px; color: {self.COLORS[level]};")
@@ -0,0 +1,193 @@
+import os
+import csv
+import logging
+import threading
+from datetime import datetime
+
+import numpy as np
+from PyQt6.QtCore import QObject, QPointF, QRectF, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter, QPainterPath, QPen
+from PyQt6.QtSvg import QSvgGenerator
+
+
+class PlotExporter(QObject):
+    """Saves plots as PNG, SVG, CSV or NPZ on a worker thread.
+
+    ``LivePlot.export_snapshot`` copies the decimated data of a plot on the
+    GUI thread, which costs about as much as one frame; drawing and writing
+    the files then happens on the worker, with ``QImage``/``QSvgGenerator``
+    instead of the live pyqtgraph scene, so the window keeps rendering.
+    """
+
+    progress = pyqtSignal(int, int)     # files written, files in total
+    finished = pyqtSignal(list)         # written filenames
+    failed = pyqtSignal(str)
+
+    FORMATS = ('png', 'svg', 'csv', 'npz')
+    MARGINS = (90, 40, 30, 60)          # left, top, right, bottom in pixels
+    TICKS = 6
+    BACKGROUND = QColor(32, 36, 44)
+    FOREGROUND = QColor(200, 200, 200)
+
+    def __init__(self, parent=None, width=1920, height=1080):
+        super().__init__(parent)
+        self.logger = logging.getLogger('HORUS_CSS.plot_exporter')
+        self.width = width
+        self.height = height
+        self.thread = None
+
+    @property
+    def busy(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def export(self, snapshots, directory, format, suffix=None):
+        """Write ``{name: snapshot}`` as ``<name>_plot_<suffix>.<format>`` files.
+
+        Returns ``False`` without doing anything while an export is running.
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+        if self.busy:
+            return False
+        suffix = suffix or datetime.now().strftime("%Y%m%d_%H%M%S")
+        jobs = [(snapshot, os.path.join(directory, f"{name}_plot_{suffix}.{format}"))
+                for name, snapshot in snapshots.items()]
+        self.thread = threading.Thread(target=self._run, args=(jobs, format),
+                                       name='PlotExporter', daemon=True)
+        self.thread.start()
+        return True
+
+    def _run(self, jobs, format):
+        writer = getattr(self, f"write_{format}")
+        written = []
+        try:
+            self.progress.emit(0, len(jobs))
+            for snapshot, filename in jobs:
+                writer(snapshot, filename)
+                written.append(filename)
+                self.progress.emit(len(written), len(jobs))
+        except Exception as e:
+            self.logger.error(f"Error exporting plots: {e}")
+            self.failed.emit(str(e))
+            return
+        self.logger.info(f"Exported {len(written)} plots as {format.upper()}")
+        self.finished.emit(written)
+
+    def write_png(self, snapshot, filename):
+        image = QImage(self.width, self.height, QImage.Format.Format_ARGB32)
+        image.fill(self.BACKGROUND)
+        painter = QPainter(image)
+        try:
+            self.paint(painter, snapshot, self.width, self.height)
+        finally:
+            painter.end()
+        if not image.save(filename):
+            raise OSError(f"Cannot write {filename}")
+
+    def write_svg(self, snapshot, filename):
+        generator = QSvgGenerator()
+        generator.setFileName(filename)
+        generator.setSize(QSize(self.width, self.height))
+        generator.setViewBox(QRectF(0, 0, self.width, self.height))
+        painter = QPainter(generator)
+        try:
+            painter.fillRect(QRectF(0, 0, self.width, self.height), self.BACKGROUND)
+            self.paint(painter, snapshot, self.width, self.height)
+        finally:
+            painter.end()
+
+    @staticmethod
+    def write_csv(snapshot, filename):
+        """The plotted points, one row per point of every series."""
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(['series', 'timestamp', 'value'])
+            for series in snapshot['series']:
+                for x, y in zip(series['x'].tolist(), series['y'].tolist()):
+                    writer.writerow([series['name'], datetime.fromtimestamp(x).isoformat(),
+                                     '' if np.isnan(y) else repr(y)])
+
+    @staticmethod
+    def write_npz(snapshot, filename):
+        arrays = {}
+        for index, series in enumerate(snapshot['series']):
+            arrays[f"series_{index}_x"] = series['x']
+            arrays[f"series_{index}_y"] = series['y']
+        names = np.array([series['name'] for series in snapshot['series']])
+        np.savez_compressed(filename, names=names, x_range=np.array(snapshot['x_range']),
+                            y_range=np.array(snapshot['y_range']), **arrays)
+
+    def paint(self, painter, snapshot, width, height):
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        left, top, right, bottom = self.MARGINS
+        area = QRectF(left, top, width - left - right, height - top - bottom)
+        (x_min, x_max), (y_min, y_max) = snapshot['x_range'], snapshot['y_range']
+        x_span = (x_max - x_min) or 1.0
+        y_span = (y_max - y_min) or 1.0
+
+        def to_x(x):
+            return area.left() + (x - x_min) / x_span * area.width()
+
+        def to_y(y):
+            return area.bottom() - (y - y_min) / y_span * area.height()
+
+        font = QFont()
+        font.setPixelSize(14)
+        painter.setFont(font)
+        grid_pen = QPen(QColor(255, 255, 255, 60), 1)
+        text_pen = QPen(self.FOREGROUND, 1)
+
+        for x in np.linspace(x_min, x_max, self.TICKS):
+            if snapshot['grid']:
+                painter.setPen(grid_pen)
+                painter.drawLine(QPointF(to_x(x), area.top()), QPointF(to_x(x), area.bottom()))
+            painter.setPen(text_pen)
+            painter.drawText(QRectF(to_x(x) - 60, area.bottom() + 5, 120, 20),
+                             Qt.AlignmentFlag.AlignHCenter, datetime.fromtimestamp(x).strftime('%H:%M:%S'))
+        for y in np.linspace(y_min, y_max, self.TICKS):
+            if snapshot['grid']:
+                painter.setPen(grid_pen)
+                painter.drawLine(QPointF(area.left(), to_y(y)), QPointF(area.right(), to_y(y)))
+            painter.setPen(text_pen)
+            painter.drawText(QRectF(0, to_y(y) - 10, left - 8, 20),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, f"{y:.4g}")
+
+        painter.setPen(text_pen)
+        painter.drawRect(area)
+        painter.drawText(QRectF(left, height - 25, area.width(), 20),
+                         Qt.AlignmentFlag.AlignHCenter, snapshot['x_label'])
+        painter.save()
+        painter.translate(15, area.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-area.height() / 2, -10, area.height(), 20),
+                         Qt.AlignmentFlag.AlignHCenter, snapshot['y_label'])
+        painter.restore()
+
+        painter.setClipRect(area)
+        for series in snapshot['series']:
+            painter.setPen(QPen(QColor(series['color']), snapshot['line_width']))
+            painter.drawPath(self.series_path(series['x'], series['y'], to_x, to_y))
+        painter.setClipping(False)
+
+        # Legend
+        painter.setPen(text_pen)
+        for index, series in enumerate(snapshot['series']):
+            y = area.top() + 10 + index * 20
+            painter.fillRect(QRectF(area.right() - 200, y + 5, 20, 4), QColor(series['color']))
+            painter.drawText(QRectF(area.right() - 170, y - 3, 160, 20), Qt.AlignmentFlag.AlignLeft, series['name'])
+
+    @staticmethod
+    def series_path(x, y, to_x, to_y):
+        """Polyline through the points, broken where a value is missing."""
+        path = QPainterPath()
+        xs, ys = to_x(np.asarray(x)), to_y(np.asarray(y))
+        pen_down = False
+        for px, py in zip(xs.tolist(), ys.tolist()):
+            if np.isnan(py):
+                pen_down = False
+            elif pen_down:
+                path.lineTo(px, py)
+            else:
+                path.moveTo(px, py)
+                pen_down = True
+        return path
@@ -0,0 +1,119 @@
+import time
+import logging
+from collections import deque
+
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer
+
+from core.config import Config
+
+
+class RenderScheduler(QObject):
+    """Shared frame clock of the live plots.
+
+    Plots call ``mark_dirty`` when their data or view changes and are redrawn
+    together on the next frame, at most ``target_fps`` times per second, no
+    matter how many samples arrived in between. When frames take too long or
+    the event loop delivers them late (GUI thread saturated), the frame rate
+    is lowered towards ``min_fps`` and raised again once there is headroom.
+    """
+
+    _shared = None
+
+    FRAME_BUDGET = 0.5      # fraction of the frame interval rendering may use
+    SMOOTHING = 0.2         # weight of the newest frame in the load average
+
+    def __init__(self, target_fps=Config.PLOT_TARGET_FPS, min_fps=Config.PLOT_MIN_FPS, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger('HORUS_CSS.render_scheduler')
+        self.target_fps = target_fps
+        self.min_fps = min_fps
+        self.fps = float(target_fps)
+        self.dirty = {}
+        self.load = 0.0
+        self.frames = 0
+        self.coalesced = 0
+        self.last_frame = 0.0
+        self.scheduled_at = 0.0
+        self.frame_times = deque(maxlen=240)
+        self.frame_starts = deque(maxlen=240)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.render_frame)
+
+    @classmethod
+    def shared(cls):
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def interval(self):
+        return 1.0 / self.fps
+
+    def mark_dirty(self, plot):
+        if plot in self.dirty:
+            self.coalesced += 1
+            return
+        self.dirty[plot] = True
+        self.schedule()
+
+    def schedule(self):
+        if not self.timer.isActive():
+            delay = max(0.0, self.last_frame + self.interval - time.perf_counter())
+            self.scheduled_at = time.perf_counter() + delay
+            self.timer.start(int(delay * 1000))
+
+    def discard(self, plot):
+        self.dirty.pop(plot, None)
+
+    def render_frame(self):
+        start = time.perf_counter()
+        lag = max(0.0, start - self.scheduled_at)
+        plots = list(self.dirty)
+        self.dirty.clear()
+        for plot in plots:
+            try:
+                plot.render_frame()
+            except Exception as e:
+                self.logger.error(f"Error rendering {plot}: {e}")
+        end = time.perf_counter()
+
+        self.frames += 1
+        self.last_frame = end
+        self.frame_times.append(end - start)
+        self.frame_starts.append(start)
+        self.adapt((end - start + lag) / self.interval)
+
+        if self.dirty:
+            # Marked again while rendering
+            self.scheduled_at = end + self.interval
+            self.timer.start(int(self.interval * 1000))
+
+    def adapt(self, frame_load):
+        self.load = (1 - self.SMOOTHING) * self.load + self.SMOOTHING * frame_load
+        if self.load > self.FRAME_BUDGET and self.fps > self.min_fps:
+            self.fps = max(self.min_fps, self.fps * 0.8)
+            self.logger.debug(f"Render load {self.load:.2f}, lowering frame rate to {self.fps:.1f} FPS")
+        elif self.load < self.FRAME_BUDGET / 2 and self.fps < self.target_fps:
+            self.fps = min(self.target_fps, self.fps * 1.1 + 0.5)
+
+    def stats(self):
+        """Frame statistics of the last ``frame_times.maxlen`` frames."""
+        times = np.array(self.frame_times) * 1000
+        starts = np.array(self.frame_starts)
+        measured = 0.0
+        if len(starts) > 1 and starts[-1] > starts[0]:
+            measured = float((len(starts) - 1) / (starts[-1] - starts[0]))
+        return {
+            'target_fps': self.target_fps,
+            'fps_limit': round(self.fps, 1),
+            'measured_fps': round(measured, 1),
+            'frame_ms_mean': round(float(times.mean()), 2) if len(times) else 0.0,
+            'frame_ms_p95': round(float(np.percentile(times, 95)), 2) if len(times) else 0.0,
+            'frame_ms_max': round(float(times.max()), 2) if len(times) else 0.0,
+            'load': round(self.load, 2),
+            'frames': self.frames,
+            'coalesced_updates': self.coalesced,
+        }
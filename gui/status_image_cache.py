@@ -0,0 +1,61 @@
+import os
+import logging
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPixmap
+
+
+class StatusImageCache:
+    """Status images decoded once and scaled once per (width, device pixel ratio).
+
+    ``pixmap(name)`` is a dictionary lookup after the first call for a size,
+    so showing a status on every packet needs neither disk I/O nor scaling.
+    """
+
+    def __init__(self, directory, width=800):
+        self.logger = logging.getLogger('HORUS_CSS.status_image_cache')
+        self.directory = directory
+        self.width = width
+        self.images = {}
+        self.pixmaps = {}
+        self.load()
+
+    def load(self):
+        self.images = {}
+        self.pixmaps = {}
+        try:
+            filenames = sorted(f for f in os.listdir(self.directory) if f.lower().endswith('.png'))
+        except OSError as e:
+            self.logger.error(f"Cannot list status images in {self.directory}: {e}")
+            return
+        for filename in filenames:
+            image = QImage(os.path.join(self.directory, filename))
+            if image.isNull():
+                self.logger.warning(f"Could not load {filename}")
+                continue
+            self.images[os.path.splitext(filename)[0]] = image
+
+    @property
+    def names(self):
+        return list(self.images.keys())
+
+    def prescale(self, width=None, device_pixel_ratio=1.0):
+        """Scale every image for a size up front, e.g. at startup or after a DPI change."""
+        for name in self.images:
+            self.pixmap(name, width, device_pixel_ratio)
+
+    def pixmap(self, name, width=None, device_pixel_ratio=1.0):
+        """Scaled pixmap of status ``name`` (e.g. ``'2A'``), ``None`` if there is no such image."""
+        width = width or self.width
+        key = (str(name), width, device_pixel_ratio)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            image = self.images.get(str(name))
+            if image is None:
+                return None
+            scaled = image.scaledToWidth(round(width * device_pixel_ratio),
+                                         Qt.TransformationMode.SmoothTransformation)
+            pixmap = QPixmap.fromImage(scaled)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            self.pixmaps[key] = pixmap
+        return pixmap
@@ -0,0 +1,223 @@
+import re
+import time
+from collections import deque
+from datetime import datetime
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QListView, QVBoxLayout, QWidget
+
+from core.config import Config
+from core.utils import Utils
+from gui.render_scheduler import RenderScheduler
+
+
+class TerminalEntry:
+    __slots__ = ('sequence', 'time', 'text', 'color', 'severity', 'key', 'repeats', 'created')
+
+    def __init__(self, sequence, text, color, severity, key):
+        self.sequence = sequence
+        self.time = datetime.now().strftime("%H:%M:%S")
+        self.text = text
+        self.color = color
+        self.severity = severity
+        self.key = key
+        self.repeats = 1
+        self.created = time.monotonic()
+
+    def line(self):
+        suffix = f" (x{self.repeats})" if self.repeats > 1 else ""
+        return f">{self.time}: {self.text}{suffix}"
+
+
+class TerminalModel(QAbstractListModel):
+    """Ring buffer of the last ``max_lines`` terminal messages.
+
+    Messages are queued by ``append`` and inserted in one batch per frame of
+    the render scheduler, one line per line of the message. A message
+    appended with ``merge_repeats`` (the per-packet message) of the same kind,
+    i.e. equal apart from its numbers, as one shown less than
+    ``repeat_interval`` seconds ago updates that line and its repeat counter
+    instead of adding a new one.
+    """
+
+    INFO, WARNING, ERROR = range(3)
+    SEVERITY_COLORS = {'red': ERROR, 'orange': WARNING}
+    SeverityRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, max_lines=Config.TERMINAL_MAX_LINES,
+                 repeat_interval=Config.TERMINAL_REPEAT_INTERVAL, scheduler=None, parent=None):
+        super().__init__(parent)
+        self.max_lines = max_lines
+        self.repeat_interval = repeat_interval
+        self.scheduler = scheduler or RenderScheduler.shared()
+        self.entries = deque()
+        self.pending = []
+        self.latest = {}        # message kind -> newest entry of that kind
+        self.sequence = 0
+        self.suppressed = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry.line()
+        if role == Qt.ItemDataRole.ForegroundRole and entry.color:
+            return QColor(entry.color)
+        if role == self.SeverityRole:
+            return entry.severity
+        return None
+
+    def append(self, message, color=None, merge_repeats=False):
+        lines = Utils.plain_text(message).splitlines() or ['']
+        if len(lines) > 1:
+            for line in lines:
+                self.add_line(line, color)
+            return
+        self.add_line(lines[0], color, merge_repeats)
+
+    def add_line(self, text, color=None, merge_repeats=False):
+        key = (re.sub(r'\d+', '#', text), color) if merge_repeats else None
+        latest = self.latest.get(key) if merge_repeats else None
+        if latest is not None and time.monotonic() - latest.created < self.repeat_interval:
+            latest.text = text
+            latest.time = datetime.now().strftime("%H:%M:%S")
+            latest.repeats += 1
+            self.suppressed += 1
+            self.changed_entry(latest)
+            return
+
+        severity = self.SEVERITY_COLORS.get(color, self.INFO)
+        entry = TerminalEntry(self.sequence, text, color, severity, key)
+        self.sequence += 1
+        if merge_repeats:
+            self.latest[key] = entry
+        self.pending.append(entry)
+        self.scheduler.mark_dirty(self)
+
+    def changed_entry(self, entry):
+        if self.entries and entry.sequence >= self.entries[0].sequence and entry not in self.pending:
+            row = entry.sequence - self.entries[0].sequence
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def render_frame(self):
+        """Insert the queued messages, dropping the oldest lines beyond ``max_lines``."""
+        if not self.pending:
+            return
+        dropped, pending, self.pending = self.pending[:-self.max_lines], self.pending[-self.max_lines:], []
+        for entry in dropped:
+            self.forget(entry)
+
+        overflow = len(self.entries) + len(pending) - self.max_lines
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.forget(self.entries.popleft())
+            self.endRemoveRows()
+
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(pending) - 1)
+        self.entries.extend(pending)
+        self.endInsertRows()
+
+    def forget(self, entry):
+        """Stop merging repeats into an entry that is no longer shown."""
+        if self.latest.get(entry.key) is entry:
+            del self.latest[entry.key]
+
+    def clear(self):
+        self.beginResetModel()
+        self.entries.clear()
+        self.pending = []
+        self.latest = {}
+        self.endResetModel()
+
+    def lines(self):
+        """Plain text of every buffered line, oldest first, including ones not shown yet."""
+        for entry in list(self.entries) + self.pending:
+            yield entry.line()
+
+
+class SeverityFilter(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.minimum = TerminalModel.INFO
+
+    def set_minimum(self, severity):
+        self.minimum = severity
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, row, parent):
+        if self.minimum == TerminalModel.INFO:
+            return True
+        index = self.sourceModel().index(row, 0, parent)
+        return self.sourceModel().data(index, TerminalModel.SeverityRole) >= self.minimum
+
+
+class TerminalView(QWidget):
+    """Bounded terminal log: a ``QListView`` over ``TerminalModel`` that only
+    lays out the visible lines, with a severity filter."""
+
+    FILTERS = (("All", TerminalModel.INFO),
+               ("Warnings", TerminalModel.WARNING),
+               ("Errors", TerminalModel.ERROR))
+
+    def __init__(self, parent=None, max_lines=Config.TERMINAL_MAX_LINES):
+        super().__init__(parent)
+        self.model = TerminalModel(max_lines, parent=self)
+        self.filter = SeverityFilter(self)
+        self.filter.setSourceModel(self.model)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.filter)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setWordWrap(False)
+        self.list_view.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
+
+        self.severity_box = QComboBox()
+        for name, severity in self.FILTERS:
+            self.severity_box.addItem(name, severity)
+        self.severity_box.currentIndexChanged.connect(
+            lambda: self.filter.set_minimum(self.severity_box.currentData()))
+
+        header = QHBoxLayout()
+        header.setContentsMargins(0, 0, 0, 0)
+        header.addStretch(1)
+        header.addWidget(QLabel("Show:"))
+        header.addWidget(self.severity_box)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(header)
+        layout.addWidget(self.list_view)
+        self.setLayout(layout)
+
+        self.follow = True
+        self.list_view.verticalScrollBar().valueChanged.connect(self.on_scrolled)
+        self.filter.rowsInserted.connect(self.scroll_to_end)
+
+    def append(self, message, color=None, merge_repeats=False):
+        self.model.append(message, color, merge_repeats)
+
+    def clear(self):
+        self.model.clear()
+
+    def save(self, path):
+        """Write the buffered lines to ``path`` line by line."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in self.model.lines():
+                f.write(line + "\n")
+
+    def on_scrolled(self, value):
+        # Keep following new lines only while the view is at the bottom
+        scroll_bar = self.list_view.verticalScrollBar()
+        self.follow = value >= scroll_bar.maximum()
+
+    def scroll_to_end(self):
+        if self.follow:
+            self.list_view.scrollToBottom()
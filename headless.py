@@ -0,0 +1,142 @@
+"""Headless HORUS CSS: serial ingest, network server, GPIO abort button and
+session storage without any Qt widgets or display server.
+
+Runs on a ``QCoreApplication`` event loop (the serial reader and the data
+processor talk through Qt signals) until SIGINT/SIGTERM or ``--duration``.
+The connection settings come from ``--config`` (a JSON file with the keys of
+``SerialConfigDialog.get_settings``) and are overridden by the options.
+
+Example::
+
+    python headless.py --port /dev/ttyUSB0 --baudrate 115200 --ip 0.0.0.0 --net-port 65432
+"""
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import argparse
+
+from PyQt6.QtCore import QCoreApplication, QTimer
+
+from core.ground_station import GroundStation
+from core.process_data import ProcessData
+from core.serial_reader import SerialReader
+from core.latency_tracer import LatencyTracer
+from core.config import Config
+
+
+def load_config(args):
+    config = GroundStation.default_config()
+    if args.config:
+        with open(args.config, encoding='utf-8') as f:
+            loaded = json.load(f)
+        config.update({key: value for key, value in loaded.items() if key != 'network'})
+        config['network'].update(loaded.get('network', {}))
+    if args.port is not None:
+        config['port'] = args.port
+    if args.baudrate is not None:
+        config['baudrate'] = args.baudrate
+    if args.ip is not None:
+        config['network']['ip_address'] = args.ip
+    if args.net_port is not None:
+        config['network']['port'] = args.net_port
+    return config
+
+
+class HeadlessStation:
+    """Wires the serial reader and the data processor to the ``GroundStation``
+    backends the way ``MainWindow`` does, minus the widgets."""
+
+    def __init__(self, station, config):
+        self.station = station
+        self.logger = logging.getLogger('HORUS_CSS.headless')
+        self.started = time.monotonic()
+        self.last_records = 0
+
+        station.create_backends(config)
+        self.config = config
+        self.serial = SerialReader(config['port'], config['baudrate'], connect=False)
+        self.processor = ProcessData(station.csv_handler, station.storage_handlers)
+
+        station.network_reader.subcribe_on_data_received(self.processor.on_ethernet_data_received)
+        self.processor.processed_data_ready.connect(self.echo_probe)
+        self.serial.telemetry_received.connect(self.processor.handle_telemetry)
+        self.serial.transmission_info_received.connect(self.processor.handle_transmission_info)
+        self.serial.transmission_info_received.connect(station.session_database.write_transmission)
+
+    def start(self):
+        self.serial.start_in_background(self.config['lora_config'], self.config['is_config_selected'])
+        self.station.start_network()
+        self.logger.info(f"Headless ground station running, session: {self.station.session_dir}")
+
+    def echo_probe(self, record):
+        if '_probe' in record:
+            self.station.network_reader.echo(record['_probe'])
+
+    def report(self):
+        records = self.processor.records_emitted
+        backlog = {type(handler).__name__: handler.backlog
+                   for handler in self.processor.storage_handlers if hasattr(handler, 'backlog')}
+        self.logger.info(f"Records: {records} (+{records - self.last_records}), "
+                         f"uptime {time.monotonic() - self.started:.0f} s, storage backlog: {backlog}")
+        self.last_records = records
+
+    def stop(self):
+        self.serial.stop_reading()
+        self.processor.close_storage()
+        LatencyTracer.shared().save(os.path.join(self.station.session_dir, Config.LATENCY_FILE))
+        self.station.stop()
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="HORUS CSS without GUI")
+    parser.add_argument('--config', help="JSON file with the connection settings")
+    parser.add_argument('--port', help="serial port of the LoRa module")
+    parser.add_argument('--baudrate', type=int)
+    parser.add_argument('--ip', help="address the FAS network server listens on")
+    parser.add_argument('--net-port', type=int, help="port of the FAS network server")
+    parser.add_argument('--duration', type=float, default=0.0,
+                        help="stop after this many seconds (0 runs until SIGINT/SIGTERM)")
+    parser.add_argument('--status-interval', type=float, default=10.0,
+                        help="seconds between status log lines (0 disables)")
+    parser.add_argument('--quiet', action='store_true', help="log only to the session log file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    station = GroundStation(log_handlers=[] if args.quiet else [console])
+    config = load_config(args)
+    station.logger.info(f"Headless configuration: {config}")
+
+    app = QCoreApplication(sys.argv[:1])
+    headless = HeadlessStation(station, config)
+
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    # Python only runs signal handlers between bytecodes, wake the interpreter up regularly
+    wakeup = QTimer()
+    wakeup.timeout.connect(lambda: None)
+    wakeup.start(200)
+
+    if args.status_interval > 0:
+        status_timer = QTimer()
+        status_timer.timeout.connect(headless.report)
+        status_timer.start(int(args.status_interval * 1000))
+    if args.duration > 0:
+        QTimer.singleShot(int(args.duration * 1000), app.quit)
+
+    headless.start()
+    exit_code = app.exec()
+    headless.report()
+    headless.stop()
+    station.logger.info(f"Aplikacja zakończona z kodem {exit_code}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,34 +1,25 @@
+from core.startup_timer import StartupTimer
+
+startup = StartupTimer()
+
 import sys
 import logging
 import platform
-import threading
-from functools import partial
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QApplication, QDialog
 
-from core.csv_handler import CsvHandler
-from gui.main_window import MainWindow
+from core.ground_station import GroundStation
 from core.serial_config import SerialConfigDialog
-from core.network_reader import NetworkTransmitter
-from core.utils import Utils
 from core.config import Config
-from core.gpio_reader import GpioReader
 import os
 
-def main():
-    session_dir = Utils.create_session_directory()
-    log_file = os.path.join(session_dir, 'app_events.log')
+startup.mark('imports')
 
-    logging.basicConfig(
-        filename=log_file,
-        filemode='a',
-        level=logging.DEBUG,
-        format='%(asctime)s %(levelname)-8s %(name)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
 
-    logger = logging.getLogger('HORUS_CSS_logger')
-    logger.info(f"Log file location: {log_file}")
-    logger.info("Uruchamianie aplikacji")
+def main():
+    station = GroundStation()
+    logger = station.logger
+    startup.mark('session')
 
     app = QApplication(sys.argv)
     logger.debug("QApplication instance created")
@@ -36,50 +27,51 @@ def main():
     config_dialog = SerialConfigDialog(default_ip_address=Config.DEFAULT_IP_ADDRESS)
     logger.debug("SerialConfigDialog initialized with default IP: %s", Config.DEFAULT_IP_ADDRESS)
 
+    def import_window():
+        import gui.main_window  # noqa: F401
+        startup.mark('window import')
+
+    # pyqtgraph, numpy and the plots are imported from the dialog's event loop,
+    # while the user is filling it in
+    QTimer.singleShot(0, import_window)
+
     if config_dialog.exec() == QDialog.DialogCode.Accepted:
         config = config_dialog.get_settings()
         logger.info(f"Konfiguracja portu załadowana: {config}")
     else:
-        config = {
-            'port': "",
-            'baudrate': Config.DEFAULT_BAUD_RATE,
-            'lora_config': None,
-            'is_config_selected': True,
-            'network': {
-                'ip_address': Config.DEFAULT_IP_ADDRESS,
-                'port': Config.DEFAULT_IP_PORT
-            }
-        }
+        config = GroundStation.default_config()
         logger.warning("Użytkownik zrezygnował z portu – używam domyślnych ustawień: %s", config)
+    startup.mark('config dialog')
 
-    network_config = config['network']
-    logger.debug("Initializing NetworkTransmitter with IP %s and port %s", network_config['ip_address'], network_config['port'])
-    network_reader = NetworkTransmitter(host=network_config['ip_address'], port=int(network_config['port']))
+    # Already imported unless the dialog was closed before the timer fired
+    from gui.main_window import MainWindow
 
-    gpio_reader = GpioReader(Config.DEFAULT_GPIO_PIN)
-    logger.debug("GpioReader initialized on pin %s", Config.DEFAULT_GPIO_PIN)
-    gpio_reader.subscribe_when_held(partial(network_reader.send, {"event": "mission_abort_pressed"}))
-    logger.debug("Subscribed GPIO event to send mission_abort_pressed event")
+    station.create_backends(config)
+    startup.mark('backends')
 
-    csv_handler = CsvHandler()
-    window = MainWindow(config, network_reader, gpio_reader, csv_handler)
+    window = MainWindow(config, station.network_reader, station.gpio_reader, station.csv_handler,
+                        storage_handlers=station.storage_handlers,
+                        session_database=station.session_database,
+                        on_backend_connected=station.start_network)
     logger.debug("MainWindow created with given configuration")
-
-    network_thread = threading.Thread(target=network_reader.connect_to_server, daemon=False)
-    network_thread.start()
-    logger.info("Network thread started")
+    startup.mark('window')
 
     window.show()
     logger.debug("Main window shown")
+    startup.mark('shown')
+    startup.report()
+
+    def first_packet():
+        startup.mark('first packet')
+        startup.report()
+
+    # Emitted from the serial and the network reader threads, possibly both at once
+    window.processor.processed_data_ready.connect(first_packet, Qt.ConnectionType.SingleShotConnection)
 
     exit_code = app.exec()
     logger.info(f"Aplikacja zakończona z kodem {exit_code}")
 
-    network_reader.stop()
-    network_thread.join(timeout=1)
-
-    active_threads = threading.enumerate()
-    logger.warning("Still active threads after join: %s", [t.name for t in active_threads])
+    station.stop()
 
     sys.exit(exit_code)
 
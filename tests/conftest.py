@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The modules are imported as ``core.*`` and ``gui.*`` from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Qt models are tested without a display
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
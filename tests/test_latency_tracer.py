@@ -0,0 +1,107 @@
+import json
+
+import numpy as np
+import pytest
+
+from core import latency_tracer
+from core.latency_tracer import LatencyHistogram, LatencyTracer
+
+
+@pytest.mark.parametrize('p', [1, 50, 90, 99, 99.9, 100])
+def test_percentile_is_within_the_bucket_precision(p):
+    rng = np.random.default_rng(11)
+    # from microseconds to minutes
+    seconds = np.exp(rng.uniform(np.log(1e-6), np.log(100.0), 20000))
+    histogram = LatencyHistogram()
+    for value in seconds:
+        histogram.record(value)
+
+    micros = np.floor(seconds * 1e6)
+    exact = np.percentile(micros, p, method='inverted_cdf') / 1e6
+    assert histogram.percentile(p) >= exact
+    assert histogram.percentile(p) <= exact * (1 + 1 / 128) + 1e-6
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for micros in (3, 1, 200, 7):
+        histogram.record(micros / 1e6)
+
+    assert histogram.percentile(50) == 3e-6
+    assert histogram.percentile(100) == 200e-6
+    assert histogram.percentile(0) == 1e-6
+
+
+def test_percentile_never_exceeds_the_maximum():
+    histogram = LatencyHistogram()
+    histogram.record(1.0001)
+
+    assert histogram.percentile(99) == pytest.approx(1.0001)
+
+
+def test_summary():
+    histogram = LatencyHistogram()
+    assert histogram.summary()['mean_ms'] is None
+    assert histogram.percentile(50) is None
+    for milliseconds in (1, 2, 3, 10):
+        histogram.record(milliseconds / 1000)
+
+    summary = histogram.summary()
+    assert summary['count'] == 4
+    assert summary['mean_ms'] == 4.0
+    assert (summary['min_ms'], summary['max_ms']) == (1.0, 10.0)
+    assert summary['p50_ms'] == pytest.approx(2.0, rel=1 / 128)
+    assert summary['p99.9_ms'] == 10.0
+    assert sum(count for _, count in histogram.to_dict()['buckets_us']) == 4
+
+
+def test_tracer_records_stage_and_end_to_end_latencies(monkeypatch):
+    tracer = LatencyTracer()
+    now = [100.0]
+    monkeypatch.setattr(latency_tracer.time, 'perf_counter', lambda: now[0])
+    trace = tracer.start('tcp', started=99.0)
+    for stage, at in (('decode', 100.0), ('pair', 100.5), ('dispatch', 101.0),
+                      ('displayed', 103.0), ('write', 102.0)):
+        now[0] = at
+        trace.mark(stage)
+    now[0] = 200.0
+    trace.mark('decode')
+
+    summary = tracer.summary()
+    assert tracer.traces == 1
+    assert summary['decode']['count'] == 1
+    assert summary['decode']['max_ms'] == 1000.0
+    assert summary['dispatch']['max_ms'] == 500.0
+    assert summary['displayed']['max_ms'] == 2000.0
+    # the CSV row is written after the pairing, independently of the GUI
+    assert summary['write']['max_ms'] == 1500.0
+    assert summary['read_to_displayed']['max_ms'] == 4000.0
+    assert summary['read_to_write']['max_ms'] == 3000.0
+
+
+def test_stage_without_its_predecessor_only_counts_end_to_end():
+    tracer = LatencyTracer()
+    trace = tracer.start('serial', started=0.0)
+
+    tracer.record(trace, 'write', 0.25)
+
+    summary = tracer.summary()
+    assert summary['write']['count'] == 0
+    assert summary['read_to_write']['max_ms'] == 250.0
+
+
+def test_save_and_reset(tmp_path):
+    tracer = LatencyTracer()
+    trace = tracer.start('serial', started=0.0)
+    trace.times['decode'] = 0.5
+    tracer.record(trace, 'pair', 0.75)
+    path = tmp_path / 'latency.json'
+
+    tracer.save(str(path))
+    tracer.reset()
+
+    report = json.loads(path.read_text(encoding='utf-8'))
+    assert report['traces'] == 1
+    assert report['histograms']['pair']['buckets_us'] == [[LatencyHistogram.bucket(250000)[0], 1]]
+    assert tracer.traces == 0
+    assert tracer.summary()['pair']['count'] == 0
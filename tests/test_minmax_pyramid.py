@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+
+from core.minmax_pyramid import MinMaxPyramid
+
+
+def level_arrays(pyramid, level, channel=0):
+    return {field: values.copy() for field, values in pyramid._entries(level, channel).items()}
+
+
+def make_signal(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.arange(count, dtype=np.float64) * 0.1, rng.normal(size=count).cumsum()
+
+
+def test_levels_hold_the_extremes_of_their_buckets():
+    times, values = make_signal(4 ** 4)
+    pyramid = MinMaxPyramid(10000, factor=4, levels=4)
+    pyramid.extend(times, values)
+
+    for level in (1, 2, 3):
+        size = 4 ** level
+        entries = level_arrays(pyramid, level)
+        buckets = values.reshape(-1, size)
+        np.testing.assert_array_equal(entries['start'], times[::size])
+        np.testing.assert_array_equal(entries['min_value'], buckets.min(axis=1))
+        np.testing.assert_array_equal(entries['max_value'], buckets.max(axis=1))
+        np.testing.assert_array_equal(entries['min_time'], times.reshape(-1, size)[np.arange(len(buckets)),
+                                                                                   buckets.argmin(axis=1)])
+
+
+def test_append_and_extend_build_the_same_levels():
+    times, values = make_signal(1000)
+    appended = MinMaxPyramid(300, factor=3, levels=4)
+    for timestamp, value in zip(times, values):
+        appended.append(timestamp, value)
+    extended = MinMaxPyramid(300, factor=3, levels=4)
+    for first in range(0, 1000, 70):
+        extended.extend(times[first:first + 70], values[first:first + 70])
+    # append aggregates in batches, flush the remainder the same way extend does
+    appended._aggregate(0)
+
+    for level in range(4):
+        for field, values_ in level_arrays(extended, level).items():
+            np.testing.assert_array_equal(level_arrays(appended, level)[field], values_)
+
+
+@pytest.mark.parametrize('count', [1000, 1003, 50000])
+def test_query_keeps_every_peak_within_the_budget(count):
+    times, values = make_signal(count, seed=count)
+    pyramid = MinMaxPyramid(20000, factor=4, levels=7)
+    pyramid.extend(times, values)
+    start, end = times[0], times[-1]
+
+    x, y = pyramid.query(start, end, max_points=500)
+
+    assert len(x) <= 600
+    assert np.all(np.diff(x) >= 0)
+    inside = (times >= start) & (times <= end)
+    assert y.max() == values[inside].max()
+    assert y.min() == values[inside].min()
+
+
+def test_query_returns_raw_samples_when_they_fit():
+    times, values = make_signal(200)
+    pyramid = MinMaxPyramid(1000)
+    pyramid.extend(times, values)
+
+    x, y = pyramid.query(times[50], times[59], max_points=100)
+
+    # the window plus one neighbour on each side
+    np.testing.assert_array_equal(x, times[49:61])
+    np.testing.assert_array_equal(y, values[49:61])
+
+
+def test_history_outlives_the_raw_capacity():
+    times, values = make_signal(5000)
+    pyramid = MinMaxPyramid(100, factor=4, levels=5)
+    pyramid.extend(times, values)
+
+    assert len(pyramid) == 100
+    oldest, newest = pyramid.time_range()
+    assert newest == times[-1]
+    assert oldest < times[-100]
+    assert pyramid.select_level(times[0], times[-1], 10000) > 0
+    x, y = pyramid.query(oldest, newest, max_points=10000)
+    assert x[0] == pytest.approx(oldest, abs=0.1 * 4 ** 4)
+    assert y.max() == values[times >= x[0]].max()
+
+
+def test_added_channel_is_nan_padded():
+    pyramid = MinMaxPyramid(1000, factor=2, levels=3)
+    pyramid.extend(np.arange(8.0), np.arange(8.0))
+
+    channel = pyramid.add_channel()
+    pyramid.extend(np.arange(8.0, 16.0), np.column_stack((np.arange(8.0), -np.arange(8.0))))
+
+    assert channel == 1
+    raw = pyramid.channels[1].view()
+    assert np.isnan(raw[:8]).all()
+    np.testing.assert_array_equal(raw[8:], -np.arange(8.0))
+    level = level_arrays(pyramid, 2, channel=1)
+    assert np.isnan(level['min_value'][:2]).all()
+    np.testing.assert_array_equal(level['min_value'][2:], [-3, -7])
+    np.testing.assert_array_equal(level['max_value'][2:], [0, -4])
+    np.testing.assert_array_equal(level_arrays(pyramid, 2)['max_value'], [3, 7, 3, 7])
+
+
+def test_nan_values_do_not_hide_the_extremes():
+    pyramid = MinMaxPyramid(100, factor=4, levels=2)
+    pyramid.extend(np.arange(4.0), [np.nan, 5.0, np.nan, -2.0])
+
+    entries = level_arrays(pyramid, 1)
+
+    assert entries['min_value'][0] == -2.0
+    assert entries['max_value'][0] == 5.0
+    assert entries['max_time'][0] == 1.0
+
+
+def test_nearest():
+    pyramid = MinMaxPyramid(100, channels=2)
+    assert pyramid.nearest(1.0) is None
+    pyramid.extend([1.0, 2.0, 4.0], [[10, 20], [11, 21], [12, 22]])
+
+    assert pyramid.nearest(-5.0) == (1.0, [10.0, 20.0])
+    assert pyramid.nearest(2.9) == (2.0, [11.0, 21.0])
+    assert pyramid.nearest(3.1) == (4.0, [12.0, 22.0])
+    assert pyramid.nearest(99.0) == (4.0, [12.0, 22.0])
+
+
+def test_clear():
+    times, values = make_signal(500)
+    pyramid = MinMaxPyramid(100, factor=4, levels=3)
+    pyramid.extend(times, values)
+
+    pyramid.clear()
+
+    assert len(pyramid) == 0
+    assert pyramid.time_range() is None
+    assert len(pyramid.query(0, 100, 100)[0]) == 0
+    pyramid.extend(times[:16], values[:16])
+    assert len(level_arrays(pyramid, 2)['start']) == 1
+
+
+def test_factor_must_be_at_least_two():
+    with pytest.raises(ValueError):
+        MinMaxPyramid(10, factor=1)
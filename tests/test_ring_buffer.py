@@ -0,0 +1,86 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from core.ring_buffer import RingBuffer
+
+
+def test_append_wraps_around_and_keeps_the_newest_values():
+    buffer = RingBuffer(4)
+    for value in range(10):
+        buffer.append(value)
+        np.testing.assert_array_equal(buffer.view(), np.arange(max(0, value - 3), value + 1))
+    assert len(buffer) == 4
+    assert buffer.last() == 9
+
+
+@pytest.mark.parametrize('count', [4, 5, 11])
+def test_extend_by_at_least_the_capacity(count):
+    buffer = RingBuffer(4)
+    buffer.extend([100, 101])
+    buffer.extend(np.arange(count))
+
+    np.testing.assert_array_equal(buffer.view(), np.arange(count - 4, count))
+    assert buffer.last() == count - 1
+
+
+def test_mixed_operations_match_a_deque():
+    rng = np.random.default_rng(1)
+    buffer = RingBuffer(7)
+    reference = deque(maxlen=7)
+    for _ in range(500):
+        if rng.random() < 0.5:
+            value = rng.random()
+            buffer.append(value)
+            reference.append(value)
+        else:
+            values = rng.random(rng.integers(0, 10))
+            buffer.extend(values)
+            reference.extend(values)
+        view = buffer.view()
+        assert view.flags.c_contiguous
+        np.testing.assert_array_equal(view, np.array(reference))
+        assert buffer.last() == reference[-1]
+
+
+def test_view_is_read_only_and_not_a_copy():
+    buffer = RingBuffer(3)
+    buffer.extend([1, 2])
+    view = buffer.view()
+
+    with pytest.raises(ValueError):
+        view[0] = 5
+    assert np.shares_memory(view, buffer.data)
+
+
+def test_clear():
+    buffer = RingBuffer(3)
+    buffer.extend([1, 2, 3, 4])
+    buffer.clear()
+
+    assert len(buffer) == 0
+    assert len(buffer.view()) == 0
+    with pytest.raises(IndexError):
+        buffer.last()
+    buffer.append(7)
+    np.testing.assert_array_equal(buffer.view(), [7])
+
+
+@pytest.mark.parametrize('capacity, expected', [(2, [8, 9]), (5, [5, 6, 7, 8, 9]), (8, [5, 6, 7, 8, 9])])
+def test_resize_keeps_the_newest_values(capacity, expected):
+    buffer = RingBuffer(5, dtype=np.int64)
+    buffer.extend(np.arange(10))
+
+    buffer.resize(capacity)
+
+    assert buffer.capacity == capacity
+    assert buffer.dtype == np.int64
+    np.testing.assert_array_equal(buffer.view(), expected)
+    buffer.append(10)
+    assert buffer.view()[-1] == 10
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
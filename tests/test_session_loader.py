@@ -0,0 +1,213 @@
+import os
+import gzip
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core import csv_handler
+from core.utils import Utils
+from core.csv_handler import CsvHandler
+from core.session_loader import SessionLoader
+
+HEADER = 'timestamp;altitude;status;rssi'
+START = datetime(2025, 6, 1, 12, 0, 0)
+
+
+def rows(count, first=0):
+    for index in range(first, first + count):
+        stamp = (START + timedelta(seconds=index * 0.5)).isoformat()
+        rssi = '' if index % 3 == 0 else str(-60 - index)
+        yield f"{stamp};{index * 1.5};{index % 6};{rssi}\r\n"
+
+
+def write_csv(path, lines, header=HEADER, opener=open):
+    with opener(path, 'wt', newline='', encoding='utf-8') as f:
+        f.write(header + '\r\n')
+        f.writelines(lines)
+
+
+def test_load_parses_columns_and_empty_fields(tmp_path):
+    write_csv(tmp_path / 'telemetry_data.csv', rows(10))
+
+    columns = SessionLoader(str(tmp_path)).load(use_cache=False)
+
+    assert set(columns) == {'timestamp', 'altitude', 'status', 'rssi'}
+    expected = [(START + timedelta(seconds=index * 0.5)).timestamp() for index in range(10)]
+    np.testing.assert_allclose(columns['timestamp'], expected)
+    np.testing.assert_array_equal(columns['altitude'], np.arange(10) * 1.5)
+    assert np.isnan(columns['rssi'][[0, 3, 6, 9]]).all()
+    assert columns['rssi'][1] == -61
+
+
+def test_segments_are_loaded_in_order(tmp_path):
+    write_csv(tmp_path / 'telemetry_data.1.csv.gz', rows(5), opener=gzip.open)
+    write_csv(tmp_path / 'telemetry_data.2.csv', rows(5, first=5))
+    write_csv(tmp_path / 'telemetry_data.csv', rows(5, first=10))
+
+    columns = SessionLoader(str(tmp_path)).load(use_cache=False)
+
+    np.testing.assert_array_equal(columns['altitude'], np.arange(15) * 1.5)
+
+
+def test_chunks_match_the_whole_load(tmp_path):
+    write_csv(tmp_path / 'telemetry_data.csv', rows(25))
+    loader = SessionLoader(str(tmp_path))
+
+    chunks = list(loader.iter_chunks(chunk_rows=10))
+
+    assert [len(chunk['timestamp']) for chunk in chunks] == [10, 10, 5]
+    np.testing.assert_array_equal(np.concatenate([chunk['altitude'] for chunk in chunks]),
+                                  loader.load(use_cache=False)['altitude'])
+
+
+def test_rows_loadtxt_rejects_are_parsed_field_by_field(tmp_path):
+    lines = list(rows(3))
+    lines[1] = lines[1].replace(';1.5;', ';n/a;')
+    write_csv(tmp_path / 'telemetry_data.csv', lines)
+
+    columns = SessionLoader(str(tmp_path)).load(use_cache=False)
+
+    assert np.isnan(columns['altitude'][1])
+    assert columns['altitude'][2] == 3.0
+    assert len(columns['timestamp']) == 3
+
+
+def test_torn_last_row_is_skipped(tmp_path):
+    write_csv(tmp_path / 'telemetry_data.csv', list(rows(4)) + ['2025-06-01T12:00:02;6.'])
+
+    columns = SessionLoader(str(tmp_path)).load(use_cache=False)
+
+    assert len(columns['timestamp']) == 4
+
+
+def test_cache_is_reused_until_the_csv_changes(tmp_path, monkeypatch):
+    path = tmp_path / 'telemetry_data.csv'
+    write_csv(path, rows(6))
+    loader = SessionLoader(str(tmp_path))
+    first = loader.load()
+    assert (tmp_path / SessionLoader.CACHE_FILE).exists()
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("the cache should have been used")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(loader, 'iter_chunks', no_parsing)
+        cached = loader.load()
+    for name, values in first.items():
+        np.testing.assert_array_equal(cached[name], values)
+
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        f.writelines(rows(2, first=6))
+    assert len(loader.load()['timestamp']) == 8
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    write_csv(tmp_path / 'telemetry_data.csv', rows(3))
+    (tmp_path / SessionLoader.CACHE_FILE).write_bytes(b'not an npz file')
+
+    assert len(SessionLoader(str(tmp_path)).load()['timestamp']) == 3
+
+
+@pytest.mark.parametrize('stamps', [['2025-01-01T00:00:00', 'not a time']])
+def test_invalid_timestamps_become_nan(stamps):
+    columns = SessionLoader.parse_lines([f"{stamp};1\r\n" for stamp in stamps], ['timestamp', 'altitude'])
+
+    assert columns['timestamp'][0] == datetime(2025, 1, 1).timestamp()
+    assert np.isnan(columns['timestamp'][1])
+
+
+class Clock:
+    """Stands in for the ``time`` module of ``core.csv_handler`` to control row timestamps."""
+
+    def __init__(self, start):
+        self.now = start
+        self.monotonic = time.monotonic
+
+    def time(self):
+        return self.now
+
+
+def write_session(directory, monkeypatch, groups, period=0.1, **options):
+    """Write rows through ``CsvHandler``, each group of rows ending up in its own segment."""
+    clock = Clock(datetime(2025, 6, 1, 12).timestamp())
+    monkeypatch.setattr(csv_handler, 'time', clock)
+    monkeypatch.setattr(Utils, 'session_path', str(directory))
+    options.setdefault('index_interval', 10)
+    handler = CsvHandler(flush_rows=1, rotate_bytes=1 if len(groups) > 1 else 0,
+                         rotate_interval=0, **options)
+    written = 0
+    for count in groups:
+        for _ in range(count):
+            handler.write_row({'altitude': written})
+            clock.now += period
+            written += 1
+        while handler.rows_written < written:
+            time.sleep(0.001)
+    handler.close_file()
+    return clock
+
+
+def test_index_offsets_point_at_their_rows(tmp_path, monkeypatch):
+    write_session(tmp_path, monkeypatch, [95])
+    path = str(tmp_path / 'telemetry_data.csv')
+
+    index = SessionLoader.read_index(path)
+
+    assert len(index) == 10
+    with open(path, 'rb') as f:
+        for timestamp, offset in index:
+            f.seek(int(offset))
+            row = f.readline().decode('utf-8')
+            assert row.split(';')[0] == datetime.fromtimestamp(timestamp).isoformat()
+
+
+def test_index_entries_past_the_data_are_dropped(tmp_path, monkeypatch):
+    write_session(tmp_path, monkeypatch, [50])
+    path = str(tmp_path / 'telemetry_data.csv')
+    offsets = SessionLoader.read_index(path)['offset']
+
+    os.truncate(path, int(offsets[3]))
+
+    np.testing.assert_array_equal(SessionLoader.read_index(path)['offset'], offsets[:3])
+
+
+@pytest.mark.parametrize('start, end', [(0.0, 1e12), (3.05, 7.0), (0.0, 0.0),
+                                        (11.9, 30.0), (-5.0, -1.0), (40.0, 50.0)])
+def test_time_range_matches_a_full_load(tmp_path, monkeypatch, start, end):
+    write_session(tmp_path, monkeypatch, [40, 35, 45])
+    loader = SessionLoader(str(tmp_path))
+    assert len(loader.files) >= 3
+    everything = loader.load(use_cache=False)
+    first = everything['timestamp'][0]
+
+    window = loader.load_time_range(first + start, first + end)
+
+    mask = (everything['timestamp'] >= first + start) & (everything['timestamp'] <= first + end)
+    assert set(window) == set(everything)
+    for name, values in everything.items():
+        np.testing.assert_array_equal(window[name], values[mask])
+
+
+def test_time_range_without_index_reads_everything(tmp_path, monkeypatch):
+    write_session(tmp_path, monkeypatch, [30], index_interval=0)
+    loader = SessionLoader(str(tmp_path))
+    first = loader.load(use_cache=False)['timestamp'][0]
+
+    window = loader.load_time_range(first + 0.95, first + 1.95)
+
+    np.testing.assert_array_equal(window['altitude'], np.arange(10, 20))
+
+
+def test_time_bounds(tmp_path, monkeypatch):
+    clock = write_session(tmp_path, monkeypatch, [25, 25])
+    loader = SessionLoader(str(tmp_path))
+
+    first, last = loader.time_bounds()
+
+    assert first == pytest.approx(datetime(2025, 6, 1, 12).timestamp())
+    assert last == pytest.approx(clock.now - 0.1, abs=1e-6)
+    for index_path in tmp_path.glob('*.idx'):
+        index_path.unlink()
+    assert loader.time_bounds() is None
@@ -0,0 +1,73 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.sliding_window import SlidingWindowExtrema
+
+
+def brute_force(timestamps, values, now, window):
+    inside = [value for timestamp, value in zip(timestamps, values)
+              if now - window <= timestamp and not math.isnan(value)]
+    return (min(inside), max(inside)) if inside else (None, None)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_a_brute_force_window(seed):
+    rng = np.random.default_rng(seed)
+    timestamps = np.cumsum(rng.exponential(0.3, 600))
+    values = rng.integers(-20, 20, 600).astype(float)
+    values[rng.random(600) < 0.05] = np.nan
+    extrema = SlidingWindowExtrema(window=5.0)
+
+    for count, (timestamp, value) in enumerate(zip(timestamps, values), start=1):
+        extrema.push(timestamp, value)
+        expected = brute_force(timestamps[:count], values[:count], extrema.newest, 5.0)
+        assert (extrema.min(), extrema.max()) == expected
+
+
+def test_expire_drops_older_samples():
+    extrema = SlidingWindowExtrema(window=100.0)
+    extrema.push_many([0.0, 1.0, 2.0, 3.0], [5.0, -1.0, 9.0, 2.0])
+
+    extrema.expire(1.5)
+    assert (extrema.min(), extrema.max()) == (2.0, 9.0)
+    extrema.expire(10.0)
+    assert (extrema.min(), extrema.max()) == (None, None)
+    assert len(extrema) == 0
+
+
+def test_nan_and_none_are_ignored():
+    extrema = SlidingWindowExtrema(window=10.0)
+    extrema.push(0.0, float('nan'))
+    extrema.push(1.0, None)
+    assert extrema.min() is None
+    assert extrema.newest is None
+
+    extrema.push(2.0, 4.0)
+    extrema.push(3.0, float('nan'))
+    assert (extrema.min(), extrema.max()) == (4.0, 4.0)
+
+
+def test_equal_values_keep_the_newest_sample():
+    extrema = SlidingWindowExtrema(window=1.0)
+    extrema.push_many([0.0, 0.5, 1.2], [3.0, 3.0, 1.0])
+
+    # the sample at 0 expired, the equal one at 0.5 still holds the maximum
+    assert extrema.max() == 3.0
+    extrema.push(1.6, 0.0)
+    assert extrema.max() == 1.0
+
+
+def test_rebuild_with_a_larger_window():
+    timestamps = np.arange(10.0)
+    values = np.array([9.0, 0.0, 1, 2, 3, 4, 5, 6, 7, 8])
+    extrema = SlidingWindowExtrema(window=3.0)
+    extrema.push_many(timestamps, values)
+    assert (extrema.min(), extrema.max()) == (5.0, 8.0)
+
+    extrema.rebuild(timestamps, values, window=20.0)
+
+    assert extrema.window == 20.0
+    assert (extrema.min(), extrema.max()) == (0.0, 9.0)
+    assert extrema.newest == 9.0
@@ -0,0 +1,80 @@
+import os
+
+from core.telemetry_journal import TelemetryJournal
+
+
+def write_journal(path, count):
+    journal = TelemetryJournal(str(path), commit_interval=0.01)
+    for index in range(count):
+        journal.write_row({'altitude': index, '_trace': object()})
+    journal.close_file()
+
+
+def test_records_are_read_back_without_private_keys(tmp_path):
+    path = tmp_path / 'telemetry.journal'
+    write_journal(path, 5)
+
+    records = list(TelemetryJournal.read_records(str(path)))
+    assert [record['data'] for record in records] == [{'altitude': index} for index in range(5)]
+    assert all(isinstance(record['t'], float) for record in records)
+
+
+def test_recover_keeps_an_intact_journal(tmp_path):
+    path = tmp_path / 'telemetry.journal'
+    write_journal(path, 3)
+    size = os.path.getsize(path)
+
+    assert TelemetryJournal.recover(str(path)) == (3, 0)
+    assert os.path.getsize(path) == size
+
+
+def test_recover_truncates_a_torn_last_record(tmp_path):
+    path = tmp_path / 'telemetry.journal'
+    write_journal(path, 4)
+    intact = os.path.getsize(path)
+    with open(path, 'ab') as f:
+        # Header of a 100 byte record of which only a few bytes reached the disk
+        f.write(TelemetryJournal.RECORD_HEADER.pack(100, 0) + b'{"t": 1')
+
+    assert TelemetryJournal.recover(str(path)) == (4, 15)
+    assert os.path.getsize(path) == intact
+    assert len(list(TelemetryJournal.read_records(str(path)))) == 4
+
+
+def test_recover_stops_at_a_corrupted_record(tmp_path):
+    path = tmp_path / 'telemetry.journal'
+    write_journal(path, 3)
+    with open(path, 'rb') as f:
+        first_end = next(offset for _, offset in TelemetryJournal._scan(f))
+    with open(path, 'r+b') as f:
+        # Flip a byte in the payload of the second record
+        f.seek(first_end + TelemetryJournal.RECORD_HEADER.size + 2)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    count, truncated = TelemetryJournal.recover(str(path))
+    assert count == 1
+    assert truncated > 0
+    assert os.path.getsize(path) == first_end
+    assert [record['data'] for record in TelemetryJournal.read_records(str(path))] == [{'altitude': 0}]
+
+
+def test_journal_continues_after_recovery(tmp_path):
+    path = tmp_path / 'telemetry.journal'
+    write_journal(path, 2)
+    with open(path, 'ab') as f:
+        f.write(b'\x05')
+    TelemetryJournal.recover(str(path))
+
+    write_journal(path, 2)
+    assert [record['data']['altitude'] for record in TelemetryJournal.read_records(str(path))] == [0, 1, 0, 1]
+
+
+def test_recover_leaves_other_files_alone(tmp_path):
+    path = tmp_path / 'notes.txt'
+    path.write_bytes(b'not a telemetry journal')
+
+    assert TelemetryJournal.recover(str(path)) == (0, 0)
+    assert path.read_bytes() == b'not a telemetry journal'
+    assert TelemetryJournal.recover(str(tmp_path / 'missing.journal')) == (0, 0)
@@ -0,0 +1,99 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.telemetry_statistics import P2Quantile, RunningStatistics, WindowStatistics, TelemetryStatistics
+
+
+@pytest.mark.parametrize('p', [0.05, 0.5, 0.95])
+@pytest.mark.parametrize('distribution', ['normal', 'uniform', 'exponential'])
+def test_p2_quantile_approximates_the_exact_quantile(p, distribution):
+    rng = np.random.default_rng(7)
+    values = getattr(rng, distribution)(size=20000)
+    quantile = P2Quantile(p)
+    for value in values:
+        quantile.add(value)
+
+    spread = np.percentile(values, 99) - np.percentile(values, 1)
+    assert quantile.value() == pytest.approx(np.percentile(values, p * 100), abs=0.02 * spread)
+
+
+def test_p2_quantile_with_few_samples():
+    quantile = P2Quantile(0.5)
+    assert quantile.value() is None
+    for value in (5.0, 1.0, 3.0):
+        quantile.add(value)
+    assert quantile.value() == 3.0
+
+
+def test_running_statistics_match_numpy():
+    rng = np.random.default_rng(3)
+    values = rng.normal(10, 2, 5000)
+    statistics = RunningStatistics(quantiles=(0.5,))
+    for index, value in enumerate(values):
+        statistics.add(index * 0.5, value)
+
+    summary = statistics.summary()
+    assert summary['count'] == 5000
+    assert summary['mean'] == pytest.approx(values.mean())
+    assert summary['std'] == pytest.approx(values.std())
+    assert (summary['min'], summary['max'], summary['last']) == (values.min(), values.max(), values[-1])
+    assert summary['sample_rate'] == pytest.approx(2.0)
+    assert summary['p50'] == pytest.approx(np.median(values), abs=0.1)
+
+
+def test_window_statistics_match_the_samples_in_the_window():
+    rng = np.random.default_rng(5)
+    timestamps = np.cumsum(rng.exponential(0.2, 3000))
+    values = rng.normal(0, 100, 3000).cumsum()
+    statistics = WindowStatistics(window=10.0)
+
+    for count, (timestamp, value) in enumerate(zip(timestamps, values), start=1):
+        statistics.add(timestamp, value)
+        if count % 97:
+            continue
+        inside = timestamps[:count] >= timestamp - 10.0
+        window_times, window_values = timestamps[:count][inside], values[:count][inside]
+        summary = statistics.summary()
+        assert summary['count'] == len(window_values)
+        assert summary['mean'] == pytest.approx(window_values.mean())
+        assert summary['std'] == pytest.approx(window_values.std(), rel=1e-6)
+        assert (summary['min'], summary['max']) == (window_values.min(), window_values.max())
+        elapsed = window_times[-1] - window_times[0]
+        assert summary['rate'] == pytest.approx((window_values[-1] - window_values[0]) / elapsed)
+        assert summary['sample_rate'] == pytest.approx((len(window_values) - 1) / elapsed)
+
+
+def test_window_statistics_when_everything_expired():
+    statistics = WindowStatistics(window=1.0)
+    statistics.add(0.0, 4.0)
+    statistics.add(0.5, 6.0)
+
+    statistics.expire(5.0)
+
+    summary = statistics.summary()
+    assert summary['count'] == 0
+    assert summary['mean'] is None and summary['min'] is None and summary['rate'] is None
+    statistics.add(6.0, 1.0)
+    assert statistics.summary()['mean'] == 1.0
+    assert statistics.summary()['std'] == 0.0
+
+
+def test_telemetry_statistics_keeps_only_numeric_fields():
+    statistics = TelemetryStatistics(windows=(10,))
+    start = datetime(2025, 6, 1, 12)
+    statistics.update({'timestamp': start.isoformat(), 'altitude': 100, 'status': 3,
+                       'armed': True, 'mode': 'ascent', 'pitch': float('nan')})
+    statistics.update({'timestamp': start.timestamp() + 2, 'altitude': 110.0})
+
+    summary = statistics.summary()
+    assert set(summary) == {'altitude'}
+    assert statistics.records == 2
+    altitude = summary['altitude']
+    assert altitude['session']['mean'] == 105.0
+    assert altitude['last_10s']['rate'] == pytest.approx(5.0)
+    assert statistics.channel('pitch') is None
+
+    statistics.reset()
+    assert statistics.summary() == {} and statistics.records == 0
@@ -0,0 +1,137 @@
+import pytest
+
+from gui.terminal_view import TerminalModel
+
+
+class Scheduler:
+    """Collects ``mark_dirty`` calls; the test renders the frame itself."""
+
+    def __init__(self):
+        self.dirty = set()
+
+    def mark_dirty(self, target):
+        self.dirty.add(target)
+
+
+@pytest.fixture
+def model():
+    return TerminalModel(max_lines=5, repeat_interval=60.0, scheduler=Scheduler())
+
+
+def texts(model):
+    return [entry.text for entry in model.entries]
+
+
+def test_messages_are_shown_on_the_next_frame(model):
+    model.append("Połączono z portem")
+
+    assert model.rowCount() == 0
+    assert model in model.scheduler.dirty
+    model.render_frame()
+    assert texts(model) == ["Połączono z portem"]
+    assert list(model.lines())[0].endswith(": Połączono z portem")
+
+
+def test_repeats_merge_only_when_requested(model):
+    for number in range(3):
+        model.append(f"Odebrano pakiet {number}", merge_repeats=True)
+    model.append("Odebrano pakiet 3")
+    model.render_frame()
+    model.append("Odebrano pakiet 4", merge_repeats=True)
+    model.render_frame()
+
+    assert texts(model) == ["Odebrano pakiet 4", "Odebrano pakiet 3"]
+    assert model.entries[0].repeats == 4
+    assert model.entries[0].line().endswith("Odebrano pakiet 4 (x4)")
+    assert model.suppressed == 3
+
+
+def test_different_kinds_and_colors_do_not_merge(model):
+    model.append("Pakiet 1 OK", merge_repeats=True)
+    model.append("Pakiet 2 błąd CRC", merge_repeats=True)
+    model.append("Pakiet 3 OK", color='red', merge_repeats=True)
+    model.render_frame()
+
+    assert len(model.entries) == 3
+
+
+def test_repeats_stop_merging_after_the_interval(model):
+    model.repeat_interval = 0.0
+    model.append("Pakiet 1", merge_repeats=True)
+    model.append("Pakiet 2", merge_repeats=True)
+    model.render_frame()
+
+    assert texts(model) == ["Pakiet 1", "Pakiet 2"]
+
+
+def test_html_lines_are_split_and_decoded(model):
+    model.append("<b>Status:</b><br>ciśnienie&nbsp;OK<br/>temp &lt; 40")
+    model.render_frame()
+
+    assert texts(model) == ["Status:", "ciśnienie OK", "temp < 40"]
+
+
+def test_oldest_lines_are_evicted(model):
+    for number in range(4):
+        model.append(f"linia {number}")
+    model.render_frame()
+    for number in range(4, 12):
+        model.append(f"linia {number}")
+        if number % 3 == 0:
+            model.render_frame()
+    model.render_frame()
+
+    assert texts(model) == [f"linia {number}" for number in range(7, 12)]
+    assert model.rowCount() == 5
+
+
+def test_merging_follows_eviction(model):
+    model.append("Pakiet 1", merge_repeats=True)
+    model.render_frame()
+    for number in range(5):
+        model.append(f"linia {number}")
+    model.render_frame()
+
+    # the merged line was evicted, the next repeat starts a new one
+    model.append("Pakiet 2", merge_repeats=True)
+    model.render_frame()
+    assert texts(model)[-1] == "Pakiet 2"
+
+
+def test_merging_into_a_line_dropped_before_it_was_shown(model):
+    model.append("Pakiet 1", merge_repeats=True)
+    for number in range(6):
+        model.append(f"linia {number}")
+    model.render_frame()
+
+    model.append("Pakiet 2", merge_repeats=True)
+    model.render_frame()
+    assert texts(model)[-1] == "Pakiet 2"
+
+
+def test_updated_line_emits_data_changed(model):
+    changed = []
+    model.dataChanged.connect(lambda first, last, roles: changed.append(first.row()))
+    model.append("pierwsza")
+    model.append("Pakiet 1", merge_repeats=True)
+    model.render_frame()
+
+    model.append("Pakiet 2", merge_repeats=True)
+
+    assert changed == [1]
+    assert model.data(model.index(1)).endswith("Pakiet 2 (x2)")
+    assert model.data(model.index(1), TerminalModel.SeverityRole) == TerminalModel.INFO
+
+
+def test_clear(model):
+    model.append("Pakiet 1", merge_repeats=True)
+    model.render_frame()
+    model.append("oczekująca")
+
+    model.clear()
+    model.render_frame()
+
+    assert model.rowCount() == 0 and list(model.lines()) == []
+    model.append("Pakiet 2", merge_repeats=True)
+    model.render_frame()
+    assert model.entries[0].repeats == 1
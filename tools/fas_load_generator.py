@@ -0,0 +1,332 @@
+"""Synthetic HORUS FAS client used for throughput and soak testing of the CSS.
+
+Connects to the CSS TCP server (NetworkTransmitter) and streams newline-delimited
+telemetry JSON in the same shape the FAS sends. Every ``ping_interval`` one
+telemetry message carries a ``probe``; the CSS echoes it once the record has
+been processed (``ProcessData``) and handled by the main window, so the
+reported lag is the time a record waits in the station behind the data sent
+before it. A ``ping`` sent at the same time is answered by the network reader
+thread as soon as it reads the line, without going through the pipeline:
+its RTT is the transport and reader-thread round trip.
+
+Example::
+
+    python -m tools.fas_load_generator --rate 2000 --duration 60 \\
+        --burst-size 500 --burst-every 5 --disconnect-every 20
+"""
+import argparse
+import json
+import math
+import random
+import socket
+import sys
+import threading
+import time
+from datetime import datetime
+
+MIN_RATE = 1
+MAX_RATE = 5000
+
+
+class FlightProfile:
+    def __init__(self, apogee=3000.0, ascent_time=25.0):
+        self.apogee = apogee
+        self.ascent_time = ascent_time
+        self.latitude = 52.2549
+        self.longitude = 20.9004
+        self.start = time.monotonic()
+
+    def sample(self):
+        t = (time.monotonic() - self.start) % (self.ascent_time * 4)
+        if t < self.ascent_time:
+            altitude = self.apogee * math.sin(0.5 * math.pi * t / self.ascent_time)
+            velocity = self.apogee * 0.5 * math.pi / self.ascent_time * math.cos(
+                0.5 * math.pi * t / self.ascent_time)
+        else:
+            descent = t - self.ascent_time
+            altitude = max(0.0, self.apogee - 10.0 * descent)
+            velocity = -10.0 if altitude > 0 else 0.0
+
+        if t < 1.0:
+            status = 0
+        elif t < self.ascent_time * 0.3:
+            status = 1
+        elif t < self.ascent_time:
+            status = 2
+        elif altitude > self.apogee * 0.3:
+            status = 3
+        elif altitude > 0:
+            status = 4
+        else:
+            status = 5
+
+        self.latitude += random.gauss(0, 1e-6)
+        self.longitude += random.gauss(0, 1e-6)
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'telemetry': {
+                'ver_velocity': round(velocity + random.gauss(0, 0.5), 3),
+                'altitude': round(altitude + random.gauss(0, 1.0), 3),
+                'pitch': round(random.gauss(0, 2.0), 3),
+                'roll': round(random.gauss(0, 2.0), 3),
+                'yaw': round(random.gauss(0, 2.0), 3),
+                'status': status,
+                'latitude': round(self.latitude, 7),
+                'longitude': round(self.longitude, 7),
+                'rbs': 0,
+            },
+            'transmission': {
+                'rssi': int(random.gauss(-90, 4)),
+                'snr': int(random.gauss(7, 2)),
+            },
+        }
+
+
+class LoadStatistics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.send_errors = 0
+        self.rtts = []
+        self.lags = []
+        self.reconnect_times = []
+
+    def add_rtt(self, rtt):
+        with self.lock:
+            self.rtts.append(rtt)
+
+    def add_lag(self, lag):
+        with self.lock:
+            self.lags.append(lag)
+
+    @staticmethod
+    def percentile(values, fraction):
+        if not values:
+            return float('nan')
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self, elapsed):
+        with self.lock:
+            rtts = list(self.rtts)
+            lags = list(self.lags)
+        return {
+            'elapsed_s': round(elapsed, 3),
+            'sent': self.sent,
+            'achieved_rate': round(self.sent / elapsed, 1) if elapsed > 0 else 0.0,
+            'send_errors': self.send_errors,
+            'lag_samples': len(lags),
+            'lag_p50_ms': round(self.percentile(lags, 0.50) * 1000, 2),
+            'lag_p95_ms': round(self.percentile(lags, 0.95) * 1000, 2),
+            'lag_max_ms': round(max(lags) * 1000, 2) if lags else float('nan'),
+            'rtt_samples': len(rtts),
+            'rtt_p50_ms': round(self.percentile(rtts, 0.50) * 1000, 2),
+            'rtt_p95_ms': round(self.percentile(rtts, 0.95) * 1000, 2),
+            'rtt_max_ms': round(max(rtts) * 1000, 2) if rtts else float('nan'),
+            'reconnects': len(self.reconnect_times),
+            'reconnect_mean_ms': round(
+                sum(self.reconnect_times) / len(self.reconnect_times) * 1000, 2)
+            if self.reconnect_times else float('nan'),
+        }
+
+
+class FasLoadGenerator:
+    def __init__(self, host, port, rate, duration, burst_size=0, burst_every=0.0,
+                 disconnect_every=0.0, reconnect_delay=0.5, ping_interval=0.5,
+                 report_interval=1.0):
+        self.host = host
+        self.port = port
+        self.rate = max(MIN_RATE, min(MAX_RATE, rate))
+        self.duration = duration
+        self.burst_size = burst_size
+        self.burst_every = burst_every
+        self.disconnect_every = disconnect_every
+        self.reconnect_delay = reconnect_delay
+        self.ping_interval = ping_interval
+        self.report_interval = report_interval
+
+        self.profile = FlightProfile()
+        self.stats = LoadStatistics()
+        self.sock = None
+        self.ping_seq = 0
+        self.probe = None
+
+    def connect(self, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                sock = socket.create_connection((self.host, self.port), timeout=2.0)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.settimeout(None)
+                self.sock = sock
+                threading.Thread(target=self.read_replies, args=(sock,), daemon=True).start()
+                return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def disconnect(self):
+        if self.sock:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock.close()
+            self.sock = None
+
+    def read_replies(self, sock):
+        buffer = b""
+        while True:
+            try:
+                chunk = sock.recv(65536)
+            except OSError:
+                return
+            if not chunk:
+                return
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            now = time.monotonic()
+            for line in lines:
+                try:
+                    reply = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(reply, dict) or reply.get('sent') is None:
+                    continue
+                if reply.get('event') == 'pong':
+                    self.stats.add_rtt(now - reply['sent'])
+                elif reply.get('event') == 'echo':
+                    self.stats.add_lag(now - reply['sent'])
+
+    def send_messages(self, count):
+        messages = [self.profile.sample() for _ in range(count)]
+        if messages and self.probe is not None:
+            messages[-1]['probe'] = {**self.probe, 'sent': time.monotonic()}
+            self.probe = None
+        payload = b"".join(json.dumps(message).encode('utf-8') + b"\n" for message in messages)
+        try:
+            self.sock.sendall(payload)
+            self.stats.sent += count
+        except OSError:
+            self.stats.send_errors += 1
+            self.reconnect()
+
+    def send_ping(self):
+        self.ping_seq += 1
+        message = {'event': 'ping', 'seq': self.ping_seq, 'sent': time.monotonic()}
+        # The next telemetry message is the probe of the pipeline
+        self.probe = {'seq': self.ping_seq}
+        try:
+            self.sock.sendall(json.dumps(message).encode('utf-8') + b"\n")
+        except OSError:
+            self.stats.send_errors += 1
+
+    def reconnect(self):
+        self.disconnect()
+        time.sleep(self.reconnect_delay)
+        started = time.monotonic()
+        self.connect()
+        self.stats.reconnect_times.append(time.monotonic() - started)
+
+    def run(self):
+        self.connect()
+        start = time.monotonic()
+        interval = 1.0 / self.rate
+        next_send = start
+        next_ping = start
+        next_report = start + self.report_interval
+        next_burst = start + self.burst_every if self.burst_every > 0 else math.inf
+        next_disconnect = start + self.disconnect_every if self.disconnect_every > 0 else math.inf
+
+        try:
+            while True:
+                now = time.monotonic()
+                if now - start >= self.duration:
+                    break
+
+                if now >= next_disconnect:
+                    self.reconnect()
+                    next_disconnect += self.disconnect_every
+                    now = time.monotonic()
+
+                if now >= next_burst:
+                    self.send_messages(self.burst_size)
+                    next_burst += self.burst_every
+
+                due = int((now - next_send) / interval) + 1 if now >= next_send else 0
+                if due:
+                    self.send_messages(min(due, MAX_RATE))
+                    next_send += due * interval
+
+                if now >= next_ping:
+                    self.send_ping()
+                    next_ping += self.ping_interval
+
+                if now >= next_report:
+                    self.report(self.stats.summary(now - start))
+                    next_report += self.report_interval
+
+                sleep_for = min(next_send, next_ping, next_report) - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            elapsed = time.monotonic() - start
+            # daj czas na dotarcie ostatnich odpowiedzi pong
+            time.sleep(min(1.0, self.ping_interval * 2))
+            summary = self.stats.summary(elapsed)
+            self.disconnect()
+        return summary
+
+    @staticmethod
+    def report(summary):
+        print(f"[{summary['elapsed_s']:8.1f} s] sent={summary['sent']} "
+              f"rate={summary['achieved_rate']}/s lag p50={summary['lag_p50_ms']} ms "
+              f"p95={summary['lag_p95_ms']} ms max={summary['lag_max_ms']} ms "
+              f"RTT p50={summary['rtt_p50_ms']} ms "
+              f"reconnects={summary['reconnects']}", flush=True)
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic HORUS FAS load generator")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=65432)
+    parser.add_argument('--rate', type=float, default=10.0,
+                        help=f"messages per second ({MIN_RATE}-{MAX_RATE})")
+    parser.add_argument('--duration', type=float, default=30.0, help="test length in seconds")
+    parser.add_argument('--burst-size', type=int, default=0,
+                        help="extra messages sent back-to-back in every burst")
+    parser.add_argument('--burst-every', type=float, default=0.0,
+                        help="seconds between bursts (0 disables bursts)")
+    parser.add_argument('--disconnect-every', type=float, default=0.0,
+                        help="seconds between forced reconnects (0 disables)")
+    parser.add_argument('--reconnect-delay', type=float, default=0.5)
+    parser.add_argument('--ping-interval', type=float, default=0.5)
+    parser.add_argument('--json', action='store_true', help="print the final summary as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    if not MIN_RATE <= args.rate <= MAX_RATE:
+        print(f"Rate must be between {MIN_RATE} and {MAX_RATE} msg/s", file=sys.stderr)
+        return 2
+
+    generator = FasLoadGenerator(
+        args.host, args.port, args.rate, args.duration,
+        burst_size=args.burst_size, burst_every=args.burst_every,
+        disconnect_every=args.disconnect_every, reconnect_delay=args.reconnect_delay,
+        ping_interval=args.ping_interval)
+    summary = generator.run()
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        generator.report(summary)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
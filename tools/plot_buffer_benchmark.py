@@ -0,0 +1,150 @@
+"""Microbenchmark of LivePlot sample storage.
+
+Compares the per-sample cost of the previous ``np.append`` + slice storage
+with ``RingBuffer`` and ``MinMaxPyramid`` for several history lengths
+(``MinMaxPyramid.query /10`` adds one full-range query every 10 samples).
+With ``--plot`` the full ``LivePlot.add_point`` / ``add_points`` path
+is measured as well on an offscreen Qt platform, including the frames
+the render scheduler draws while the event loop is running.
+
+Example::
+
+    python -m tools.plot_buffer_benchmark --samples 20000 --history 1000 10000 100000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from core.ring_buffer import RingBuffer
+from core.minmax_pyramid import MinMaxPyramid
+
+
+def bench_np_append(samples, history):
+    timestamps = np.array([], dtype=np.float64)
+    values = np.array([], dtype=np.float64)
+    start = time.perf_counter()
+    for i in range(samples):
+        timestamps = np.append(timestamps, float(i))
+        values = np.append(values, float(i))
+        if len(timestamps) > history:
+            timestamps = timestamps[-history:]
+            values = values[-history:]
+    return time.perf_counter() - start
+
+
+def bench_ring_buffer(samples, history):
+    timestamps = RingBuffer(history)
+    values = RingBuffer(history)
+    start = time.perf_counter()
+    for i in range(samples):
+        timestamps.append(float(i))
+        values.append(float(i))
+        timestamps.view()
+        values.view()
+    return time.perf_counter() - start
+
+
+def bench_ring_buffer_batch(samples, history, batch=100):
+    timestamps = RingBuffer(history)
+    values = RingBuffer(history)
+    data = np.arange(samples, dtype=np.float64)
+    start = time.perf_counter()
+    for first in range(0, samples, batch):
+        timestamps.extend(data[first:first + batch])
+        values.extend(data[first:first + batch])
+        timestamps.view()
+        values.view()
+    return time.perf_counter() - start
+
+
+def bench_pyramid(samples, history):
+    pyramid = MinMaxPyramid(history)
+    start = time.perf_counter()
+    for i in range(samples):
+        pyramid.append(float(i), float(i))
+    return time.perf_counter() - start
+
+
+def bench_pyramid_query(samples, history, width=1000):
+    pyramid = MinMaxPyramid(history)
+    pyramid.extend(np.arange(samples, dtype=np.float64), np.random.rand(samples))
+    start = time.perf_counter()
+    for i in range(samples // 10):
+        pyramid.query(0.0, float(samples), 2 * width)
+    return time.perf_counter() - start
+
+
+def bench_live_plot(samples, history, batch=None):
+    from PyQt6.QtWidgets import QApplication
+    from gui.live_plot import LivePlot
+
+    plot = LivePlot(30, history_length=history)
+    plot.toggle_data_markers(False)
+    data = time.time() + np.arange(samples, dtype=np.float64) * 0.01
+    start = time.perf_counter()
+    if batch:
+        for first in range(0, samples, batch):
+            plot.add_points(data[first:first + batch], data[first:first + batch])
+            QApplication.processEvents()
+    else:
+        for i, ts in enumerate(data):
+            plot.add_point(ts, ts)
+            if i % 10 == 0:
+                QApplication.processEvents()
+    return time.perf_counter() - start
+
+
+def run(samples, histories, with_plot):
+    cases = [
+        ('np.append', bench_np_append),
+        ('RingBuffer.append', bench_ring_buffer),
+        ('RingBuffer.extend x100', bench_ring_buffer_batch),
+        ('MinMaxPyramid.append', bench_pyramid),
+        ('MinMaxPyramid.query /10', bench_pyramid_query),
+    ]
+    if with_plot:
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication([])  # noqa: F841 - must outlive the plots
+        cases += [
+            ('LivePlot.add_point', bench_live_plot),
+            ('LivePlot.add_points x100', lambda n, h: bench_live_plot(n, h, batch=100)),
+        ]
+
+    results = []
+    for history in histories:
+        for name, function in cases:
+            elapsed = function(samples, history)
+            results.append({'case': name, 'history': history, 'samples': samples,
+                            'us_per_sample': elapsed / samples * 1e6})
+    return results
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="LivePlot storage microbenchmark")
+    parser.add_argument('--samples', type=int, default=20000)
+    parser.add_argument('--history', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--plot', action='store_true', help="also benchmark LivePlot with setData")
+    parser.add_argument('--json', action='store_true', help="print the results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    results = run(args.samples, args.history, args.plot)
+    if args.json:
+        print(json.dumps(results))
+        return 0
+
+    print(f"{'case':<26} {'history':>8} {'us/sample':>10}")
+    for result in results:
+        print(f"{result['case']:<26} {result['history']:>8} {result['us_per_sample']:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())